@@ -0,0 +1,20 @@
+-- Migration: Add scrape results indexes
+-- Created: 2026-10-17
+-- Purpose: Speed up per-job result listing, counting and keyword filtering
+--
+-- The results endpoints page and count scrape_results by job, optionally
+-- filtered by keyword. Without an index each request scans the whole table.
+
+-- ============================================================================
+-- FORWARD MIGRATION
+-- ============================================================================
+
+-- Index for job-scoped result pages, counts and keyword filters
+CREATE INDEX IF NOT EXISTS idx_scrape_results_job_keyword ON scrape_results(job_id, keyword_id);
+
+-- ============================================================================
+-- ROLLBACK MIGRATION
+-- ============================================================================
+
+-- To rollback this migration, run:
+-- DROP INDEX IF EXISTS idx_scrape_results_job_keyword;
@@ -3,7 +3,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel
 
 from minutes_iq.db.client_repository import ClientRepository
@@ -246,7 +246,7 @@ async def get_keywords_list_all(
     return html
 
 
-@router.get("/categories", response_class=HTMLResponse)
+@router.get("/categories", response_class=ORJSONResponse)
 async def get_categories(
     keyword_repo: Annotated[KeywordRepository, Depends(get_keyword_repository)],
 ):
@@ -266,9 +266,7 @@ async def get_categories(
     categories.sort(key=lambda x: str(x["category"]))
 
     # Return as JSON
-    from fastapi.responses import JSONResponse
-
-    return JSONResponse(content=categories)
+    return ORJSONResponse(content=categories)
 
 
 @router.get("/categories-grid", response_class=HTMLResponse)
@@ -384,7 +382,7 @@ async def get_keyword_clients(
     return html
 
 
-@router.get("/{keyword_id}/stats", response_class=HTMLResponse)
+@router.get("/{keyword_id}/stats", response_class=ORJSONResponse)
 async def get_keyword_stats(
     keyword_id: int,
     keyword_repo: Annotated[KeywordRepository, Depends(get_keyword_repository)],
@@ -407,9 +405,7 @@ async def get_keyword_stats(
         "last_found": "Never",
     }
 
-    from fastapi.responses import JSONResponse
-
-    return JSONResponse(content=stats)
+    return ORJSONResponse(content=stats)
 
 
 @router.get("/related", response_class=HTMLResponse)
@@ -302,9 +302,8 @@ async def create_job(
     client_url_repo: Annotated[ClientUrlRepository, Depends(get_client_url_repository)],
 ):
     """Create a new scrape job and start background execution."""
-    from minutes_iq.db.scraper_service import ScraperService
-    from minutes_iq.scraper.async_runner import run_scrape_job_async
-    from minutes_iq.scraper.storage import StorageManager
+    from minutes_iq.scraper.job_queue import enqueue_scrape_job
+    from minutes_iq.scraper.routes import get_storage_manager
 
     # Parse form data
     form_data = await request.form()
@@ -367,74 +366,13 @@ async def create_job(
         include_packages=include_packages,
     )
 
-    # Start background execution in a separate thread
-    # IMPORTANT: We must pass the job_id and source_urls, not the service/connection
-    # The thread will create its own database connection to avoid threading issues
-    import threading
-
-    storage = StorageManager(base_dir="data")
-
-    def run_job_in_thread():
-        """Run the job in a background thread with its own DB connection."""
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        # Connection retry wrapper - recreates connection on timeout
-        def get_fresh_service():
-            from minutes_iq.db.client import get_db_connection
-            from minutes_iq.db.scraper_repository import ScraperRepository
-
-            conn_ctx = get_db_connection()
-            conn = conn_ctx.__enter__()  # Get actual connection from context manager
-            thread_repo = ScraperRepository(conn)
-            return ScraperService(thread_repo), conn, conn_ctx
-
-        try:
-            print(f"🚀 Thread starting for job {job_id}", flush=True)
-            logger.info(f"🚀 Thread starting for job {job_id}")
-
-            # Create initial connection
-            print(f"✅ Creating DB connection for job {job_id}", flush=True)
-            thread_service, conn, conn_ctx = get_fresh_service()
-
-            print(
-                f"✅ DB connection created for job {job_id}, starting execution",
-                flush=True,
-            )
-            logger.info(
-                f"✅ DB connection created for job {job_id}, starting execution"
-            )
-
-            try:
-                # Run with connection retry support
-                run_scrape_job_async(
-                    job_id=job_id,
-                    service=thread_service,
-                    source_urls=source_urls,
-                    storage_manager=storage,
-                )
-            finally:
-                # Properly close connection context manager
-                try:
-                    conn_ctx.__exit__(None, None, None)
-                except Exception as close_error:
-                    logger.warning(f"Error closing connection: {close_error}")
-
-            print(f"✅ Job {job_id} thread completed", flush=True)
-            logger.info(f"✅ Job {job_id} thread completed")
-
-        except Exception as e:
-            print(f"❌ Fatal error in job {job_id} thread: {e}", flush=True)
-            logger.error(f"❌ Fatal error in job {job_id} thread: {e}", exc_info=True)
-            import traceback
-
-            traceback.print_exc()
-
-    print(f"🎯 Creating thread for job {job_id}", flush=True)
-    thread = threading.Thread(target=run_job_in_thread, daemon=True)
-    thread.start()
-    print(f"🎯 Thread started for job {job_id}", flush=True)
+    # Hand off to the worker pool; each job opens its own database connection
+    # so the request-scoped connection is never shared with the worker thread
+    enqueue_scrape_job(
+        job_id=job_id,
+        source_urls=source_urls,
+        storage_manager=get_storage_manager(),
+    )
 
     # Redirect to job detail page
     response = Response(status_code=200)
@@ -1,48 +1,55 @@
 # src/minutes_iq/auth/dependencies.py
 
-from collections.abc import Generator
+import time
 from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from libsql_experimental import Connection
 
 from minutes_iq.auth.service import AuthService
 from minutes_iq.config.settings import settings
 from minutes_iq.db.auth_code_repository import AuthCodeRepository
 from minutes_iq.db.auth_code_service import AuthCodeService
 from minutes_iq.db.auth_repository import AuthRepository
-from minutes_iq.db.client import get_db_connection
+from minutes_iq.db.dependencies import get_connection
 from minutes_iq.db.password_reset_repository import (
     PasswordResetRepository,
 )
 from minutes_iq.db.password_reset_service import PasswordResetService
 from minutes_iq.db.user_repository import UserRepository
 from minutes_iq.db.user_service import UserService
+from minutes_iq.ttl_cache import TTLCache
 
 
-def get_user_repository() -> Generator[UserRepository, None, None]:
+def get_user_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> UserRepository:
     """
-    Provides a UserRepository instance with proper connection lifecycle management.
-    Uses generator to ensure connection is closed after request completes.
+    Provides a UserRepository instance on the request's shared connection.
+    The connection is closed by get_connection after the request completes.
     """
-    with get_db_connection() as conn:
-        yield UserRepository(conn)
+    return UserRepository(conn)
 
 
 # OAuth2 scheme for Swagger UI - this makes the "Authorize" button appear
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
+# Successfully verified tokens (token -> user_id), so repeat requests
+# with the same token skip the signature check until it expires
+TOKEN_CACHE_SIZE = 1024
+_verified_tokens: TTLCache[str, int] = TTLCache(TOKEN_CACHE_SIZE)
 
-async def get_current_user(
+
+async def get_token_user_id(
     request: Request,
     token_from_scheme: Annotated[str | None, Depends(oauth2_scheme)],
-    # Annotated satisfies B008 by moving the function call into the type hint
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
-) -> dict[str, Any]:
+) -> int:
     """
-    Validates JWT from HttpOnly cookie OR Authorization header and retrieves user identity.
-    Supports both cookie-based auth (for browser) and Bearer token (for API/Swagger).
+    Validates JWT from HttpOnly cookie OR Authorization header and returns its user id.
+    Kept separate from get_current_user so requests without a valid token are
+    rejected before a database connection is acquired for the user lookup.
     """
     # Try to get token from Authorization header first (for Swagger UI)
     # The oauth2_scheme dependency will extract it automatically
@@ -62,6 +69,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
         user_id: str = payload.get("sub")
@@ -75,7 +86,23 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         ) from err
 
-    user = user_repo.get_user_by_id(int(user_id))
+    exp = payload.get("exp")
+    if exp is not None:
+        _verified_tokens.set(token, int(user_id), exp - time.time())
+
+    return int(user_id)
+
+
+async def get_current_user(
+    user_id: Annotated[int, Depends(get_token_user_id)],
+    # Annotated satisfies B008 by moving the function call into the type hint
+    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+) -> dict[str, Any]:
+    """
+    Retrieves the identity of the user named by the request's JWT.
+    Supports both cookie-based auth (for browser) and Bearer token (for API/Swagger).
+    """
+    user = user_repo.get_user_by_id(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
@@ -84,46 +111,44 @@ async def get_current_user(
     return user
 
 
-def get_auth_service() -> Generator[AuthService, None, None]:
+def get_auth_service(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> AuthService:
     """
-    Factory function for AuthService with proper connection lifecycle management.
-    Uses generator to ensure connection is closed after request completes.
+    Factory function for AuthService on the request's shared connection.
+    The connection is closed by get_connection after the request completes.
     """
-    with get_db_connection() as conn:
-        repo = AuthRepository(conn)
-        yield AuthService(repo)
+    return AuthService(AuthRepository(conn))
 
 
-def get_auth_code_service() -> Generator[AuthCodeService, None, None]:
+def get_auth_code_service(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> AuthCodeService:
     """
-    Factory function for AuthCodeService with proper connection lifecycle management.
-    Uses generator to ensure connection is closed after request completes.
+    Factory function for AuthCodeService on the request's shared connection.
+    The connection is closed by get_connection after the request completes.
     """
-    with get_db_connection() as conn:
-        repo = AuthCodeRepository(conn)
-        yield AuthCodeService(repo)
+    return AuthCodeService(AuthCodeRepository(conn))
 
 
-def get_user_service() -> Generator[UserService, None, None]:
+def get_user_service(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> UserService:
     """
-    Factory function for UserService with proper connection lifecycle management.
-    Uses generator to ensure connection is closed after request completes.
+    Factory function for UserService on the request's shared connection.
+    The connection is closed by get_connection after the request completes.
     """
-    with get_db_connection() as conn:
-        user_repo = UserRepository(conn)
-        auth_repo = AuthRepository(conn)
-        yield UserService(user_repo, auth_repo)
+    return UserService(UserRepository(conn), AuthRepository(conn))
 
 
-def get_password_reset_service() -> Generator[PasswordResetService, None, None]:
+def get_password_reset_service(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> PasswordResetService:
     """
-    Factory function for PasswordResetService with proper connection lifecycle management.
-    Uses generator to ensure connection is closed after request completes.
+    Factory function for PasswordResetService on the request's shared connection.
+    The connection is closed by get_connection after the request completes.
     """
-    with get_db_connection() as conn:
-        reset_repo = PasswordResetRepository(conn)
-        user_repo = UserRepository(conn)
-        yield PasswordResetService(reset_repo, user_repo)
+    return PasswordResetService(PasswordResetRepository(conn), UserRepository(conn))
 
 
 async def get_current_admin_user(
@@ -44,6 +44,7 @@ class CookieSettings(BaseModel):
 class TaskSettings(BaseModel):
     allow_background_tasks: bool = True
     workers: int = 2
+    threadpool_size: int = 100
 
 
 # ------------------------------------------------------------
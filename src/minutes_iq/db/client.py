@@ -1,6 +1,8 @@
 # src/minutes_iq/db/client.py
 """Database client module for interacting with the database."""
 
+import threading
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 
@@ -8,6 +10,15 @@ from libsql_experimental import Connection, connect
 
 from minutes_iq.config.settings import settings
 
+# Idle connections kept for reuse (db_url -> [(released_at, connection)]).
+# Remote connections can be dropped by the server, so stale ones are closed
+# instead of reused.
+POOL_MAX_IDLE = 10
+POOL_IDLE_TIMEOUT = 60.0
+
+_idle_connections: dict[str | None, list[tuple[float, Connection]]] = {}
+_pool_lock = threading.Lock()
+
 
 def get_db_client() -> Connection:
     """
@@ -21,18 +32,83 @@ def get_db_client() -> Connection:
     return conn
 
 
+def _acquire_connection() -> Connection:
+    """Take a recently used idle connection, or open a new one."""
+    now = time.monotonic()
+    stale: list[Connection] = []
+    conn = None
+
+    with _pool_lock:
+        idle = _idle_connections.get(settings.database.db_url, [])
+        while idle:
+            released_at, candidate = idle.pop()
+            if now - released_at < POOL_IDLE_TIMEOUT:
+                conn = candidate
+                break
+            stale.append(candidate)
+
+    for old in stale:
+        _close_quietly(old)
+
+    return conn if conn is not None else get_db_client()
+
+
+def _release_connection(conn: Connection) -> None:
+    """Return a connection to the idle pool, closing it if the pool is full."""
+    try:
+        # Never hand out a connection with someone else's open transaction
+        if conn.in_transaction:
+            conn.rollback()
+    except Exception:
+        _close_quietly(conn)
+        return
+
+    with _pool_lock:
+        idle = _idle_connections.setdefault(settings.database.db_url, [])
+        if len(idle) < POOL_MAX_IDLE:
+            idle.append((time.monotonic(), conn))
+            return
+
+    _close_quietly(conn)
+
+
+def _close_quietly(conn: Connection) -> None:
+    """Close a connection, ignoring errors from already-broken connections."""
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
 @contextmanager
 def get_db_connection() -> Iterator[Connection]:
     """
     Context-managed database connection.
 
-    Ensures connections are always closed.
+    Connections are reused from a small idle pool so requests do not pay
+    the connection handshake each time. Uncommitted work is rolled back
+    when the connection is returned, and a connection whose block raised
+    is closed rather than reused.
     """
-    conn = get_db_client()
+    conn = _acquire_connection()
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        _close_quietly(conn)
+        raise
+    _release_connection(conn)
+
+
+def close_idle_connections() -> None:
+    """
+    Close every pooled idle connection.
+    """
+    with _pool_lock:
+        idle = [conn for conns in _idle_connections.values() for _, conn in conns]
+        _idle_connections.clear()
+
+    for conn in idle:
+        _close_quietly(conn)
 
 
 def healthcheck() -> bool:
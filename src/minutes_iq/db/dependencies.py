@@ -10,6 +10,7 @@ from collections.abc import Generator
 from typing import Annotated
 
 from fastapi import Depends
+from libsql_experimental import Connection
 
 from minutes_iq.db.auth_code_repository import AuthCodeRepository
 from minutes_iq.db.auth_code_service import AuthCodeService
@@ -28,17 +29,34 @@ from minutes_iq.db.scraper_repository import ScraperRepository
 from minutes_iq.db.user_repository import UserRepository
 
 
-# Phase 3 & 4 Dependencies (existing)
-def get_user_repository() -> Generator[UserRepository, None, None]:
-    """Get UserRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield UserRepository(conn)
+def get_connection() -> Generator[Connection, None, None]:
+    """
+    Get the database connection for the current request.
 
+    FastAPI caches dependency results per request, so every repository and
+    service that depends on this shares one connection instead of opening
+    its own.
 
-def get_auth_code_repository() -> Generator[AuthCodeRepository, None, None]:
-    """Get AuthCodeRepository instance with database connection."""
+    Repository calls block on the database, so routes that use them should
+    be plain ``def`` (run in the threadpool), not ``async def``.
+    """
     with get_db_connection() as conn:
-        yield AuthCodeRepository(conn)
+        yield conn
+
+
+# Phase 3 & 4 Dependencies (existing)
+def get_user_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> UserRepository:
+    """Get UserRepository instance on the request's connection."""
+    return UserRepository(conn)
+
+
+def get_auth_code_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> AuthCodeRepository:
+    """Get AuthCodeRepository instance on the request's connection."""
+    return AuthCodeRepository(conn)
 
 
 def get_auth_code_service(
@@ -48,10 +66,11 @@ def get_auth_code_service(
     return AuthCodeService(auth_code_repo)
 
 
-def get_password_reset_repository() -> Generator[PasswordResetRepository, None, None]:
-    """Get PasswordResetRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield PasswordResetRepository(conn)
+def get_password_reset_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> PasswordResetRepository:
+    """Get PasswordResetRepository instance on the request's connection."""
+    return PasswordResetRepository(conn)
 
 
 def get_password_reset_service(
@@ -65,22 +84,25 @@ def get_password_reset_service(
 
 
 # Phase 5 Dependencies (new)
-def get_client_repository() -> Generator[ClientRepository, None, None]:
-    """Get ClientRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield ClientRepository(conn)
+def get_client_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> ClientRepository:
+    """Get ClientRepository instance on the request's connection."""
+    return ClientRepository(conn)
 
 
-def get_keyword_repository() -> Generator[KeywordRepository, None, None]:
-    """Get KeywordRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield KeywordRepository(conn)
+def get_keyword_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> KeywordRepository:
+    """Get KeywordRepository instance on the request's connection."""
+    return KeywordRepository(conn)
 
 
-def get_favorites_repository() -> Generator[FavoritesRepository, None, None]:
-    """Get FavoritesRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield FavoritesRepository(conn)
+def get_favorites_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> FavoritesRepository:
+    """Get FavoritesRepository instance on the request's connection."""
+    return FavoritesRepository(conn)
 
 
 def get_client_service(
@@ -98,13 +120,15 @@ def get_keyword_service(
     return KeywordService(keyword_repo)
 
 
-def get_scraper_repository() -> Generator[ScraperRepository, None, None]:
-    """Get ScraperRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield ScraperRepository(conn)
+def get_scraper_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> ScraperRepository:
+    """Get ScraperRepository instance on the request's connection."""
+    return ScraperRepository(conn)
 
 
-def get_client_url_repository() -> Generator[ClientUrlRepository, None, None]:
-    """Get ClientUrlRepository instance with database connection."""
-    with get_db_connection() as conn:
-        yield ClientUrlRepository(conn)
+def get_client_url_repository(
+    conn: Annotated[Connection, Depends(get_connection)],
+) -> ClientUrlRepository:
+    """Get ClientUrlRepository instance on the request's connection."""
+    return ClientUrlRepository(conn)
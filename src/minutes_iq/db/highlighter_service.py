@@ -123,8 +123,8 @@ class HighlighterService:
         if not annotated_pdfs:
             raise ValueError(f"No annotated PDFs found in {annotated_pdf_dir}")
 
-        # Create ZIP file
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Create ZIP file. PDFs are already compressed, so store them as-is.
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_STORED) as zf:
             for pdf_path in annotated_pdfs:
                 zf.write(pdf_path, pdf_path.name)
 
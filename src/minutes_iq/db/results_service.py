@@ -6,15 +6,46 @@ import csv
 import json
 import logging
 import zipfile
+from collections.abc import Iterator
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
 from typing import Any
 
 from minutes_iq.db.scraper_repository import ScraperRepository
+from minutes_iq.scraper.schemas import TERMINAL_STATUSES
+from minutes_iq.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Results summaries (job_id -> summary dict). Summaries of
+# active jobs are reused briefly; finished ones are kept longer.
+SUMMARY_CACHE_TTL = 5.0
+TERMINAL_SUMMARY_CACHE_TTL = 30.0
+SUMMARY_CACHE_MAX_SIZE = 10_000
+_summary_cache: TTLCache[int, dict[str, Any]] = TTLCache(SUMMARY_CACHE_MAX_SIZE)
+
+
+def invalidate_summary_cache(job_id: int) -> None:
+    """
+    Drop any cached results summary for a job.
+
+    Args:
+        job_id: The job ID
+    """
+    _summary_cache.pop(job_id)
+
+
+CSV_EXPORT_FIELDS = [
+    "result_id",
+    "pdf_filename",
+    "page_number",
+    "keyword",
+    "snippet",
+    "entities",
+    "created_at",
+]
+
 
 class ResultsService:
     """Service for processing and exporting scraper results."""
@@ -32,17 +63,18 @@ class ResultsService:
         Returns:
             Dict with summary statistics
         """
+        cached = _summary_cache.get(job_id)
+        if cached is not None:
+            return dict(cached)
+
         job = self.repository.get_job(job_id)
         if not job:
             raise ValueError(f"Job {job_id} not found")
 
-        # Get basic counts
-        result_count = self.repository.get_result_count(job_id)
+        # Totals come from the per-keyword aggregate rather than loading rows
         keyword_stats = self.repository.get_keyword_statistics(job_id)
-        results = self.repository.get_job_results(job_id)
-
-        # Count unique PDFs
-        unique_pdfs = len(set(r["pdf_filename"] for r in results))
+        result_count = sum(k["match_count"] for k in keyword_stats)
+        unique_pdfs = self.repository.get_unique_pdf_count(job_id)
 
         # Calculate execution time if completed
         execution_time = None
@@ -63,7 +95,17 @@ class ResultsService:
             "error_message": job["error_message"],
         }
 
-        return summary
+        # Results are only written while a job runs, so finished summaries
+        # can be reused for longer. Stamp the expiry after the queries so
+        # slow aggregates do not shorten the TTL.
+        ttl = (
+            TERMINAL_SUMMARY_CACHE_TTL
+            if job["status"] in TERMINAL_STATUSES
+            else SUMMARY_CACHE_TTL
+        )
+        _summary_cache.set(job_id, summary, ttl)
+
+        return dict(summary)
 
     def generate_csv_export(self, job_id: int) -> str:
         """
@@ -75,44 +117,56 @@ class ResultsService:
         Returns:
             CSV content as string
         """
-        results = self.repository.get_job_results(job_id)
+        return "".join(self.iter_csv_export(job_id))
 
-        if not results:
-            logger.warning(f"No results to export for job {job_id}")
-            return ""
+    def iter_csv_export(self, job_id: int, batch_size: int = 1000) -> Iterator[str]:
+        """
+        Generate CSV export of job results in chunks.
 
-        # Create CSV in memory
+        Results are read from the database in batches and each batch is
+        yielded as soon as it is formatted, so large exports can be streamed
+        without building the whole file in memory.
+
+        Args:
+            job_id: The job ID
+            batch_size: Number of result rows per chunk
+
+        Yields:
+            CSV text chunks; the first chunk includes the header row. Nothing
+            is yielded if the job has no results.
+        """
         output = StringIO()
-        fieldnames = [
-            "result_id",
-            "pdf_filename",
-            "page_number",
-            "keyword",
-            "snippet",
-            "entities",
-            "created_at",
-        ]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for result in results:
-            writer.writerow(
-                {
-                    "result_id": result["result_id"],
-                    "pdf_filename": result["pdf_filename"],
-                    "page_number": result["page_number"],
-                    "keyword": result["keyword"],
-                    "snippet": result["snippet"],
-                    "entities": result["entities_json"] or "",
-                    "created_at": result["created_at"],
-                }
-            )
+        writer = csv.DictWriter(output, fieldnames=CSV_EXPORT_FIELDS)
+        row_count = 0
+
+        for batch in self.repository.iter_job_results(job_id, batch_size):
+            if row_count == 0:
+                writer.writeheader()
+
+            for result in batch:
+                writer.writerow(
+                    {
+                        "result_id": result["result_id"],
+                        "pdf_filename": result["pdf_filename"],
+                        "page_number": result["page_number"],
+                        "keyword": result["keyword"],
+                        "snippet": result["snippet"],
+                        "entities": result["entities_json"] or "",
+                        "created_at": result["created_at"],
+                    }
+                )
+            row_count += len(batch)
+
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
 
-        csv_content = output.getvalue()
         output.close()
 
-        logger.info(f"Generated CSV export for job {job_id} ({len(results)} rows)")
-        return csv_content
+        if row_count:
+            logger.info(f"Generated CSV export for job {job_id} ({row_count} rows)")
+        else:
+            logger.warning(f"No results to export for job {job_id}")
 
     def generate_zip_artifact(
         self,
@@ -135,21 +189,20 @@ class ResultsService:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Get results and summary
-        results = self.repository.get_job_results(job_id)
-        summary = self.get_results_summary(job_id)
-
-        if not results:
+        # Only the distinct filenames and the summary are needed up front;
+        # result rows are streamed into the CSV entry below
+        pdf_filenames = self.repository.get_result_pdf_filenames(job_id)
+        if not pdf_filenames:
             raise ValueError(f"No results found for job {job_id}")
 
-        # Get unique PDF filenames
-        pdf_filenames = set(r["pdf_filename"] for r in results)
+        summary = self.get_results_summary(job_id)
 
         # Create ZIP file
         with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            # Add CSV export
-            csv_content = self.generate_csv_export(job_id)
-            zf.writestr("results.csv", csv_content)
+            # Add CSV export, written batch by batch
+            with zf.open("results.csv", "w") as csv_entry:
+                for chunk in self.iter_csv_export(job_id):
+                    csv_entry.write(chunk.encode("utf-8"))
 
             # Add metadata JSON
             metadata = {
@@ -159,19 +212,22 @@ class ResultsService:
             }
             zf.writestr("metadata.json", json.dumps(metadata, indent=2))
 
-            # Add PDFs
+            # Add PDFs. They are already compressed, so store them as-is
+            # rather than spending CPU deflating them again.
             pdfs_added = 0
             for filename in pdf_filenames:
                 pdf_path = pdf_dir / filename
                 if pdf_path.exists():
-                    zf.write(pdf_path, f"pdfs/{filename}")
+                    zf.write(
+                        pdf_path, f"pdfs/{filename}", compress_type=zipfile.ZIP_STORED
+                    )
                     pdfs_added += 1
                 else:
                     logger.warning(f"PDF not found: {pdf_path}")
 
             logger.info(
                 f"Created ZIP artifact for job {job_id}: {output_path} "
-                f"({pdfs_added} PDFs, {len(results)} results)"
+                f"({pdfs_added} PDFs, {summary['total_matches']} results)"
             )
 
         return output_path
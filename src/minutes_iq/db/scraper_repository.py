@@ -4,6 +4,7 @@ Repository layer for scraper job database operations.
 
 import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -11,6 +12,91 @@ from libsql_experimental import Connection
 
 logger = logging.getLogger(__name__)
 
+_JOB_COLUMNS = """job_id, client_url_id, status, created_by,
+           created_at, started_at, completed_at, error_message"""
+
+GET_JOB_SQL = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM scrape_jobs
+    WHERE job_id = ?
+"""
+
+GET_JOB_FOR_USER_SQL = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM scrape_jobs
+    WHERE job_id = ? AND created_by = ?
+"""
+
+GET_JOB_CONFIG_SQL = """
+    SELECT config_id, job_id, date_range_start, date_range_end,
+           max_scan_pages, include_minutes, include_packages
+    FROM scrape_job_config
+    WHERE job_id = ?
+"""
+
+COUNT_JOB_RESULTS_SQL = "SELECT COUNT(*) FROM scrape_results WHERE job_id = ?"
+
+# Job listings share one select list and FROM clause; filters, ordering
+# and paging are appended by the caller
+_LIST_JOBS_COLUMNS = """j.job_id, j.client_url_id, cu.client_id, c.name as client_name,
+           cu.alias as url_alias, cu.url,
+           j.status, j.created_by, j.created_at,
+           j.started_at, j.completed_at, j.error_message"""
+
+_LIST_JOBS_FROM = """
+    FROM scrape_jobs j
+    JOIN client_urls cu ON j.client_url_id = cu.id
+    JOIN client c ON cu.client_id = c.client_id
+    WHERE 1=1
+"""
+
+LIST_JOBS_SQL = f"SELECT {_LIST_JOBS_COLUMNS}{_LIST_JOBS_FROM}"
+
+# LIST_JOBS_SQL plus the total number of matching rows on every row
+LIST_JOBS_PAGE_SQL = (
+    f"SELECT {_LIST_JOBS_COLUMNS},\n           COUNT(*) OVER () AS total_count"
+    f"{_LIST_JOBS_FROM}"
+)
+
+COUNT_JOBS_SQL = f"SELECT COUNT(*){_LIST_JOBS_FROM}"
+
+_RESULT_COLUMNS = """r.result_id, r.job_id, r.pdf_filename, r.page_number,
+           r.keyword_id, k.keyword, r.snippet, r.entities_json, r.created_at"""
+
+GET_JOB_RESULTS_SQL = f"""
+    SELECT {_RESULT_COLUMNS}
+    FROM scrape_results r
+    JOIN keywords k ON r.keyword_id = k.keyword_id
+    WHERE r.job_id = ?
+    ORDER BY r.created_at DESC
+"""
+
+# Paged variant of GET_JOB_RESULTS_SQL; result_id breaks created_at ties so
+# pages do not overlap. The keyword filter is skipped when it is NULL.
+GET_JOB_RESULTS_PAGE_SQL = f"""
+    SELECT {_RESULT_COLUMNS}
+    FROM scrape_results r
+    JOIN keywords k ON r.keyword_id = k.keyword_id
+    WHERE r.job_id = ? AND (? IS NULL OR r.keyword_id = ?)
+    ORDER BY r.created_at DESC, r.result_id DESC
+    LIMIT ? OFFSET ?
+"""
+
+COUNT_JOB_RESULTS_BY_KEYWORD_SQL = """
+    SELECT COUNT(*) FROM scrape_results
+    WHERE job_id = ? AND (? IS NULL OR keyword_id = ?)
+"""
+
+
+def _invalidate_job_caches(job_id: int) -> None:
+    """Drop a job's cached status and results summary after it changes."""
+    # Imported here because both services import this module
+    from minutes_iq.db.results_service import invalidate_summary_cache
+    from minutes_iq.db.scraper_service import invalidate_status_cache
+
+    invalidate_status_cache(job_id)
+    invalidate_summary_cache(job_id)
+
 
 class ScraperRepository:
     """Repository for scraper job data access."""
@@ -103,6 +189,9 @@ class ScraperRepository:
         """
         Update the status of a scrape job.
 
+        The job's cached status and results summary are dropped, so pollers
+        see the change on their next request.
+
         Args:
             job_id: The job ID
             status: The new status (pending, running, completed, failed, cancelled)
@@ -139,6 +228,81 @@ class ScraperRepository:
             )
 
         self.conn.commit()
+        _invalidate_job_caches(job_id)
+
+    def claim_job(self, job_id: int) -> bool:
+        """
+        Atomically move a pending job to running.
+
+        The state check and the update happen in one statement, so a job that
+        was cancelled while it waited in the queue is never started.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            True if the job was pending and is now running, False otherwise
+        """
+        cursor = self.conn.execute(
+            """
+            UPDATE scrape_jobs
+            SET status = 'running', started_at = ?
+            WHERE job_id = ? AND status = 'pending'
+            RETURNING job_id
+            """,
+            (int(datetime.now().timestamp()), job_id),
+        )
+        row = cursor.fetchone()
+        cursor.close()
+        self.conn.commit()
+        if row is None:
+            return False
+
+        _invalidate_job_caches(job_id)
+        return True
+
+    def try_cancel(self, job_id: int, user_id: int | None = None) -> str | None:
+        """
+        Atomically cancel a job if it is still pending or running.
+
+        Pending jobs are marked cancelled immediately. Running jobs keep their
+        status so the worker can stop and record the cancellation itself.
+        The state check and the update happen in one statement, so a job
+        cannot change state between them.
+
+        Args:
+            job_id: The job ID
+            user_id: If given, only cancel the job when this user created it
+
+        Returns:
+            The job's status after the update ("cancelled" or "running"),
+            or None if no cancellable job matched
+        """
+        query = """
+            UPDATE scrape_jobs
+            SET status = CASE WHEN status = 'pending' THEN 'cancelled' ELSE status END,
+                completed_at = CASE
+                    WHEN status = 'pending' THEN ? ELSE completed_at
+                END
+            WHERE job_id = ? AND status IN ('pending', 'running')
+        """
+        params: list[Any] = [int(datetime.now().timestamp()), job_id]
+
+        if user_id is not None:
+            query += " AND created_by = ?"
+            params.append(user_id)
+
+        query += " RETURNING status"
+
+        cursor = self.conn.execute(query, tuple(params))
+        row = cursor.fetchone()
+        cursor.close()
+        self.conn.commit()
+        if row is None:
+            return None
+
+        _invalidate_job_caches(job_id)
+        return row[0]
 
     def save_result(
         self,
@@ -194,6 +358,55 @@ class ScraperRepository:
         cursor.close()
         return result[0] if result else 0
 
+    def save_results(self, job_id: int, results: list[dict[str, Any]]) -> int:
+        """
+        Save a batch of scrape results in a single executemany call.
+
+        Args:
+            job_id: The job ID
+            results: Result dicts with pdf_filename, page_number, keyword_id,
+                snippet and optional entities
+
+        Returns:
+            Number of results saved
+        """
+        if not results:
+            return 0
+
+        created_at = int(datetime.now().timestamp())
+        rows = []
+        for result in results:
+            entities = result.get("entities")
+            entities_json = None
+            if entities:
+                if isinstance(entities, dict):
+                    entities_json = json.dumps(entities)
+                else:
+                    entities_json = str(entities)
+            rows.append(
+                (
+                    job_id,
+                    result["pdf_filename"],
+                    result["page_number"],
+                    result["keyword_id"],
+                    result["snippet"],
+                    entities_json,
+                    created_at,
+                )
+            )
+
+        self.conn.executemany(
+            """
+            INSERT INTO scrape_results (
+                job_id, pdf_filename, page_number,
+                keyword_id, snippet, entities_json, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        return len(rows)
+
     def get_job(self, job_id: int) -> dict[str, Any] | None:
         """
         Get a scrape job by ID.
@@ -204,14 +417,87 @@ class ScraperRepository:
         Returns:
             Dict with job details or None if not found
         """
+        cursor = self.conn.execute(GET_JOB_SQL, (job_id,))
+        row = cursor.fetchone()
+        cursor.close()
+
+        return self._job_by_id_row_to_dict(row) if row else None
+
+    def get_job_for_user(self, job_id: int, user_id: int) -> dict[str, Any] | None:
+        """
+        Get a scrape job by ID only if the given user created it.
+
+        Ownership is part of the WHERE clause, so jobs belonging to other
+        users are indistinguishable from missing ones.
+
+        Args:
+            job_id: The job ID
+            user_id: The user who must own the job
+
+        Returns:
+            Dict with job details or None if not found or not owned
+        """
+        cursor = self.conn.execute(GET_JOB_FOR_USER_SQL, (job_id, user_id))
+        row = cursor.fetchone()
+        cursor.close()
+
+        return self._job_by_id_row_to_dict(row) if row else None
+
+    @staticmethod
+    def _job_by_id_row_to_dict(row: Any) -> dict[str, Any]:
+        """Convert a GET_JOB_SQL row to a dict."""
+        return {
+            "job_id": row[0],
+            "client_url_id": row[1],
+            "status": row[2],
+            "created_by": row[3],
+            "created_at": row[4],
+            "started_at": row[5],
+            "completed_at": row[6],
+            "error_message": row[7],
+        }
+
+    def get_job_details(self, job_id: int, user_id: int) -> dict[str, Any] | None:
+        """
+        Get a scrape job with its client, configuration, and result statistics.
+
+        Everything the job detail view needs is fetched in a single query
+        rather than separate job, config, and summary lookups. Ownership is
+        part of the WHERE clause, as in get_job_for_user.
+
+        Args:
+            job_id: The job ID
+            user_id: The user who must own the job
+
+        Returns:
+            Dict with job details, a nested "config" dict (None if the job has
+            no configuration) and a nested "statistics" dict, or None if the
+            job does not exist or is not owned
+        """
         cursor = self.conn.execute(
             """
-            SELECT job_id, client_url_id, status, created_by,
-                   created_at, started_at, completed_at, error_message
-            FROM scrape_jobs
-            WHERE job_id = ?
+            SELECT j.job_id, cu.client_id, j.status, j.created_by,
+                   j.created_at, j.started_at, j.completed_at, j.error_message,
+                   c.config_id, c.date_range_start, c.date_range_end,
+                   c.max_scan_pages, c.include_minutes, c.include_packages,
+                   COALESCE(r.total_matches, 0),
+                   COALESCE(r.unique_pdfs, 0),
+                   COALESCE(r.unique_keywords, 0)
+            FROM scrape_jobs j
+            LEFT JOIN client_urls cu ON j.client_url_id = cu.id
+            LEFT JOIN scrape_job_config c ON c.job_id = j.job_id
+            LEFT JOIN (
+                SELECT job_id,
+                       COUNT(*) AS total_matches,
+                       COUNT(DISTINCT pdf_filename) AS unique_pdfs,
+                       COUNT(DISTINCT keyword_id) AS unique_keywords
+                FROM scrape_results
+                WHERE job_id = ?
+                GROUP BY job_id
+            ) r ON r.job_id = j.job_id
+            WHERE j.job_id = ? AND j.created_by = ?
             """,
-            (job_id,),
+            (job_id, job_id, user_id),
         )
         row = cursor.fetchone()
         cursor.close()
@@ -219,39 +505,104 @@ class ScraperRepository:
         if not row:
             return None
 
+        started_at, completed_at = row[5], row[6]
+        config = None
+        if row[8] is not None:
+            config = {
+                "config_id": row[8],
+                "job_id": row[0],
+                "date_range_start": row[9],
+                "date_range_end": row[10],
+                "max_scan_pages": row[11],
+                "include_minutes": bool(row[12]),
+                "include_packages": bool(row[13]),
+            }
+
         return {
             "job_id": row[0],
-            "client_url_id": row[1],
+            "client_id": row[1],
             "status": row[2],
             "created_by": row[3],
             "created_at": row[4],
-            "started_at": row[5],
-            "completed_at": row[6],
+            "started_at": started_at,
+            "completed_at": completed_at,
             "error_message": row[7],
+            "config": config,
+            "statistics": {
+                "total_matches": row[14],
+                "unique_pdfs": row[15],
+                "unique_keywords": row[16],
+                "execution_time_seconds": (
+                    completed_at - started_at if started_at and completed_at else None
+                ),
+            },
         }
 
-    def get_job_config(self, job_id: int) -> dict[str, Any] | None:
+    def get_job_with_config_and_client(self, job_id: int) -> dict[str, Any] | None:
         """
-        Get configuration for a scrape job.
+        Get a scrape job with its configuration and client in one query.
 
         Args:
             job_id: The job ID
 
         Returns:
-            Dict with config details or None if not found
+            Dict with job details plus client_id and client_name (None if the
+            job's client URL or client is gone) and a nested "config" dict
+            (None if the job has no configuration), or None if the job does
+            not exist
         """
         cursor = self.conn.execute(
             """
-            SELECT config_id, job_id, date_range_start, date_range_end,
-                   max_scan_pages, include_minutes, include_packages
-            FROM scrape_job_config
-            WHERE job_id = ?
+            SELECT j.job_id, j.client_url_id, j.status, j.created_by,
+                   j.created_at, j.started_at, j.completed_at, j.error_message,
+                   cu.client_id, cl.name,
+                   c.config_id, c.date_range_start, c.date_range_end,
+                   c.max_scan_pages, c.include_minutes, c.include_packages
+            FROM scrape_jobs j
+            LEFT JOIN client_urls cu ON j.client_url_id = cu.id
+            LEFT JOIN client cl ON cl.client_id = cu.client_id
+            LEFT JOIN scrape_job_config c ON c.job_id = j.job_id
+            WHERE j.job_id = ?
             """,
             (job_id,),
         )
         row = cursor.fetchone()
         cursor.close()
 
+        if not row:
+            return None
+
+        job = self._job_by_id_row_to_dict(row)
+        job["client_id"] = row[8]
+        job["client_name"] = row[9]
+        job["config"] = None
+        if row[10] is not None:
+            job["config"] = {
+                "config_id": row[10],
+                "job_id": row[0],
+                "date_range_start": row[11],
+                "date_range_end": row[12],
+                "max_scan_pages": row[13],
+                "include_minutes": bool(row[14]),
+                "include_packages": bool(row[15]),
+            }
+
+        return job
+
+    def get_job_config(self, job_id: int) -> dict[str, Any] | None:
+        """
+        Get configuration for a scrape job.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            Dict with config details or None if not found
+        """
+        cursor = self.conn.execute(GET_JOB_CONFIG_SQL, (job_id,))
+        row = cursor.fetchone()
+        cursor.close()
+
         if not row:
             return None
 
@@ -272,40 +623,100 @@ class ScraperRepository:
         Args:
             job_id: The job ID
 
+        Returns:
+            List of result dicts
+        """
+        cursor = self.conn.execute(GET_JOB_RESULTS_SQL, (job_id,))
+        rows = cursor.fetchall()
+        cursor.close()
+
+        return [self._result_row_to_dict(row) for row in rows]
+
+    def get_job_results_page(
+        self,
+        job_id: int,
+        keyword_id: int | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Get one page of results for a scrape job.
+
+        Args:
+            job_id: The job ID
+            keyword_id: Only return results for this keyword, if given
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
         Returns:
             List of result dicts
         """
         cursor = self.conn.execute(
-            """
-            SELECT r.result_id, r.job_id, r.pdf_filename, r.page_number,
-                   r.keyword_id, k.keyword, r.snippet, r.entities_json, r.created_at
-            FROM scrape_results r
-            JOIN keywords k ON r.keyword_id = k.keyword_id
-            WHERE r.job_id = ?
-            ORDER BY r.created_at DESC
-            """,
-            (job_id,),
+            GET_JOB_RESULTS_PAGE_SQL, (job_id, keyword_id, keyword_id, limit, offset)
         )
         rows = cursor.fetchall()
         cursor.close()
 
-        results = []
-        for row in rows:
-            results.append(
-                {
-                    "result_id": row[0],
-                    "job_id": row[1],
-                    "pdf_filename": row[2],
-                    "page_number": row[3],
-                    "keyword_id": row[4],
-                    "keyword": row[5],
-                    "snippet": row[6],
-                    "entities_json": row[7],
-                    "created_at": row[8],
-                }
-            )
+        return [self._result_row_to_dict(row) for row in rows]
 
-        return results
+    def count_job_results(self, job_id: int, keyword_id: int | None = None) -> int:
+        """
+        Count the results for a scrape job.
+
+        Args:
+            job_id: The job ID
+            keyword_id: Only count results for this keyword, if given
+
+        Returns:
+            Number of matching results
+        """
+        cursor = self.conn.execute(
+            COUNT_JOB_RESULTS_BY_KEYWORD_SQL, (job_id, keyword_id, keyword_id)
+        )
+        result = cursor.fetchone()
+        cursor.close()
+        return result[0] if result else 0
+
+    def iter_job_results(
+        self, job_id: int, batch_size: int = 1000
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the results for a scrape job in batches.
+
+        Rows are pulled from the cursor with fetchmany, so only one batch is
+        held in memory at a time.
+
+        Args:
+            job_id: The job ID
+            batch_size: Number of rows to fetch per batch
+
+        Yields:
+            Lists of result dicts, in the same order as get_job_results
+        """
+        cursor = self.conn.execute(GET_JOB_RESULTS_SQL, (job_id,))
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [self._result_row_to_dict(row) for row in rows]
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _result_row_to_dict(row: Any) -> dict[str, Any]:
+        """Convert a scrape_results row (joined with keywords) to a dict."""
+        return {
+            "result_id": row[0],
+            "job_id": row[1],
+            "pdf_filename": row[2],
+            "page_number": row[3],
+            "keyword_id": row[4],
+            "keyword": row[5],
+            "snippet": row[6],
+            "entities_json": row[7],
+            "created_at": row[8],
+        }
 
     def get_client_keywords(self, client_id: int) -> list[dict[str, Any]]:
         """
@@ -353,16 +764,111 @@ class ScraperRepository:
         Returns:
             List of job dicts
         """
-        query = """
-            SELECT j.job_id, j.client_url_id, cu.client_id, c.name as client_name,
-                   cu.alias as url_alias, cu.url,
-                   j.status, j.created_by, j.created_at,
-                   j.started_at, j.completed_at, j.error_message
-            FROM scrape_jobs j
-            JOIN client_urls cu ON j.client_url_id = cu.id
-            JOIN client c ON cu.client_id = c.client_id
-            WHERE 1=1
+        query = LIST_JOBS_SQL
+        filters, params = self._job_filters(user_id, client_id, status)
+        query += filters
+        query += " ORDER BY j.created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        cursor = self.conn.execute(query, tuple(params))
+        rows = cursor.fetchall()
+        cursor.close()
+
+        return [self._job_row_to_dict(row) for row in rows]
+
+    def list_jobs_page(
+        self,
+        user_id: int | None = None,
+        client_id: int | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        List one page of scrape jobs together with the total match count.
+
+        The total comes from a COUNT(*) OVER () window on the same query, so
+        a page and its total cost one round-trip. Only a page past the end
+        needs a separate count.
+
+        Args:
+            user_id: Filter by user who created the job
+            client_id: Filter by client
+            status: Filter by job status
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+
+        Returns:
+            Tuple of (list of job dicts, total jobs matching the filters)
+        """
+        query = LIST_JOBS_PAGE_SQL
+        filters, params = self._job_filters(user_id, client_id, status)
+        query += filters
+        query += " ORDER BY j.created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        cursor = self.conn.execute(query, tuple(params))
+        rows = cursor.fetchall()
+        cursor.close()
+
+        if rows:
+            return [self._job_row_to_dict(row) for row in rows], rows[0][12]
+        if offset == 0:
+            return [], 0
+        return [], self.count_jobs(user_id, client_id, status)
+
+    @staticmethod
+    def _job_row_to_dict(row: Any) -> dict[str, Any]:
+        """Convert a LIST_JOBS_SQL row to a dict."""
+        return {
+            "job_id": row[0],
+            "client_url_id": row[1],
+            "client_id": row[2],
+            "client_name": row[3],
+            "url_alias": row[4],
+            "url": row[5],
+            "status": row[6],
+            "created_by": row[7],
+            "created_at": row[8],
+            "started_at": row[9],
+            "completed_at": row[10],
+            "error_message": row[11],
+        }
+
+    def count_jobs(
+        self,
+        user_id: int | None = None,
+        client_id: int | None = None,
+        status: str | None = None,
+    ) -> int:
+        """
+        Count scrape jobs matching the same filters as list_jobs.
+
+        Args:
+            user_id: Filter by user who created the job
+            client_id: Filter by client
+            status: Filter by job status
+
+        Returns:
+            Total number of matching jobs
         """
+        query = COUNT_JOBS_SQL
+        filters, params = self._job_filters(user_id, client_id, status)
+        query += filters
+
+        cursor = self.conn.execute(query, tuple(params))
+        result = cursor.fetchone()
+        cursor.close()
+        return result[0] if result else 0
+
+    @staticmethod
+    def _job_filters(
+        user_id: int | None,
+        client_id: int | None,
+        status: str | None,
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause shared by list_jobs and count_jobs."""
+        query = ""
         params: list[Any] = []
 
         if user_id is not None:
@@ -377,33 +883,7 @@ class ScraperRepository:
             query += " AND j.status = ?"
             params.append(status)
 
-        query += " ORDER BY j.created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        cursor = self.conn.execute(query, tuple(params))
-        rows = cursor.fetchall()
-        cursor.close()
-
-        jobs = []
-        for row in rows:
-            jobs.append(
-                {
-                    "job_id": row[0],
-                    "client_url_id": row[1],
-                    "client_id": row[2],
-                    "client_name": row[3],
-                    "url_alias": row[4],
-                    "url": row[5],
-                    "status": row[6],
-                    "created_by": row[7],
-                    "created_at": row[8],
-                    "started_at": row[9],
-                    "completed_at": row[10],
-                    "error_message": row[11],
-                }
-            )
-
-        return jobs
+        return query, params
 
     def add_error_message(self, job_id: int, error_message: str) -> None:
         """
@@ -422,6 +902,7 @@ class ScraperRepository:
             (error_message, job_id),
         )
         self.conn.commit()
+        _invalidate_job_caches(job_id)
 
     def get_job_statistics(self) -> dict[str, int]:
         """
@@ -466,9 +947,62 @@ class ScraperRepository:
         Returns:
             Number of matches found
         """
+        cursor = self.conn.execute(COUNT_JOB_RESULTS_SQL, (job_id,))
+        result = cursor.fetchone()
+        cursor.close()
+        return result[0] if result else 0
+
+    def get_job_statuses(self, job_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get status and match counts for several jobs in one query.
+
+        Args:
+            job_ids: The job IDs to look up
+
+        Returns:
+            Dict mapping job_id to a dict with status, created_by,
+            error_message and matches_found. Missing jobs are omitted.
+        """
+        if not job_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in job_ids)
+        cursor = self.conn.execute(
+            f"""
+            SELECT j.job_id, j.status, j.created_by, j.error_message,
+                   (SELECT COUNT(*) FROM scrape_results r WHERE r.job_id = j.job_id)
+            FROM scrape_jobs j
+            WHERE j.job_id IN ({placeholders})
+            """,
+            tuple(job_ids),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+
+        return {
+            row[0]: {
+                "job_id": row[0],
+                "status": row[1],
+                "created_by": row[2],
+                "error_message": row[3],
+                "matches_found": row[4],
+            }
+            for row in rows
+        }
+
+    def get_unique_pdf_count(self, job_id: int) -> int:
+        """
+        Get the number of distinct PDFs with matches for a job.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            Number of distinct PDF filenames in the job's results
+        """
         cursor = self.conn.execute(
             """
-            SELECT COUNT(*) FROM scrape_results WHERE job_id = ?
+            SELECT COUNT(DISTINCT pdf_filename) FROM scrape_results WHERE job_id = ?
             """,
             (job_id,),
         )
@@ -476,6 +1010,28 @@ class ScraperRepository:
         cursor.close()
         return result[0] if result else 0
 
+    def get_result_pdf_filenames(self, job_id: int) -> list[str]:
+        """
+        Get the distinct PDF filenames with matches for a job.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            Sorted list of PDF filenames in the job's results
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT DISTINCT pdf_filename FROM scrape_results
+            WHERE job_id = ?
+            ORDER BY pdf_filename
+            """,
+            (job_id,),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        return [row[0] for row in rows]
+
     def get_keyword_statistics(self, job_id: int) -> list[dict[str, Any]]:
         """
         Get aggregated match counts by keyword for a job.
@@ -4,6 +4,7 @@ Integrates core scraper functions with database operations.
 """
 
 import logging
+import threading
 from typing import Any
 
 from minutes_iq.db.scraper_repository import ScraperRepository
@@ -12,9 +13,49 @@ from minutes_iq.scraper.core import (
     stream_and_scan_pdf,
 )
 from minutes_iq.scraper.highlighter import highlight_job_results
+from minutes_iq.scraper.schemas import TERMINAL_STATUSES
+from minutes_iq.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for status polling (job_id -> status dict).
+# Terminal jobs never change, so they are kept longer.
+STATUS_CACHE_TTL = 1.0
+TERMINAL_STATUS_CACHE_TTL = 30.0
+STATUS_CACHE_MAX_SIZE = 10_000
+
+# Cache misses that arrive while a status query is running are answered
+# together by the next query. Waiters give up on a stuck batch after this
+# many seconds and query on their own.
+STATUS_BATCH_TIMEOUT = 5.0
+
+_status_cache: TTLCache[int, dict[str, Any]] = TTLCache(STATUS_CACHE_MAX_SIZE)
+_status_batch_lock = threading.Lock()
+_status_query_lock = threading.Lock()
+
+
+class _StatusBatch:
+    """Job IDs waiting on the same batched status query."""
+
+    def __init__(self) -> None:
+        self.job_ids: set[int] = set()
+        self.results: dict[int, dict[str, Any]] = {}
+        self.error: Exception | None = None
+        self.done = threading.Event()
+
+
+_pending_status_batch: _StatusBatch | None = None
+
+
+def invalidate_status_cache(job_id: int) -> None:
+    """
+    Drop any cached status for a job.
+
+    Args:
+        job_id: The job ID
+    """
+    _status_cache.pop(job_id)
+
 
 class ScraperService:
     """Service for orchestrating scraper jobs."""
@@ -24,7 +65,7 @@ class ScraperService:
 
     def create_scrape_job(
         self,
-        client_id: int,
+        client_url_id: int,
         created_by: int,
         date_range_start: str | None = None,
         date_range_end: str | None = None,
@@ -36,7 +77,7 @@ class ScraperService:
         Create a new scrape job with configuration.
 
         Args:
-            client_id: The client ID to scrape for
+            client_url_id: The client URL ID to scrape
             created_by: The user ID who created the job
             date_range_start: Start date in YYYY-MM format
             date_range_end: End date in YYYY-MM format
@@ -49,7 +90,7 @@ class ScraperService:
         """
         # Create job
         job_id = self.repository.create_job(
-            client_url_id=client_id,
+            client_url_id=client_url_id,
             created_by=created_by,
             status="pending",
         )
@@ -65,7 +106,7 @@ class ScraperService:
         )
 
         self.repository.conn.commit()
-        logger.info(f"Created scrape job {job_id} for client {client_id}")
+        logger.info(f"Created scrape job {job_id} for client URL {client_url_id}")
         return job_id
 
     def execute_scrape_job(
@@ -250,6 +291,87 @@ class ScraperService:
             "matches_found": len(results),
         }
 
+    def get_cached_status(
+        self, job_id: int, user_id: int | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Get a job's status and match count, cached briefly for polling clients.
+
+        A cache miss is queried right away. Misses that arrive while that
+        query is running, for the same or different jobs, are answered by
+        one batched query once it finishes; later polls within the TTL are
+        answered from memory. Entries are shared by job, so ownership is
+        checked against the cached created_by.
+
+        Args:
+            job_id: The job ID
+            user_id: If given, the user who must own the job
+
+        Returns:
+            Dict with job_id, status, created_by, error_message and
+            matches_found, or None if the job does not exist or is not owned
+        """
+        job_status = self._get_status(job_id)
+        if job_status is None or (
+            user_id is not None and job_status["created_by"] != user_id
+        ):
+            return None
+        return job_status
+
+    def _get_status(self, job_id: int) -> dict[str, Any] | None:
+        """Look a job's status up in the cache or the next batched query."""
+        global _pending_status_batch
+
+        cached = _status_cache.get(job_id)
+        if cached is not None:
+            return cached
+
+        # Join the open batch, or open one and lead it
+        with _status_batch_lock:
+            batch = _pending_status_batch
+            is_leader = batch is None
+            if batch is None:
+                batch = _pending_status_batch = _StatusBatch()
+            batch.job_ids.add(job_id)
+
+        if is_leader:
+            # Wait for any query in flight; misses arriving meanwhile join
+            # this batch
+            acquired = _status_query_lock.acquire(timeout=STATUS_BATCH_TIMEOUT)
+            try:
+                with _status_batch_lock:
+                    _pending_status_batch = None
+
+                batch.results = self.repository.get_job_statuses(sorted(batch.job_ids))
+                self._cache_statuses(batch.results)
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+                if acquired:
+                    _status_query_lock.release()
+        elif not batch.done.wait(STATUS_BATCH_TIMEOUT):
+            # The batch is stuck; answer this poll directly
+            statuses = self.repository.get_job_statuses([job_id])
+            self._cache_statuses(statuses)
+            return statuses.get(job_id)
+
+        if batch.error is not None:
+            raise batch.error
+
+        return batch.results.get(job_id)
+
+    @staticmethod
+    def _cache_statuses(statuses: dict[int, dict[str, Any]]) -> None:
+        """Store freshly fetched job statuses in the polling cache."""
+        for job_id, job_status in statuses.items():
+            ttl = (
+                TERMINAL_STATUS_CACHE_TTL
+                if job_status["status"] in TERMINAL_STATUSES
+                else STATUS_CACHE_TTL
+            )
+            _status_cache.set(job_id, job_status, ttl)
+
     def get_job_results(self, job_id: int) -> list[dict[str, Any]]:
         """
         Get all results for a scrape job.
@@ -0,0 +1,105 @@
+"""HTTP caching helpers (ETag / Cache-Control) for GET endpoints."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+from minutes_iq.scraper.schemas import TERMINAL_STATUSES
+
+TERMINAL_CACHE_CONTROL = "private, max-age=3600"
+ACTIVE_CACHE_CONTROL = "private, max-age=1, stale-while-revalidate=5"
+# Rendered pages may be stored but must be revalidated on every use
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+# Pages that can no longer change (e.g. finished jobs) may be reused briefly
+DETAIL_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=120"
+# Edit forms must always show the current values
+NO_STORE_CACHE_CONTROL = "no-store"
+
+
+def content_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from everything a response is rendered from.
+
+    Args:
+        *parts: Values whose repr fully determines the response body
+
+    Returns:
+        The ETag value
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match covers the given ETag.
+
+    Args:
+        request: The incoming request
+        etag: The current ETag of the resource
+
+    Returns:
+        True if the client already has this representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def job_etag(job: dict[str, Any]) -> str | None:
+    """
+    Build a weak ETag for responses derived from a job.
+
+    Only terminal jobs get an ETag: while a job is running its results keep
+    changing without the job row itself changing.
+
+    Args:
+        job: Job dict with job_id, status and completed_at
+
+    Returns:
+        The ETag value, or None if the job is still active
+    """
+    if job["status"] not in TERMINAL_STATUSES:
+        return None
+    return f'W/"job-{job["job_id"]}-{job["status"]}-{job["completed_at"]}"'
+
+
+def job_cache_headers(job: dict[str, Any]) -> dict[str, str]:
+    """
+    Get the caching headers for a response derived from a job.
+
+    Args:
+        job: Job dict with job_id, status and completed_at
+
+    Returns:
+        Dict of headers to add to the response
+    """
+    etag = job_etag(job)
+    if etag is None:
+        return {"Cache-Control": ACTIVE_CACHE_CONTROL}
+    return {"Cache-Control": TERMINAL_CACHE_CONTROL, "ETag": etag}
+
+
+def not_modified_response(request: Request, job: dict[str, Any]) -> Response | None:
+    """
+    Return a 304 response if the client already has the current representation.
+
+    Args:
+        request: The incoming request
+        job: Job dict with job_id, status and completed_at
+
+    Returns:
+        A 304 Response when If-None-Match matches the job's ETag, else None
+    """
+    etag = job_etag(job)
+    if etag is None:
+        return None
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=job_cache_headers(job))
+
+    return None
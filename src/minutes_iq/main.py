@@ -1,11 +1,15 @@
 """Main module for the JEA Meeting Web Scraper."""
 
+import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated
 
+import anyio.to_thread
 import uvicorn
 from fastapi import Depends, FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -23,6 +27,8 @@ from minutes_iq.api import profile_ui as profile_ui_api
 from minutes_iq.api import scraper_jobs_ui as scraper_jobs_ui_api
 from minutes_iq.auth import routes as auth_routes
 from minutes_iq.auth.dependencies import get_current_user
+from minutes_iq.config.settings import settings
+from minutes_iq.db.client import close_idle_connections, healthcheck
 from minutes_iq.error_handlers import (
     forbidden_handler,
     internal_server_error_handler,
@@ -30,6 +36,7 @@ from minutes_iq.error_handlers import (
     unauthorized_handler,
 )
 from minutes_iq.scraper import routes as scraper_routes
+from minutes_iq.scraper.job_queue import shutdown_job_queue
 from minutes_iq.templates_config import templates
 from minutes_iq.ui import admin_routes as admin_ui_routes
 from minutes_iq.ui import client_routes as client_ui_routes
@@ -37,7 +44,29 @@ from minutes_iq.ui import keyword_routes as keyword_ui_routes
 from minutes_iq.ui import profile_routes as profile_ui_routes
 from minutes_iq.ui import scraper_job_routes as scraper_job_ui_routes
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    # Sync routes run on AnyIO's shared thread limiter (40 by default); every
+    # status poll holds a thread for its database round-trip, so size it to
+    # the expected polling concurrency
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.tasks.threadpool_size
+
+    # Open a connection up front and leave it in the pool so the first
+    # request does not pay the database handshake cost
+    if not await run_in_threadpool(healthcheck):
+        logger.warning("Database warm-up failed; continuing startup")
+    yield
+    # Stop scrape workers so restarts are not held up by in-flight jobs
+    await run_in_threadpool(shutdown_job_queue)
+    close_idle_connections()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Register exception handlers for custom error pages
 app.add_exception_handler(401, unauthorized_handler)
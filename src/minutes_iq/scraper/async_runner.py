@@ -103,8 +103,10 @@ def run_scrape_job_async(
             if job_id not in _cancellation_flags:
                 _cancellation_flags[job_id] = threading.Event()
 
-        # Update job status to running
-        service.repository.update_job_status(job_id, "running")
+        # Claim the job; it may have been cancelled while it was queued
+        if not service.repository.claim_job(job_id):
+            logger.info(f"Job {job_id} is no longer pending; not running it")
+            return
 
         # Execute scrape with periodic cancellation checks
         result = _execute_with_monitoring(
@@ -253,17 +255,19 @@ def _execute_with_monitoring(
 
             # Save matches to database
             if matches:
-                for match in matches:
-                    keyword_id = keyword_id_map[match["keyword"]]
-                    service.repository.save_result(
-                        job_id=job_id,
-                        pdf_filename=match["filename"],
-                        page_number=match["page"],
-                        keyword_id=keyword_id,
-                        snippet=match["snippet"],
-                        entities=match["entities"],
-                    )
-                    matches_found += 1
+                matches_found += service.repository.save_results(
+                    job_id,
+                    [
+                        {
+                            "pdf_filename": match["filename"],
+                            "page_number": match["page"],
+                            "keyword_id": keyword_id_map[match["keyword"]],
+                            "snippet": match["snippet"],
+                            "entities": match["entities"],
+                        }
+                        for match in matches
+                    ],
+                )
 
                 # Commit after each PDF with matches to avoid connection timeout
                 try:
@@ -365,32 +369,30 @@ def _check_timeout(job_id: int, start_time: float) -> None:
         )
 
 
-def cancel_job_async(job_id: int, service: ScraperService) -> bool:
+def cancel_job_async(
+    job_id: int, service: ScraperService, user_id: int | None = None
+) -> bool:
     """
     Cancel a running background job.
 
     Args:
         job_id: The job ID to cancel
         service: The ScraperService instance
+        user_id: If given, only cancel the job when this user created it
 
     Returns:
-        True if cancellation flag was set, False if job not found or not running
+        True if the job was cancelled or signalled, False if no pending or
+        running job matched
     """
-    job = service.repository.get_job(job_id)
-    if not job:
-        logger.warning(f"Cannot cancel job {job_id}: job not found")
+    new_status = service.repository.try_cancel(job_id, user_id)
+    if new_status is None:
+        logger.warning(f"Cannot cancel job {job_id}: not found or not cancellable")
         return False
 
-    if job["status"] not in ("pending", "running"):
-        logger.warning(f"Cannot cancel job {job_id}: status is '{job['status']}'")
-        return False
-
-    # Set cancellation flag
-    set_cancellation_flag(job_id)
-
-    # If job is pending, update status immediately
-    if job["status"] == "pending":
-        service.repository.update_job_status(job_id, "cancelled")
+    # Pending jobs are already marked cancelled; running jobs stop at their
+    # next cancellation check
+    if new_status == "running":
+        set_cancellation_flag(job_id)
 
     logger.info(f"Initiated cancellation for job {job_id}")
     return True
@@ -6,6 +6,7 @@ Refactored from jea_minutes_scraper.py for database-backed orchestration.
 import hashlib
 import logging
 import re
+from functools import lru_cache
 from io import BytesIO
 from typing import Any
 
@@ -133,6 +134,14 @@ def scrape_pdf_links(
     return pdf_links
 
 
+@lru_cache(maxsize=32)
+def _keyword_pattern(lowered_keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile (once per keyword set) a regex matching any of the keywords."""
+    if not lowered_keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in lowered_keywords))
+
+
 def stream_and_scan_pdf(
     url: str,
     keywords: list[str],
@@ -163,13 +172,23 @@ def stream_and_scan_pdf(
             matches = []
             pages_to_scan = pdf.pages if max_pages is None else pdf.pages[:max_pages]
 
+            filename = get_safe_filename(url)
+            lowered_keywords = [(keyword, keyword.lower()) for keyword in keywords]
+            any_keyword = _keyword_pattern(tuple(kw for _, kw in lowered_keywords))
+
             for i, page in enumerate(pages_to_scan):
                 text = page.extract_text() or ""
+                lowered_text = text.lower()
+
+                # One regex pass tells whether any keyword is on the page;
+                # most pages have none
+                if any_keyword is None or not any_keyword.search(lowered_text):
+                    continue
 
-                for keyword in keywords:
-                    if keyword.lower() in text.lower():
+                for keyword, lowered_keyword in lowered_keywords:
+                    start_idx = lowered_text.find(lowered_keyword)
+                    if start_idx != -1:
                         # Extract context snippet
-                        start_idx = text.lower().find(keyword.lower())
                         context_snippet = text[start_idx:][:300]
 
                         # Extract entities using NLP
@@ -177,7 +196,7 @@ def stream_and_scan_pdf(
 
                         matches.append(
                             {
-                                "filename": get_safe_filename(url),
+                                "filename": filename,
                                 "page": i + 1,
                                 "keyword": keyword,
                                 "snippet": context_snippet.strip(),
@@ -0,0 +1,122 @@
+"""
+Dedicated worker pool for scrape job execution.
+
+Scrape jobs are long-running, so they are handed to a bounded pool of worker
+threads instead of running on the request worker (FastAPI BackgroundTasks) or
+in an unbounded thread per job. Each job opens its own database connection.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from minutes_iq.config.settings import settings
+from minutes_iq.db.client import get_db_connection
+from minutes_iq.db.scraper_repository import ScraperRepository
+from minutes_iq.db.scraper_service import ScraperService
+from minutes_iq.scraper.async_runner import (
+    run_scrape_job_async,
+    set_cancellation_flag,
+)
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_queued_jobs: set[int] = set()
+_queue_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the worker pool on first use. Caller must hold _queue_lock."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.tasks.workers),
+            thread_name_prefix="scrape-worker",
+        )
+    return _executor
+
+
+def _run_job(job_id: int, source_urls: list[str], storage_manager=None) -> None:
+    """
+    Execute a queued job with a connection owned by the worker thread.
+
+    Args:
+        job_id: The job ID to execute
+        source_urls: List of URLs to scrape for PDF links
+        storage_manager: Optional StorageManager for organized file storage
+    """
+    try:
+        with get_db_connection() as conn:
+            service = ScraperService(ScraperRepository(conn))
+            run_scrape_job_async(
+                job_id=job_id,
+                service=service,
+                source_urls=source_urls,
+                storage_manager=storage_manager,
+            )
+    except Exception as e:
+        logger.error("Worker failed to run job %s: %s", job_id, e, exc_info=True)
+    finally:
+        with _queue_lock:
+            _queued_jobs.discard(job_id)
+
+
+def enqueue_scrape_job(
+    job_id: int,
+    source_urls: list[str],
+    storage_manager=None,
+) -> bool:
+    """
+    Queue a scrape job for execution on the worker pool.
+
+    Submitting a job that is already queued or running is a no-op, so
+    double-submits do not execute the same job twice.
+
+    Args:
+        job_id: The job ID to execute
+        source_urls: List of URLs to scrape for PDF links
+        storage_manager: Optional StorageManager for organized file storage
+
+    Returns:
+        True if the job was queued, False if it was already queued
+    """
+    with _queue_lock:
+        if job_id in _queued_jobs:
+            logger.info("Job %s is already queued", job_id)
+            return False
+
+        _queued_jobs.add(job_id)
+        _get_executor().submit(_run_job, job_id, source_urls, storage_manager)
+
+    logger.info("Queued job %s for execution", job_id)
+    return True
+
+
+def shutdown_job_queue(wait: bool = True) -> None:
+    """
+    Stop the worker pool.
+
+    Jobs that have not started are dropped and left pending; running jobs are
+    signalled to cancel so shutdown does not wait for a full scrape.
+
+    Args:
+        wait: Whether to block until running jobs have stopped
+    """
+    global _executor
+    with _queue_lock:
+        executor = _executor
+        _executor = None
+        active_jobs = list(_queued_jobs)
+
+    if executor is None:
+        return
+
+    for job_id in active_jobs:
+        set_cancellation_flag(job_id)
+
+    executor.shutdown(wait=wait, cancel_futures=True)
+    with _queue_lock:
+        _queued_jobs.clear()
+
+    logger.info("Scrape job queue shut down (%s jobs interrupted)", len(active_jobs))
@@ -2,18 +2,20 @@
 API endpoints for scraper job management.
 """
 
+import itertools
 import logging
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     HTTPException,
     Query,
+    Request,
     status,
 )
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from minutes_iq.auth.dependencies import get_current_user
 from minutes_iq.db.dependencies import get_scraper_repository
@@ -21,20 +23,19 @@ from minutes_iq.db.highlighter_service import HighlighterService
 from minutes_iq.db.results_service import ResultsService
 from minutes_iq.db.scraper_repository import ScraperRepository
 from minutes_iq.db.scraper_service import ScraperService
-from minutes_iq.scraper.async_runner import cancel_job_async, run_scrape_job_async
+from minutes_iq.http_cache import job_cache_headers, not_modified_response
+from minutes_iq.scraper.async_runner import cancel_job_async
+from minutes_iq.scraper.job_queue import enqueue_scrape_job
 from minutes_iq.scraper.schemas import (
     CleanupResponse,
     CreateArtifactRequest,
     CreateArtifactResponse,
     CreateJobRequest,
     CreateJobResponse,
-    JobConfig,
     JobDetails,
     JobListResponse,
-    JobStatistics,
     JobStatusResponse,
     JobSummary,
-    ResultMatch,
     ResultsListResponse,
     ResultsSummaryResponse,
     StorageStatsResponse,
@@ -70,12 +71,51 @@ def get_highlighter_service(
     return HighlighterService(repository)
 
 
+@lru_cache(maxsize=1)
 def get_storage_manager() -> StorageManager:
-    """Get StorageManager instance."""
+    """Get the shared StorageManager instance (created once per process)."""
     # TODO: Load configuration from settings
     return StorageManager(base_dir="data")
 
 
+def _require_job(job: dict | None, job_id: int) -> dict:
+    """
+    Return a job looked up for the current user, or raise 404.
+
+    Lookups filter on the job's owner, so other users' jobs come back as
+    missing and their existence is not revealed.
+
+    Raises:
+        HTTPException: 404 if the job does not exist or is not owned
+    """
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found",
+        )
+
+    return job
+
+
+def get_owned_job(
+    job_id: int,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    service: Annotated[ScraperService, Depends(get_scraper_service)],
+) -> dict:
+    """
+    Fetch a job and verify the current user owns it.
+
+    FastAPI caches dependency results per request, so handlers that also need
+    the job row reuse this single lookup instead of querying again.
+
+    Raises:
+        HTTPException: 404 if the job does not exist or is not owned
+    """
+    return _require_job(
+        service.repository.get_job_for_user(job_id, current_user["user_id"]), job_id
+    )
+
+
 # === Job Management Endpoints ===
 
 
@@ -84,19 +124,19 @@ def get_storage_manager() -> StorageManager:
 )
 def create_scrape_job(
     request: CreateJobRequest,
-    background_tasks: BackgroundTasks,
     current_user: Annotated[dict, Depends(get_current_user)],
     service: Annotated[ScraperService, Depends(get_scraper_service)],
+    storage: Annotated[StorageManager, Depends(get_storage_manager)],
 ) -> CreateJobResponse:
     """
     Create a new scrape job.
 
-    The job will be executed in the background. Use the job_id to poll for status.
+    The job is queued on the scrape worker pool. Use the job_id to poll for status.
     """
     try:
         # Create job in database
         job_id = service.create_scrape_job(
-            client_id=request.client_id,
+            client_url_id=request.client_url_id,
             created_by=current_user["user_id"],
             date_range_start=request.date_range_start,
             date_range_end=request.date_range_end,
@@ -105,19 +145,16 @@ def create_scrape_job(
             include_packages=request.include_packages,
         )
 
-        # Get storage manager
-        storage = get_storage_manager()
-
-        # Start background execution
-        background_tasks.add_task(
-            run_scrape_job_async,
+        # Hand off to the worker pool, which opens its own DB connection
+        enqueue_scrape_job(
             job_id=job_id,
-            service=service,
             source_urls=request.source_urls,
             storage_manager=storage,
         )
 
-        logger.info(f"Created scrape job {job_id} for user {current_user['user_id']}")
+        logger.info(
+            "Created scrape job %s for user %s", job_id, current_user["user_id"]
+        )
 
         return CreateJobResponse(
             job_id=job_id,
@@ -126,7 +163,7 @@ def create_scrape_job(
         )
 
     except Exception as e:
-        logger.error(f"Failed to create scrape job: {e}", exc_info=True)
+        logger.error("Failed to create scrape job: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create scrape job: {str(e)}",
@@ -139,19 +176,20 @@ def list_scrape_jobs(
     service: Annotated[ScraperService, Depends(get_scraper_service)],
     status_filter: str | None = Query(None, alias="status"),
     client_id: str | None = Query(None),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: int = Query(50, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> JobListResponse:
+) -> ORJSONResponse:
     """
     List scrape jobs for the current user.
 
-    Supports filtering by status and client_id.
+    Supports filtering by status and client_id. The returned total counts
+    matching jobs across all pages, not just this one.
     """
     try:
         # Convert client_id from string to int, treating empty string as None
         client_id_int = int(client_id) if client_id and client_id.strip() else None
 
-        jobs = service.repository.list_jobs(
+        jobs, total = service.repository.list_jobs_page(
             user_id=current_user["user_id"],
             client_id=client_id_int,
             status=status_filter,
@@ -159,17 +197,23 @@ def list_scrape_jobs(
             offset=offset,
         )
 
-        job_summaries = [JobSummary(**job) for job in jobs]
-
-        return JobListResponse(
-            jobs=job_summaries,
-            total=len(job_summaries),
-            limit=limit,
-            offset=offset,
+        # Rows are already shaped by the repository; project them to the
+        # JobSummary fields and serialize directly instead of re-validating
+        job_summaries = [
+            {field: job[field] for field in JobSummary.model_fields} for job in jobs
+        ]
+
+        return ORJSONResponse(
+            {
+                "jobs": job_summaries,
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Failed to list jobs: {e}", exc_info=True)
+        logger.error("Failed to list jobs: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list jobs: {str(e)}",
@@ -179,64 +223,38 @@ def list_scrape_jobs(
 @router.get("/jobs/{job_id}", response_model=JobDetails)
 def get_job_details(
     job_id: int,
+    request: Request,
     current_user: Annotated[dict, Depends(get_current_user)],
     service: Annotated[ScraperService, Depends(get_scraper_service)],
-    results_service: Annotated[ResultsService, Depends(get_results_service)],
-) -> JobDetails:
+) -> Response:
     """
     Get full details for a specific job.
 
     Includes configuration and execution statistics.
     """
     try:
-        # Get job
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        # Verify ownership
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
+        # Job, config, and statistics come back from a single query
+        job = _require_job(
+            service.repository.get_job_details(job_id, current_user["user_id"]),
+            job_id,
+        )
 
-        # Get config
-        config = service.repository.get_job_config(job_id)
-        if not config:
+        if not job["config"]:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Configuration for job {job_id} not found",
             )
 
-        # Get statistics
-        summary = results_service.get_results_summary(job_id)
+        not_modified = not_modified_response(request, job)
+        if not_modified is not None:
+            return not_modified
 
-        return JobDetails(
-            job_id=job["job_id"],
-            client_id=job["client_id"],
-            status=job["status"],
-            created_by=job["created_by"],
-            created_at=job["created_at"],
-            started_at=job["started_at"],
-            completed_at=job["completed_at"],
-            error_message=job["error_message"],
-            config=JobConfig(**config),
-            statistics=JobStatistics(
-                total_matches=summary["total_matches"],
-                unique_pdfs=summary["unique_pdfs"],
-                unique_keywords=summary["unique_keywords"],
-                execution_time_seconds=summary["execution_time_seconds"],
-            ),
-        )
+        return ORJSONResponse(job, headers=job_cache_headers(job))
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job details: {e}", exc_info=True)
+        logger.error("Failed to get job details: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get job details: {str(e)}",
@@ -255,36 +273,26 @@ def cancel_scrape_job(
     Only the job creator can cancel a job.
     """
     try:
-        # Get job
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        # Verify ownership
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
-
-        # Attempt cancellation
-        success = cancel_job_async(job_id, service)
+        # Ownership, state check and cancellation happen in one statement
+        success = cancel_job_async(job_id, service, user_id=current_user["user_id"])
 
         if not success:
+            # Only look the job up to explain why nothing was cancelled
+            job = _require_job(
+                service.repository.get_job_for_user(job_id, current_user["user_id"]),
+                job_id,
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot cancel job {job_id} with status '{job['status']}'",
             )
 
-        logger.info(f"User {current_user['user_id']} cancelled job {job_id}")
+        logger.info("User %s cancelled job %s", current_user["user_id"], job_id)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to cancel job: {e}", exc_info=True)
+        logger.error("Failed to cancel job: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to cancel job: {str(e)}",
@@ -296,46 +304,33 @@ def get_job_status(
     job_id: int,
     current_user: Annotated[dict, Depends(get_current_user)],
     service: Annotated[ScraperService, Depends(get_scraper_service)],
-) -> JobStatusResponse:
+) -> Response:
     """
     Poll the current status of a scrape job.
 
-    Use this endpoint for progress updates during job execution.
+    Use this endpoint for progress updates during job execution. Responses
+    are served from a short-lived cache so frequent polling stays cheap.
     """
     try:
-        # Get job
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        # Verify ownership
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
-
-        # Get basic progress info
-        result_count = service.repository.get_result_count(job_id)
-
-        progress = {
-            "matches_found": result_count,
-        }
+        job = _require_job(
+            service.get_cached_status(job_id, current_user["user_id"]), job_id
+        )
 
-        return JobStatusResponse(
-            job_id=job_id,
-            status=job["status"],
-            progress=progress,
-            error_message=job["error_message"],
+        # Serialize directly: building a JobStatusResponse would only be
+        # validated a second time against the response_model
+        return ORJSONResponse(
+            {
+                "job_id": job_id,
+                "status": job["status"],
+                "progress": {"matches_found": job["matches_found"]},
+                "error_message": job["error_message"],
+            }
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job status: {e}", exc_info=True)
+        logger.error("Failed to get job status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get job status: {str(e)}",
@@ -348,56 +343,43 @@ def get_job_status(
 @router.get("/jobs/{job_id}/results", response_model=ResultsListResponse)
 def list_job_results(
     job_id: int,
-    current_user: Annotated[dict, Depends(get_current_user)],
+    request: Request,
+    job: Annotated[dict, Depends(get_owned_job)],
     service: Annotated[ScraperService, Depends(get_scraper_service)],
     keyword_id: int | None = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-) -> ResultsListResponse:
+) -> Response:
     """
     List results for a scrape job.
 
     Supports filtering by keyword and pagination.
     """
     try:
-        # Get job and verify ownership
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
-
-        # Get results
-        all_results = service.repository.get_job_results(job_id)
-
-        # Filter by keyword if specified
-        if keyword_id is not None:
-            all_results = [r for r in all_results if r["keyword_id"] == keyword_id]
-
-        # Apply pagination
-        paginated_results = all_results[offset : offset + limit]
+        not_modified = not_modified_response(request, job)
+        if not_modified is not None:
+            return not_modified
 
-        # Convert to ResultMatch objects
-        result_matches = [ResultMatch(**r) for r in paginated_results]
-
-        return ResultsListResponse(
-            results=result_matches,
-            total=len(all_results),
-            limit=limit,
-            offset=offset,
+        # Filter and paginate in SQL so only the requested page is loaded
+        results = service.repository.get_job_results_page(
+            job_id, keyword_id=keyword_id, limit=limit, offset=offset
+        )
+        total = service.repository.count_job_results(job_id, keyword_id=keyword_id)
+
+        return ORJSONResponse(
+            {
+                "results": results,
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+            },
+            headers=job_cache_headers(job),
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list results: {e}", exc_info=True)
+        logger.error("Failed to list results: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list results: {str(e)}",
@@ -407,37 +389,32 @@ def list_job_results(
 @router.get("/jobs/{job_id}/results/summary", response_model=ResultsSummaryResponse)
 def get_results_summary(
     job_id: int,
-    current_user: Annotated[dict, Depends(get_current_user)],
-    service: Annotated[ScraperService, Depends(get_scraper_service)],
+    request: Request,
+    job: Annotated[dict, Depends(get_owned_job)],
     results_service: Annotated[ResultsService, Depends(get_results_service)],
-) -> ResultsSummaryResponse:
+) -> Response:
     """
     Get aggregated statistics for job results.
     """
     try:
-        # Get job and verify ownership
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
+        not_modified = not_modified_response(request, job)
+        if not_modified is not None:
+            return not_modified
 
         # Get summary
         summary = results_service.get_results_summary(job_id)
 
-        return ResultsSummaryResponse(**summary)
+        # The summary is built from typed aggregates; project it to the
+        # response fields and serialize directly instead of re-validating
+        return ORJSONResponse(
+            {field: summary[field] for field in ResultsSummaryResponse.model_fields},
+            headers=job_cache_headers(job),
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get results summary: {e}", exc_info=True)
+        logger.error("Failed to get results summary: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get results summary: {str(e)}",
@@ -447,40 +424,27 @@ def get_results_summary(
 @router.get("/jobs/{job_id}/results/export")
 def export_results_csv(
     job_id: int,
-    current_user: Annotated[dict, Depends(get_current_user)],
-    service: Annotated[ScraperService, Depends(get_scraper_service)],
+    job: Annotated[dict, Depends(get_owned_job)],
     results_service: Annotated[ResultsService, Depends(get_results_service)],
-) -> Response:
+) -> StreamingResponse:
     """
     Download results as CSV file.
     """
     try:
-        # Get job and verify ownership
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
-
-        # Generate CSV
-        csv_content = results_service.generate_csv_export(job_id)
+        # Stream CSV in batches; pull the first chunk up front so an empty
+        # export can still be reported as 404
+        csv_chunks = results_service.iter_csv_export(job_id)
+        first_chunk = next(csv_chunks, None)
 
-        if not csv_content:
+        if first_chunk is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No results found for job {job_id}",
             )
 
         # Return as downloadable file
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            itertools.chain([first_chunk], csv_chunks),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=job_{job_id}_results.csv"
@@ -490,7 +454,7 @@ def export_results_csv(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to export results: {e}", exc_info=True)
+        logger.error("Failed to export results: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to export results: {str(e)}",
@@ -508,8 +472,7 @@ def export_results_csv(
 def create_job_artifact(
     job_id: int,
     request: CreateArtifactRequest,
-    current_user: Annotated[dict, Depends(get_current_user)],
-    service: Annotated[ScraperService, Depends(get_scraper_service)],
+    job: Annotated[dict, Depends(get_owned_job)],
 ) -> CreateArtifactResponse:
     """
     Generate a ZIP artifact containing job results and PDFs.
@@ -518,20 +481,6 @@ def create_job_artifact(
     file storage configuration (S3, local filesystem, etc.).
     """
     try:
-        # Get job and verify ownership
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        if job["created_by"] != current_user["user_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this job",
-            )
-
         # TODO: Implement artifact generation
         # - Create ZIP with requested components
         # - Store in configured storage backend
@@ -546,7 +495,7 @@ def create_job_artifact(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create artifact: {e}", exc_info=True)
+        logger.error("Failed to create artifact: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create artifact: {str(e)}",
@@ -570,25 +519,25 @@ def cleanup_job_files(
     Admin-only endpoint. Removes raw PDFs, annotated PDFs, and optionally artifacts.
     """
     try:
-        # Get job and verify ownership
-        job = service.repository.get_job(job_id)
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job {job_id} not found",
-            )
-
-        # Admin-only check (requires is_admin field in user context)
+        # Admin-only check (requires is_admin field in user context). Done
+        # before the lookup so non-admins never cost a query.
         if not current_user.get("is_admin", False):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only administrators can cleanup job files",
             )
 
+        # Admins may clean up any job, so only existence is checked
+        if service.repository.get_job(job_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job {job_id} not found",
+            )
+
         # Perform cleanup
         deleted = storage.cleanup_job(job_id, include_artifacts=include_artifacts)
 
-        logger.info(f"Admin {current_user['user_id']} cleaned up job {job_id}")
+        logger.info("Admin %s cleaned up job %s", current_user["user_id"], job_id)
 
         return CleanupResponse(
             job_id=job_id,
@@ -599,7 +548,7 @@ def cleanup_job_files(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to cleanup job files: {e}", exc_info=True)
+        logger.error("Failed to cleanup job files: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to cleanup job files: {str(e)}",
@@ -632,7 +581,7 @@ def get_storage_statistics(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get storage stats: {e}", exc_info=True)
+        logger.error("Failed to get storage stats: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get storage stats: {str(e)}",
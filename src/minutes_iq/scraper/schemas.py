@@ -2,15 +2,21 @@
 Pydantic schemas for scraper API endpoints.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+JobStatus = Literal["pending", "running", "completed", "failed", "cancelled"]
+# Statuses a job never leaves
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
 # === Job Management Schemas ===
 
 
 class CreateJobRequest(BaseModel):
     """Request schema for creating a scrape job."""
 
-    client_id: int = Field(..., description="Client ID to scrape for")
+    client_url_id: int = Field(..., description="Client URL ID to scrape")
     date_range_start: str | None = Field(
         None, description="Start date in YYYY-MM format"
     )
@@ -29,7 +35,7 @@ class CreateJobResponse(BaseModel):
     """Response schema for job creation."""
 
     job_id: int
-    status: str
+    status: JobStatus
     message: str
 
 
@@ -39,7 +45,7 @@ class JobSummary(BaseModel):
     job_id: int
     client_id: int
     client_name: str
-    status: str
+    status: JobStatus
     created_by: int
     created_at: int
     started_at: int | None
@@ -82,7 +88,7 @@ class JobDetails(BaseModel):
 
     job_id: int
     client_id: int
-    status: str
+    status: JobStatus
     created_by: int
     created_at: int
     started_at: int | None
@@ -96,7 +102,7 @@ class JobStatusResponse(BaseModel):
     """Job status polling response."""
 
     job_id: int
-    status: str
+    status: JobStatus
     progress: dict | None
     error_message: str | None
 
@@ -138,7 +144,7 @@ class ResultsSummaryResponse(BaseModel):
     """Results summary statistics."""
 
     job_id: int
-    status: str
+    status: JobStatus
     total_matches: int
     unique_pdfs: int
     unique_keywords: int
@@ -9,8 +9,13 @@ This module provides:
 """
 
 import logging
+import os
 import shutil
-from datetime import datetime, timedelta
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +26,165 @@ DEFAULT_RAW_PDF_RETENTION = 30
 DEFAULT_ANNOTATED_PDF_RETENTION = 90
 DEFAULT_ARTIFACT_RETENTION = 30
 
+# Storage buckets under base_dir, one directory per job inside each
+STORAGE_BUCKETS = ("raw_pdfs", "annotated_pdfs", "artifacts")
+
+# How long get_storage_stats reuses its last scan (seconds)
+STORAGE_STATS_TTL = 10.0
+
+# Upper bound on threads deleting expired job directories per bucket
+CLEANUP_MAX_WORKERS = 8
+
+# Job directories with at least this many files are deleted with the
+# native rm instead of shutil.rmtree (POSIX only)
+NATIVE_RMTREE_MIN_FILES = 1000
+
+
+def _scan(path: Path | str, skip: tuple[str, ...] = ()) -> tuple[int, int, int]:
+    """
+    Walk a directory tree once with os.scandir.
+
+    DirEntry caches the file type (and on most platforms the stat result)
+    from the directory listing, so each file costs about one syscall.
+
+    Args:
+        path: Directory to scan
+        skip: Names of top-level entries to leave out
+
+    Returns:
+        Tuple of (total size in bytes, file count, top-level entry count)
+    """
+    total_size = 0
+    total_files = 0
+
+    try:
+        with os.scandir(path) as it:
+            top_entries = [entry for entry in it if entry.name not in skip]
+    except FileNotFoundError:
+        return 0, 0, 0
+
+    top_level = len(top_entries)
+    pending = [top_entries]
+    while pending:
+        for entry in pending.pop():
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    with os.scandir(entry.path) as it:
+                        pending.append(list(it))
+                except FileNotFoundError:
+                    continue
+            elif entry.is_file(follow_symlinks=False):
+                try:
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                except FileNotFoundError:
+                    continue
+                total_files += 1
+
+    return total_size, total_files, top_level
+
+
+def _remove_tree(path: Path | str, file_count: int = 0) -> None:
+    """
+    Delete a directory tree.
+
+    Very large job directories are handed to a single native rm process,
+    which avoids a Python-level unlink per file. Small directories, other
+    platforms, and any failure of rm fall back to shutil.rmtree.
+
+    Args:
+        path: Directory to delete
+        file_count: Number of files known to be in the directory
+    """
+    if file_count >= NATIVE_RMTREE_MIN_FILES and os.name == "posix":
+        rm = shutil.which("rm")
+        if rm:
+            try:
+                subprocess.run([rm, "-rf", "--", os.fspath(path)], check=True)
+                return
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"rm failed for {path}, using shutil.rmtree: {e}")
+
+    shutil.rmtree(path)
+
+
+def _iter_job_dirs(root: Path) -> Iterator[os.DirEntry]:
+    """Yield the job directories in a storage bucket (nothing if it is missing)."""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield entry
+
+
+def _list_job_dir(
+    path: Path | str, extension: str
+) -> tuple[list[os.DirEntry], int] | None:
+    """
+    List a job directory once for both counting and deletion.
+
+    Args:
+        path: Job directory to list
+        extension: File extension counted as deleted files
+
+    Returns:
+        Tuple of (directory entries, number of files with the extension),
+        or None if the directory does not exist
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return None
+
+    return entries, sum(1 for entry in entries if entry.name.endswith(extension))
+
+
+def _remove_listed_dir(path: Path | str, entries: list[os.DirEntry]) -> None:
+    """
+    Delete a job directory given its listing from _list_job_dir.
+
+    Job directories are normally flat and small, so their files are
+    unlinked straight from the listing. Anything nested, large, or
+    failing part-way is left to _remove_tree.
+    """
+    if len(entries) < NATIVE_RMTREE_MIN_FILES and all(
+        entry.is_file(follow_symlinks=False) for entry in entries
+    ):
+        try:
+            for entry in entries:
+                os.unlink(entry.path)
+            os.rmdir(path)
+            return
+        except OSError:
+            pass
+
+    _remove_tree(path, len(entries))
+
+
+def _remove_job_dir(path: Path | str, extension: str) -> int | None:
+    """
+    Delete one job directory and count the files it held.
+
+    Args:
+        path: Job directory to delete
+        extension: File extension counted as deleted files
+
+    Returns:
+        Number of files with the extension, or None if the directory
+        does not exist
+    """
+    listing = _list_job_dir(path, extension)
+    if listing is None:
+        return None
+
+    entries, file_count = listing
+    _remove_listed_dir(path, entries)
+    return file_count
+
 
 class StorageManager:
     """Manages file storage for scraper jobs."""
@@ -42,24 +206,35 @@ class StorageManager:
             artifact_retention_days: Days to keep artifacts (default: 30)
         """
         self.base_dir = Path(base_dir)
+        # Bucket roots are built once; per-job paths only append the job ID
+        self._bucket_roots = {
+            bucket: self.base_dir / bucket for bucket in STORAGE_BUCKETS
+        }
+        self._raw_pdf_root = self._bucket_roots["raw_pdfs"]
+        self._annotated_pdf_root = self._bucket_roots["annotated_pdfs"]
+        self._artifacts_root = self._bucket_roots["artifacts"]
         self.raw_pdf_retention_days = raw_pdf_retention_days
         self.annotated_pdf_retention_days = annotated_pdf_retention_days
         self.artifact_retention_days = artifact_retention_days
 
+        # Last get_storage_stats result as (expires_at, stats)
+        self._stats_cache: tuple[float, dict[str, Any]] | None = None
+        self._stats_lock = threading.Lock()
+
         # Ensure base directories exist
         self._ensure_directories()
 
     def _ensure_directories(self) -> None:
         """Create base storage directories if they don't exist."""
-        (self.base_dir / "raw_pdfs").mkdir(parents=True, exist_ok=True)
-        (self.base_dir / "annotated_pdfs").mkdir(parents=True, exist_ok=True)
-        (self.base_dir / "artifacts").mkdir(parents=True, exist_ok=True)
+        self._raw_pdf_root.mkdir(parents=True, exist_ok=True)
+        self._annotated_pdf_root.mkdir(parents=True, exist_ok=True)
+        self._artifacts_root.mkdir(parents=True, exist_ok=True)
 
     # === Path Generation ===
 
     def get_raw_pdf_dir(self, job_id: int) -> Path:
         """Get directory path for raw PDFs for a job."""
-        return self.base_dir / "raw_pdfs" / str(job_id)
+        return self._raw_pdf_root / str(job_id)
 
     def get_raw_pdf_path(self, job_id: int, filename: str) -> Path:
         """Get full path for a raw PDF file."""
@@ -67,7 +242,7 @@ class StorageManager:
 
     def get_annotated_pdf_dir(self, job_id: int) -> Path:
         """Get directory path for annotated PDFs for a job."""
-        return self.base_dir / "annotated_pdfs" / str(job_id)
+        return self._annotated_pdf_root / str(job_id)
 
     def get_annotated_pdf_path(self, job_id: int, filename: str) -> Path:
         """Get full path for an annotated PDF file."""
@@ -78,7 +253,7 @@ class StorageManager:
 
     def get_artifacts_dir(self, job_id: int) -> Path:
         """Get directory path for artifacts for a job."""
-        return self.base_dir / "artifacts" / str(job_id)
+        return self._artifacts_root / str(job_id)
 
     def get_artifact_path(self, job_id: int, artifact_id: str) -> Path:
         """Get full path for an artifact file."""
@@ -112,31 +287,25 @@ class StorageManager:
         }
 
         # Delete raw PDFs
-        raw_pdf_dir = self.get_raw_pdf_dir(job_id)
-        if raw_pdf_dir.exists():
-            deleted["raw_pdfs"] = len(list(raw_pdf_dir.glob("*.pdf")))
-            shutil.rmtree(raw_pdf_dir)
-            logger.info(f"Deleted {deleted['raw_pdfs']} raw PDFs for job {job_id}")
+        count = _remove_job_dir(self.get_raw_pdf_dir(job_id), ".pdf")
+        if count is not None:
+            deleted["raw_pdfs"] = count
+            logger.info(f"Deleted {count} raw PDFs for job {job_id}")
 
         # Delete annotated PDFs
-        annotated_pdf_dir = self.get_annotated_pdf_dir(job_id)
-        if annotated_pdf_dir.exists():
-            deleted["annotated_pdfs"] = len(list(annotated_pdf_dir.glob("*.pdf")))
-            shutil.rmtree(annotated_pdf_dir)
-            logger.info(
-                f"Deleted {deleted['annotated_pdfs']} annotated PDFs for job {job_id}"
-            )
+        count = _remove_job_dir(self.get_annotated_pdf_dir(job_id), ".pdf")
+        if count is not None:
+            deleted["annotated_pdfs"] = count
+            logger.info(f"Deleted {count} annotated PDFs for job {job_id}")
 
         # Delete artifacts if requested
         if include_artifacts:
-            artifacts_dir = self.get_artifacts_dir(job_id)
-            if artifacts_dir.exists():
-                deleted["artifacts"] = len(list(artifacts_dir.glob("*.zip")))
-                shutil.rmtree(artifacts_dir)
-                logger.info(
-                    f"Deleted {deleted['artifacts']} artifacts for job {job_id}"
-                )
+            count = _remove_job_dir(self.get_artifacts_dir(job_id), ".zip")
+            if count is not None:
+                deleted["artifacts"] = count
+                logger.info(f"Deleted {count} artifacts for job {job_id}")
 
+        self._invalidate_stats()
         return deleted
 
     # === Age-Based Cleanup ===
@@ -148,70 +317,31 @@ class StorageManager:
         Returns:
             Dict with cleanup summary
         """
-        now = datetime.now()
+        now_ts = time.time()
         summary: dict[str, Any] = {
             "raw_pdfs_deleted": 0,
             "annotated_pdfs_deleted": 0,
             "artifacts_deleted": 0,
-            "jobs_cleaned": [],
         }
-
-        # Clean up raw PDFs
-        raw_pdf_dir = self.base_dir / "raw_pdfs"
-        if raw_pdf_dir.exists():
-            for job_dir in raw_pdf_dir.iterdir():
-                if not job_dir.is_dir():
-                    continue
-
-                # Check age based on directory modification time
-                dir_age = now - datetime.fromtimestamp(job_dir.stat().st_mtime)
-                if dir_age > timedelta(days=self.raw_pdf_retention_days):
-                    file_count = len(list(job_dir.glob("*.pdf")))
-                    shutil.rmtree(job_dir)
-                    summary["raw_pdfs_deleted"] += file_count
-                    summary["jobs_cleaned"].append(int(job_dir.name))
-                    logger.info(
-                        f"Deleted {file_count} raw PDFs from job {job_dir.name} "
-                        f"(age: {dir_age.days} days)"
-                    )
-
-        # Clean up annotated PDFs
-        annotated_pdf_dir = self.base_dir / "annotated_pdfs"
-        if annotated_pdf_dir.exists():
-            for job_dir in annotated_pdf_dir.iterdir():
-                if not job_dir.is_dir():
-                    continue
-
-                dir_age = now - datetime.fromtimestamp(job_dir.stat().st_mtime)
-                if dir_age > timedelta(days=self.annotated_pdf_retention_days):
-                    file_count = len(list(job_dir.glob("*.pdf")))
-                    shutil.rmtree(job_dir)
-                    summary["annotated_pdfs_deleted"] += file_count
-                    if int(job_dir.name) not in summary["jobs_cleaned"]:
-                        summary["jobs_cleaned"].append(int(job_dir.name))
-                    logger.info(
-                        f"Deleted {file_count} annotated PDFs from job {job_dir.name} "
-                        f"(age: {dir_age.days} days)"
-                    )
-
-        # Clean up artifacts
-        artifacts_dir = self.base_dir / "artifacts"
-        if artifacts_dir.exists():
-            for job_dir in artifacts_dir.iterdir():
-                if not job_dir.is_dir():
-                    continue
-
-                dir_age = now - datetime.fromtimestamp(job_dir.stat().st_mtime)
-                if dir_age > timedelta(days=self.artifact_retention_days):
-                    file_count = len(list(job_dir.glob("*.zip")))
-                    shutil.rmtree(job_dir)
-                    summary["artifacts_deleted"] += file_count
-                    if int(job_dir.name) not in summary["jobs_cleaned"]:
-                        summary["jobs_cleaned"].append(int(job_dir.name))
-                    logger.info(
-                        f"Deleted {file_count} artifacts from job {job_dir.name} "
-                        f"(age: {dir_age.days} days)"
-                    )
+        jobs_cleaned: set[int] = set()
+
+        for bucket, retention_days, extension, label in (
+            ("raw_pdfs", self.raw_pdf_retention_days, ".pdf", "raw PDFs"),
+            (
+                "annotated_pdfs",
+                self.annotated_pdf_retention_days,
+                ".pdf",
+                "annotated PDFs",
+            ),
+            ("artifacts", self.artifact_retention_days, ".zip", "artifacts"),
+        ):
+            for job_id, file_count in self._cleanup_bucket(
+                bucket, retention_days, extension, label, now_ts
+            ):
+                summary[f"{bucket}_deleted"] += file_count
+                jobs_cleaned.add(job_id)
+
+        summary["jobs_cleaned"] = sorted(jobs_cleaned)
 
         logger.info(
             f"Cleanup completed: {summary['raw_pdfs_deleted']} raw PDFs, "
@@ -220,55 +350,120 @@ class StorageManager:
             f"{len(summary['jobs_cleaned'])} jobs"
         )
 
+        self._invalidate_stats()
         return summary
 
+    def _cleanup_bucket(
+        self,
+        bucket: str,
+        retention_days: int,
+        extension: str,
+        label: str,
+        now_ts: float,
+    ) -> list[tuple[int, int]]:
+        """
+        Delete job directories in one bucket that are past retention.
+
+        Uses os.scandir so directory type and mtime come from the listing
+        itself. Each expired job directory is listed once; that listing
+        gives the deleted file count and drives the (concurrent) deletion.
+
+        Args:
+            bucket: Bucket directory name under base_dir
+            retention_days: Days to keep a job directory
+            extension: File extension counted as deleted files
+            label: Human-readable file type for log messages
+            now_ts: Current time as a Unix timestamp
+
+        Returns:
+            List of (job_id, deleted file count) for each removed directory
+        """
+        cutoff = now_ts - retention_days * 86400
+        cleaned: list[tuple[int, int]] = []
+
+        expired: list[tuple[os.DirEntry, list[os.DirEntry], int, float]] = []
+        for entry in _iter_job_dirs(self._bucket_roots[bucket]):
+            # Check age based on directory modification time
+            mtime = entry.stat(follow_symlinks=False).st_mtime
+            if mtime >= cutoff:
+                continue
+
+            listing = _list_job_dir(entry.path, extension)
+            if listing is None:
+                continue
+            entries, file_count = listing
+            expired.append((entry, entries, file_count, mtime))
+
+        if not expired:
+            return cleaned
+
+        # Deletion is syscall-bound and releases the GIL, so remove the
+        # expired job directories in parallel
+        with ThreadPoolExecutor(
+            max_workers=min(CLEANUP_MAX_WORKERS, len(expired))
+        ) as pool:
+            list(
+                pool.map(
+                    _remove_listed_dir,
+                    [entry.path for entry, _, _, _ in expired],
+                    [entries for _, entries, _, _ in expired],
+                )
+            )
+
+        for entry, _, file_count, mtime in expired:
+            cleaned.append((int(entry.name), file_count))
+            logger.info(
+                f"Deleted {file_count} {label} from job {entry.name} "
+                f"(age: {int((now_ts - mtime) // 86400)} days)"
+            )
+
+        return cleaned
+
     # === Disk Usage ===
 
     def get_storage_stats(self) -> dict[str, Any]:
         """
         Get storage statistics.
 
+        Each bucket is walked once with os.scandir, concurrently with the
+        others (the scans are filesystem-bound), and the overall total is
+        summed from the bucket totals. The result is reused for
+        STORAGE_STATS_TTL seconds or until a cleanup runs.
+
         Returns:
             Dict with storage usage by type
         """
-
-        def get_dir_size(path: Path) -> int:
-            """Calculate total size of directory in bytes."""
-            if not path.exists():
-                return 0
-            return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
-
-        def count_files(path: Path) -> int:
-            """Count files in directory."""
-            if not path.exists():
-                return 0
-            return sum(1 for _ in path.rglob("*") if _.is_file())
-
-        raw_pdf_dir = self.base_dir / "raw_pdfs"
-        annotated_pdf_dir = self.base_dir / "annotated_pdfs"
-        artifacts_dir = self.base_dir / "artifacts"
-
-        return {
-            "raw_pdfs": {
-                "size_bytes": get_dir_size(raw_pdf_dir),
-                "file_count": count_files(raw_pdf_dir),
-                "job_count": len(list(raw_pdf_dir.iterdir()))
-                if raw_pdf_dir.exists()
-                else 0,
-            },
-            "annotated_pdfs": {
-                "size_bytes": get_dir_size(annotated_pdf_dir),
-                "file_count": count_files(annotated_pdf_dir),
-                "job_count": len(list(annotated_pdf_dir.iterdir()))
-                if annotated_pdf_dir.exists()
-                else 0,
-            },
-            "artifacts": {
-                "size_bytes": get_dir_size(artifacts_dir),
-                "file_count": count_files(artifacts_dir),
-                "job_count": len(list(artifacts_dir.iterdir()))
-                if artifacts_dir.exists()
-                else 0,
-            },
-            "total_size_bytes": get_dir_size(self.base_dir),
-        }
+        with self._stats_lock:
+            cached = self._stats_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        with ThreadPoolExecutor(max_workers=len(STORAGE_BUCKETS) + 1) as pool:
+            bucket_futures = {
+                bucket: pool.submit(_scan, root)
+                for bucket, root in self._bucket_roots.items()
+            }
+            # Only whatever lives outside the buckets needs a separate walk
+            other_future = pool.submit(_scan, self.base_dir, STORAGE_BUCKETS)
+
+            stats: dict[str, Any] = {}
+            total_size = other_future.result()[0]
+            for bucket, future in bucket_futures.items():
+                size_bytes, file_count, job_count = future.result()
+                stats[bucket] = {
+                    "size_bytes": size_bytes,
+                    "file_count": file_count,
+                    "job_count": job_count,
+                }
+                total_size += size_bytes
+            stats["total_size_bytes"] = total_size
+
+        with self._stats_lock:
+            self._stats_cache = (time.monotonic() + STORAGE_STATS_TTL, stats)
+
+        return stats
+
+    def _invalidate_stats(self) -> None:
+        """Drop the cached storage statistics after files are deleted."""
+        with self._stats_lock:
+            self._stats_cache = None
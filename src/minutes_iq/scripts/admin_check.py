@@ -1,10 +1,11 @@
 # admin_check.py
 """Module for checking admin status of users."""
 
-from minutes_iq.db.client import get_db_client
-
 
 def main():
+    # Imported here so loading this module does not read settings
+    from minutes_iq.db.client import get_db_client
+
     with get_db_client() as conn:
         rows = conn.execute(
             """
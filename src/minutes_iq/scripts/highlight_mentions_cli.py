@@ -9,12 +9,11 @@ Usage:
     python -m minutes_iq.scripts.highlight_mentions_cli
 """
 
-import glob
+import csv
 import os
+from collections import defaultdict
 from pathlib import Path
 
-import pandas as pd
-
 from minutes_iq.scraper.highlighter import batch_highlight_pdfs
 
 # === Root path ===
@@ -26,12 +25,21 @@ MENTIONS_DIR = BASE_DIR / "data" / "processed"
 
 def get_latest_csv() -> Path | None:
     """Find the most recent extracted_mentions CSV file."""
-    files = sorted(
-        glob.glob(str(MENTIONS_DIR / "extracted_mentions_*.csv")),
-        key=os.path.getmtime,
-        reverse=True,
-    )
-    return Path(files[0]) if files else None
+    try:
+        with os.scandir(MENTIONS_DIR) as it:
+            latest = max(
+                (
+                    entry
+                    for entry in it
+                    if entry.name.startswith("extracted_mentions_")
+                    and entry.name.endswith(".csv")
+                ),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return Path(latest.path) if latest else None
 
 
 def main():
@@ -48,34 +56,29 @@ def main():
 
     print(f"📄 Using mentions from: {csv_path.relative_to(BASE_DIR)}")
 
-    # Load CSV
-    try:
-        df = pd.read_csv(csv_path)
-    except pd.errors.EmptyDataError:
-        print("⚠️  CSV file is empty - no matches were found by the scraper.")
-        print(
-            "   Try adjusting the DATE_RANGE or keywords, or increasing MAX_SCAN_PAGES."
-        )
-        return 1
-
-    if df.empty:
+    # Load CSV, grouping matches by PDF in a single pass
+    matches_by_file: dict[str, list[dict]] = defaultdict(list)
+    with open(csv_path, newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None:
+            print("⚠️  CSV file is empty - no matches were found by the scraper.")
+            print(
+                "   Try adjusting the DATE_RANGE or keywords, or increasing MAX_SCAN_PAGES."
+            )
+            return 1
+
+        for row in reader:
+            matches_by_file[row["file"]].append(
+                {
+                    "page": int(row["page"]),
+                    "keyword": row["keyword"],
+                }
+            )
+
+    if not matches_by_file:
         print("⚠️  No mentions found in CSV file.")
         return 1
 
-    # Convert CSV data to matches format expected by highlighter
-    df["file"] = df["file"].astype(str)
-    matches_by_file = {}
-
-    for pdf_name in df["file"].unique():
-        pdf_matches = df[df["file"] == pdf_name]
-        matches_by_file[pdf_name] = [
-            {
-                "page": int(row["page"]),
-                "keyword": row["keyword"],
-            }
-            for _, row in pdf_matches.iterrows()
-        ]
-
     # Batch highlight PDFs using new highlighter module
     print(f"\n🖍️  Highlighting {len(matches_by_file)} PDFs...")
     results = batch_highlight_pdfs(
@@ -1,17 +1,17 @@
-"""Force update admin password - delete old and insert new"""
+"""Force update admin password - overwrite the stored hash in place"""
 
-from dotenv import load_dotenv
 
-# Load environment variables from .env file BEFORE importing settings
-load_dotenv()
+def force_update():
+    # Load environment variables from .env file BEFORE importing settings;
+    # both happen here so importing this module has no side effects
+    from dotenv import load_dotenv
 
-# ruff: noqa: E402
-from minutes_iq.auth.security import get_password_hash, verify_password
-from minutes_iq.config.settings import settings
-from minutes_iq.db.client import get_db_connection
+    load_dotenv()
 
+    from minutes_iq.auth.security import get_password_hash, verify_password
+    from minutes_iq.config.settings import settings
+    from minutes_iq.db.client import get_db_connection
 
-def force_update():
     print("🔧 Force updating admin password...\n")
 
     # Get password from .env
@@ -58,52 +58,33 @@ def force_update():
         old_verify = verify_password(plain_password, old_hash)
         print(f"   Old hash verifies with .env password: {old_verify}")
 
-        # Delete old credential
-        print("\n🗑️  Deleting old credential...")
-        cursor = conn.execute(
-            "DELETE FROM auth_credentials WHERE credential_id = ?", (credential_id,)
-        )
-        cursor.close()
-        conn.commit()
-
-        # Insert new credential
-        print("➕ Inserting new credential...")
+        # Write the new hash in place and read it back in the same statement
+        print("\n✏️  Updating credential...")
         cursor = conn.execute(
             """
-            INSERT INTO auth_credentials (provider_id, user_id, hashed_password, is_active)
-            SELECT ap.provider_id, u.user_id, ?, 1
-            FROM users u
-            CROSS JOIN auth_providers ap
-            WHERE u.username = 'admin' AND ap.provider_name = 'password'
+            UPDATE auth_credentials
+            SET hashed_password = ?, is_active = 1
+            WHERE credential_id = ?
+            RETURNING hashed_password
         """,
-            (new_hash,),
+            (new_hash, credential_id),
         )
-        cursor.close()
-        conn.commit()
-
-        # Verify it was inserted correctly
-        cursor = conn.execute("""
-            SELECT ac.hashed_password
-            FROM users u
-            JOIN auth_credentials ac ON u.user_id = ac.user_id
-            JOIN auth_providers ap ON ac.provider_id = ap.provider_id
-            WHERE u.username = 'admin' AND ap.provider_name = 'password'
-        """)
         result = cursor.fetchone()
         cursor.close()
+        conn.commit()
 
         if not result:
-            print("\n❌ ERROR: Failed to insert new credential!")
+            print("\n❌ ERROR: Failed to update credential!")
             return
 
-        inserted_hash = result[0]
+        stored_hash = result[0]
 
-        print("\n✅ New credential inserted!")
-        print(f"   Inserted hash: {inserted_hash[:50]}...")
-        print(f"   Hash matches what we generated: {inserted_hash == new_hash}")
+        print("\n✅ Credential updated!")
+        print(f"   Stored hash: {stored_hash[:50]}...")
+        print(f"   Hash matches what we generated: {stored_hash == new_hash}")
 
         # Final verification test
-        final_verify = verify_password(plain_password, inserted_hash)
+        final_verify = verify_password(plain_password, stored_hash)
         print(f"   Final verification test: {final_verify}")
 
         if final_verify:
@@ -1,10 +1,11 @@
 # schema_check.py
 """Module for checking schema of users table."""
 
-from minutes_iq.db.client import get_db_client
-
 
 def main():
+    # Imported here so loading this module does not read settings
+    from minutes_iq.db.client import get_db_client
+
     with get_db_client() as conn:
         rows = conn.execute("PRAGMA table_info(users);").fetchall()
         for row in rows:
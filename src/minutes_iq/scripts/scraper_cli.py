@@ -12,13 +12,13 @@ Configuration:
     Edit the constants below to adjust scraping behavior.
 """
 
+import csv
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
-
 from minutes_iq.scraper.core import scrape_pdf_links, stream_and_scan_pdf
 
 # === CONFIG ===
@@ -39,9 +39,12 @@ MAX_SCAN_PAGES = None  # Set to None to scan all pages, or an integer like 5
 DATE_RANGE = ("2024-01", "2025-12")  # YYYY-MM format strings
 INCLUDE_MINUTES = True
 INCLUDE_PACKAGES = True
+SCAN_WORKERS = 8  # PDFs downloaded and scanned concurrently
 
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 RESULT_CSV = RESULT_DIR / f"extracted_mentions_{timestamp}.csv"
+# highlight_mentions_cli reads this CSV and groups matches by the "file" column
+RESULT_FIELDS = ["file", "page", "keyword", "snippet", "entities"]
 
 
 def load_keywords(filepath: Path) -> list[str]:
@@ -93,13 +96,10 @@ def main():
         )
         all_pdf_links.extend(pdf_links)
 
-    # Remove duplicates
-    seen = set()
-    unique_links = []
-    for link_info in all_pdf_links:
-        if link_info["url"] not in seen:
-            seen.add(link_info["url"])
-            unique_links.append(link_info)
+    # Remove duplicates (dicts keep the order in which URLs were first seen)
+    unique_links = list(
+        {link_info["url"]: link_info for link_info in all_pdf_links}.values()
+    )
 
     print(
         f"📋 Found {len(unique_links)} PDFs in date range {DATE_RANGE[0]} to {DATE_RANGE[1]}"
@@ -118,45 +118,71 @@ def main():
             date_str = link_info["date_str"] or "[no date]"
             print(f"  - {link_info['filename']} → {date_str}")
 
-    # Scan PDFs for keywords
-    all_mentions = []
+    # Scan PDFs for keywords, appending matches to the CSV as they are found.
+    # Downloads are network-bound, so several PDFs are scanned at once and
+    # each result is handled here on the main thread as it completes.
+    total_matches = 0
     keyword_counts: dict[str, int] = defaultdict(int)
+    csv_file = None
+    writer = None
 
     print("\n🔎 Scanning and downloading PDFs with matches...")
-    for link_info in unique_links:
-        url = link_info["url"]
-        filename = link_info["filename"]
-        filepath = PDF_DIR / filename
-
-        # Scan PDF
-        matches, pdf_content, num_pages_scanned = stream_and_scan_pdf(
-            url=url,
-            keywords=keywords,
-            max_pages=MAX_SCAN_PAGES,
-        )
-
-        if matches and pdf_content is not None:
-            print(f"✅ Match found in {filename}, saving PDF...")
-            logging.info(f"Match found in {filename}, saved to disk.")
-
-            # Save PDF
-            with open(filepath, "wb") as f:
-                f.write(pdf_content)
-
-            # Collect matches
-            all_mentions.extend(matches)
-            for match in matches:
-                keyword_counts[match["keyword"]] += 1
-        else:
-            print(
-                f"⏩ No match in {num_pages_scanned} pages of {filename}, skipping..."
-            )
-            logging.info(f"No match in {filename}, skipped.")
-
-    # Save results to CSV
-    if all_mentions:
-        print(f"\n💾 Saving {len(all_mentions)} matches to CSV: {RESULT_CSV}")
-        pd.DataFrame(all_mentions).to_csv(RESULT_CSV, index=False)
+    try:
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            futures = {
+                pool.submit(
+                    stream_and_scan_pdf,
+                    url=link_info["url"],
+                    keywords=keywords,
+                    max_pages=MAX_SCAN_PAGES,
+                ): link_info
+                for link_info in unique_links
+            }
+            for future in as_completed(futures):
+                filename = futures[future]["filename"]
+                filepath = PDF_DIR / filename
+
+                # Next finished scan
+                matches, pdf_content, num_pages_scanned = future.result()
+
+                if matches and pdf_content is not None:
+                    print(f"✅ Match found in {filename}, saving PDF...")
+                    logging.info(f"Match found in {filename}, saved to disk.")
+
+                    # Save PDF
+                    with open(filepath, "wb") as f:
+                        f.write(pdf_content)
+
+                    # Write matches
+                    if writer is None:
+                        csv_file = open(RESULT_CSV, "w", newline="")
+                        writer = csv.DictWriter(csv_file, fieldnames=RESULT_FIELDS)
+                        writer.writeheader()
+                    writer.writerows(
+                        {
+                            "file": match["filename"],
+                            "page": match["page"],
+                            "keyword": match["keyword"],
+                            "snippet": match["snippet"],
+                            "entities": match["entities"],
+                        }
+                        for match in matches
+                    )
+                    total_matches += len(matches)
+                    for match in matches:
+                        keyword_counts[match["keyword"]] += 1
+                else:
+                    print(
+                        f"⏩ No match in {num_pages_scanned} pages of {filename}, skipping..."
+                    )
+                    logging.info(f"No match in {filename}, skipped.")
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+
+    # Summarize results
+    if total_matches:
+        print(f"\n💾 Saved {total_matches} matches to CSV: {RESULT_CSV}")
         logging.info(f"Results saved to {RESULT_CSV}")
 
         print("\n📊 Keyword Match Summary:")
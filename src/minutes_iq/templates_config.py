@@ -1,9 +1,134 @@
 """Templates configuration module to avoid circular imports."""
 
+import hashlib
 from pathlib import Path
+from typing import Any
 
+import jinja2
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from minutes_iq.config.settings import settings
+from minutes_iq.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    content_etag,
+    etag_matches,
+)
+from minutes_iq.ttl_cache import TTLCache
+
 # Set up templates path
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+TEMPLATES_DIR = BASE_DIR / "templates"
+
+# Templates only change with a deploy in production, so skip the per-render
+# source mtime checks and keep compiled bytecode across worker restarts
+_production = settings.app.env == "production"
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        auto_reload=not _production,
+        bytecode_cache=jinja2.FileSystemBytecodeCache() if _production else None,
+        cache_size=400,
+    )
+)
+
+
+def _templates_version() -> str:
+    """Hash the template sources so page ETags change when templates do."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(TEMPLATES_DIR.rglob("*.html")):
+        digest.update(str(path.relative_to(TEMPLATES_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+TEMPLATES_VERSION = _templates_version()
+
+# Rendered shell pages (ETag -> HTML bytes); query strings and per-user
+# contexts make the key space open-ended, so the cache is bounded
+SHELL_PAGE_CACHE_SIZE = 64
+_shell_pages: TTLCache[str, bytes] = TTLCache(SHELL_PAGE_CACHE_SIZE)
+
+
+def _page_etag(request: Request, name: str, context: dict[str, Any]) -> str:
+    """Build the ETag for a page from its template, URL and context."""
+    return content_etag(
+        TEMPLATES_VERSION,
+        name,
+        str(request.url),
+        [(key, value) for key, value in context.items() if key != "request"],
+    )
+
+
+def conditional_template_response(
+    request: Request,
+    name: str,
+    context: dict[str, Any],
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response:
+    """
+    Render a template, or answer 304 if the client's copy is still current.
+
+    The ETag covers the template sources, the URL and every context value
+    other than the request, so a matching If-None-Match skips rendering.
+    Otherwise the template is rendered straight into an HTMLResponse,
+    without the extra bookkeeping TemplateResponse does for test clients.
+
+    Args:
+        request: The incoming request
+        name: Template name
+        context: Template context (must include "request")
+        cache_control: Cache-Control header value
+
+    Returns:
+        A 304 Response, or an HTMLResponse with ETag headers
+    """
+    etag = _page_etag(request, name, context)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = templates.get_template(name).render(context)
+    return HTMLResponse(body, headers=headers)
+
+
+def shell_template_response(
+    request: Request, name: str, context: dict[str, Any] | None = None
+) -> Response:
+    """
+    Serve a page rendered from the request and a small context, rendering it
+    once per ETag.
+
+    Shell pages load their data client-side, so their HTML only changes
+    with the templates, the URL or the given context (e.g. the signed-in
+    user); the rendered body is kept (keyed by ETag) and reused.
+
+    Args:
+        request: The incoming request
+        name: Template name
+        context: Extra template context, without "request"
+
+    Returns:
+        A 304 Response, or an HTMLResponse with ETag headers
+    """
+    context = context or {}
+    etag = _page_etag(request, name, context)
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = _shell_pages.get(etag)
+
+    if body is None:
+        body = (
+            templates.get_template(name)
+            .render({"request": request, **context})
+            .encode()
+        )
+        _shell_pages.set(etag, body)
+
+    return HTMLResponse(body, headers=headers)
@@ -0,0 +1,76 @@
+"""Small bounded in-process cache with per-entry expiry."""
+
+import threading
+import time
+
+
+class TTLCache[K, V]:
+    """
+    Thread-safe key/value cache holding at most ``max_size`` entries.
+
+    Entries may carry a time-to-live; expired entries are dropped when read.
+    Storing into a full cache evicts the least recently stored entry.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        # key -> (expires_at or None, value); dicts keep insertion order,
+        # so the first key is always the least recently stored one
+        self._entries: dict[K, tuple[float | None, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Return the cached value for a key.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The value, or None if it is missing or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Seconds until the entry expires, or None to keep it until
+                it is evicted
+        """
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (expires_at, value)
+
+    def pop(self, key: K) -> None:
+        """
+        Drop the entry for a key, if any.
+
+        Args:
+            key: The cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -4,12 +4,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from minutes_iq.auth.dependencies import get_current_user
+from minutes_iq.templates_config import shell_template_response
 
 router = APIRouter(prefix="/profile", tags=["Profile UI"])
-templates = Jinja2Templates(directory="src/minutes_iq/templates")
 
 
 @router.get("", response_class=HTMLResponse)
@@ -20,10 +19,10 @@ async def profile_page(
     """Render the user profile page."""
     # Note: created_at field doesn't exist in users table
     # Will display "Date unavailable" in template
-    return templates.TemplateResponse(
+    return shell_template_response(
+        request,
         "profile/profile.html",
         {
-            "request": request,
             "current_user": current_user,
             "created_at": None,  # TODO: Add when created_at column is added to users table
         },
@@ -36,10 +35,6 @@ async def edit_profile_page(
     current_user: Annotated[dict, Depends(get_current_user)],
 ):
     """Render the edit profile page."""
-    return templates.TemplateResponse(
-        "profile/profile_edit.html",
-        {
-            "request": request,
-            "current_user": current_user,
-        },
+    return shell_template_response(
+        request, "profile/profile_edit.html", {"current_user": current_user}
     )
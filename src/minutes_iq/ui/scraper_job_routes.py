@@ -1,89 +1,61 @@
 """UI routes for scraper job management pages."""
 
-from datetime import datetime
+import time
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
 
-from minutes_iq.db.client_repository import ClientRepository
-from minutes_iq.db.client_url_repository import ClientUrlRepository
-from minutes_iq.db.dependencies import (
-    get_client_repository,
-    get_client_url_repository,
-    get_scraper_repository,
-)
+from minutes_iq.db.dependencies import get_scraper_repository
 from minutes_iq.db.scraper_repository import ScraperRepository
-from minutes_iq.templates_config import templates
+from minutes_iq.http_cache import DETAIL_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+from minutes_iq.scraper.schemas import TERMINAL_STATUSES
+from minutes_iq.templates_config import (
+    conditional_template_response,
+    shell_template_response,
+)
 
 router = APIRouter(prefix="/scraper/jobs", tags=["Scraper Job UI"])
 
 
+def _format_timestamp(ts: int | None) -> str | None:
+    """Format a Unix timestamp as local time, or None if unset."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)) if ts else None
+
+
 @router.get("", response_class=HTMLResponse)
 async def jobs_list(request: Request):
     """Render scraper jobs list page."""
-    return templates.TemplateResponse("scraper/jobs_list.html", {"request": request})
+    return shell_template_response(request, "scraper/jobs_list.html")
 
 
 @router.get("/new", response_class=HTMLResponse)
 async def job_create(request: Request):
     """Render scrape job creation form."""
-    return templates.TemplateResponse("scraper/job_create.html", {"request": request})
+    return shell_template_response(request, "scraper/job_create.html")
 
 
 @router.get("/{job_id}", response_class=HTMLResponse)
-async def job_detail(
+def job_detail(
     request: Request,
     job_id: int,
     scraper_repo: Annotated[ScraperRepository, Depends(get_scraper_repository)],
-    client_repo: Annotated[ClientRepository, Depends(get_client_repository)],
-    client_url_repo: Annotated[ClientUrlRepository, Depends(get_client_url_repository)],
 ):
     """Render scrape job detail page."""
-    job = scraper_repo.get_job(job_id)
+    # Job, config and client name come back from a single query
+    job = scraper_repo.get_job_with_config_and_client(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    config = scraper_repo.get_job_config(job_id)
-
-    # Get client name from client_url
-    client_url = client_url_repo.get_url(job["client_url_id"])
-    if client_url:
-        client = client_repo.get_client_by_id(client_url["client_id"])
-        client_name = client.get("name", "Unknown") if client else "Unknown"
-        client_id = client_url["client_id"]
-    else:
-        client_name = "Unknown"
-        client_id = None
-
-    # Format timestamps
-    created_at_formatted = (
-        datetime.fromtimestamp(job["created_at"]).strftime("%Y-%m-%d %H:%M:%S")
-        if job.get("created_at")
-        else "Unknown"
-    )
-    started_at_formatted = (
-        datetime.fromtimestamp(job["started_at"]).strftime("%Y-%m-%d %H:%M:%S")
-        if job.get("started_at")
-        else None
-    )
-    completed_at_formatted = (
-        datetime.fromtimestamp(job["completed_at"]).strftime("%Y-%m-%d %H:%M:%S")
-        if job.get("completed_at")
-        else None
-    )
+    config = job["config"]
+    client_id = job["client_id"]
+    client_name = job["client_name"] or "Unknown"
 
     # Calculate duration
     duration = None
-    if job.get("started_at") and job.get("completed_at"):
-        elapsed = job["completed_at"] - job["started_at"]
-        minutes = elapsed // 60
-        seconds = elapsed % 60
-        duration = f"{minutes}m {seconds}s"
-    elif job.get("started_at"):
-        elapsed = int(datetime.now().timestamp()) - job["started_at"]
-        minutes = elapsed // 60
-        seconds = elapsed % 60
+    if job.get("started_at"):
+        end_ts = job.get("completed_at") or int(time.time())
+        minutes, seconds = divmod(end_ts - job["started_at"], 60)
         duration = f"{minutes}m {seconds}s"
 
     # Build context
@@ -95,11 +67,12 @@ async def job_detail(
             "client_name": client_name,
             "status": job["status"],
             "created_at": job.get("created_at"),
-            "created_at_formatted": created_at_formatted,
+            "created_at_formatted": _format_timestamp(job.get("created_at"))
+            or "Unknown",
             "started_at": job.get("started_at"),
-            "started_at_formatted": started_at_formatted,
+            "started_at_formatted": _format_timestamp(job.get("started_at")),
             "completed_at": job.get("completed_at"),
-            "completed_at_formatted": completed_at_formatted,
+            "completed_at_formatted": _format_timestamp(job.get("completed_at")),
             "duration": duration,
             "error_message": job.get("error_message"),
             "start_date": config.get("date_range_start", "Unknown")
@@ -115,4 +88,12 @@ async def job_detail(
         },
     }
 
-    return templates.TemplateResponse("scraper/job_detail.html", context)
+    # A finished job's page no longer changes, so browsers may reuse it briefly
+    cache_control = (
+        DETAIL_CACHE_CONTROL
+        if job["status"] in TERMINAL_STATUSES
+        else REVALIDATE_CACHE_CONTROL
+    )
+    return conditional_template_response(
+        request, "scraper/job_detail.html", context, cache_control=cache_control
+    )
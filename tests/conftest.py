@@ -2,23 +2,284 @@
 Shared pytest fixtures for all tests.
 """
 
+import functools
 import os
 import tempfile
 from collections.abc import Generator
+from datetime import timedelta
 
 import pytest
 from fastapi.testclient import TestClient
 from libsql_experimental import connect
+from passlib.context import CryptContext
 
-from minutes_iq.auth.security import get_password_hash
+from minutes_iq.auth import security
+from minutes_iq.auth.security import create_access_token, get_password_hash
 from minutes_iq.config.settings import settings
 from minutes_iq.main import app
 
+# bcrypt at its production cost dominates auth test time, so the suite hashes
+# at the minimum cost (4 rounds) instead
+_TEST_PWD_CONTEXT = CryptContext(
+    schemes=["bcrypt"], bcrypt__default_rounds=4, deprecated="auto"
+)
+
+# bcrypt is deliberately slow, so fixture passwords are hashed once per session
+_SECRET_HASH = _TEST_PWD_CONTEXT.hash("secret")
+_ADMIN_HASH = _TEST_PWD_CONTEXT.hash("adminpass")
+
+# Fixed admin user id so one admin token serves the whole session. users
+# uses AUTOINCREMENT, so inserting this id moves sqlite_sequence to it and
+# later users get larger ids; AUTOINCREMENT never reuses a value, so no
+# other user can be assigned it.
+_ADMIN_USER_ID = 1_000_000
+
+# Test schema and reference data, applied with a single executescript call
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS roles (
+    role_id INTEGER PRIMARY KEY,
+    role_name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL UNIQUE,
+    role_id INTEGER NOT NULL,
+    FOREIGN KEY (role_id) REFERENCES roles(role_id)
+);
+CREATE TABLE IF NOT EXISTS auth_providers (
+    provider_id INTEGER PRIMARY KEY,
+    provider_name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS auth_credentials (
+    credential_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    provider_id INTEGER NOT NULL,
+    hashed_password TEXT NOT NULL,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    FOREIGN KEY (user_id) REFERENCES users(user_id),
+    FOREIGN KEY (provider_id) REFERENCES auth_providers(provider_id)
+);
+
+-- Create auth_codes table (Phase 3)
+CREATE TABLE IF NOT EXISTS auth_codes (
+    code_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    code TEXT NOT NULL UNIQUE,
+    created_by INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    expires_at INTEGER,
+    max_uses INTEGER DEFAULT 1,
+    current_uses INTEGER DEFAULT 0,
+    is_active INTEGER DEFAULT 1,
+    notes TEXT,
+    FOREIGN KEY (created_by) REFERENCES users(user_id)
+);
+
+-- Create code_usage table (Phase 3)
+CREATE TABLE IF NOT EXISTS code_usage (
+    usage_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    code_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    used_at INTEGER NOT NULL,
+    FOREIGN KEY (code_id) REFERENCES auth_codes(code_id),
+    FOREIGN KEY (user_id) REFERENCES users(user_id)
+);
+
+-- Create password_reset_tokens table (Phase 4)
+CREATE TABLE IF NOT EXISTS password_reset_tokens (
+    token_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    token_hash TEXT NOT NULL UNIQUE,
+    created_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL,
+    used_at INTEGER,
+    is_valid INTEGER NOT NULL DEFAULT 1,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+
+-- Create client table (Phase 5) - singular to match production code
+CREATE TABLE IF NOT EXISTS client (
+    client_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    created_at INTEGER NOT NULL,
+    created_by INTEGER NOT NULL,
+    updated_at INTEGER,
+    FOREIGN KEY (created_by) REFERENCES users(user_id)
+);
+
+-- Create client_urls table (Phase 5 - Multi-URL support)
+CREATE TABLE IF NOT EXISTS client_urls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id INTEGER NOT NULL,
+    alias TEXT NOT NULL,
+    url TEXT NOT NULL,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    last_scraped_at INTEGER,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER,
+    FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE
+);
+
+-- Create indexes for client_urls
+CREATE INDEX IF NOT EXISTS idx_client_urls_client_id
+ON client_urls(client_id);
+CREATE INDEX IF NOT EXISTS idx_client_urls_alias
+ON client_urls(alias);
+
+-- Create keywords table (Phase 5)
+CREATE TABLE IF NOT EXISTS keywords (
+    keyword_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL UNIQUE,
+    category TEXT,
+    description TEXT,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    created_at INTEGER NOT NULL,
+    created_by INTEGER NOT NULL,
+    FOREIGN KEY (created_by) REFERENCES users(user_id)
+);
+
+-- Create client_keywords table (Phase 5)
+CREATE TABLE IF NOT EXISTS client_keywords (
+    client_id INTEGER NOT NULL,
+    keyword_id INTEGER NOT NULL,
+    added_at INTEGER NOT NULL,
+    added_by INTEGER NOT NULL,
+    PRIMARY KEY (client_id, keyword_id),
+    FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE,
+    FOREIGN KEY (keyword_id) REFERENCES keywords(keyword_id) ON DELETE CASCADE,
+    FOREIGN KEY (added_by) REFERENCES users(user_id)
+);
+
+-- Create user_client_favorites table (Phase 5)
+CREATE TABLE IF NOT EXISTS user_client_favorites (
+    user_id INTEGER NOT NULL,
+    client_id INTEGER NOT NULL,
+    favorited_at INTEGER NOT NULL,
+    PRIMARY KEY (user_id, client_id),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE
+);
+
+-- Create client_sources table (Phase 5)
+CREATE TABLE IF NOT EXISTS client_sources (
+    source_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id INTEGER NOT NULL,
+    source_name TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    source_type TEXT,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    scrape_frequency TEXT,
+    last_scraped_at INTEGER,
+    created_at INTEGER NOT NULL,
+    created_by INTEGER NOT NULL,
+    FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE,
+    FOREIGN KEY (created_by) REFERENCES users(user_id)
+);
+
+-- Create scrape_jobs table (Phase 6)
+CREATE TABLE IF NOT EXISTS scrape_jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_url_id INTEGER NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('pending', 'running', 'completed', 'failed', 'cancelled')),
+    created_by INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    started_at INTEGER,
+    completed_at INTEGER,
+    error_message TEXT,
+    FOREIGN KEY (client_url_id) REFERENCES client_urls(id) ON DELETE RESTRICT,
+    FOREIGN KEY (created_by) REFERENCES users(user_id) ON DELETE RESTRICT
+);
+
+-- Create scrape_job_config table (Phase 6)
+CREATE TABLE IF NOT EXISTS scrape_job_config (
+    config_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL UNIQUE,
+    date_range_start TEXT,
+    date_range_end TEXT,
+    max_scan_pages INTEGER,
+    include_minutes INTEGER NOT NULL DEFAULT 1,
+    include_packages INTEGER NOT NULL DEFAULT 1,
+    FOREIGN KEY (job_id) REFERENCES scrape_jobs(job_id) ON DELETE CASCADE
+);
+
+-- Create scrape_results table (Phase 6)
+CREATE TABLE IF NOT EXISTS scrape_results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL,
+    pdf_filename TEXT NOT NULL,
+    page_number INTEGER NOT NULL,
+    keyword_id INTEGER NOT NULL,
+    snippet TEXT NOT NULL,
+    entities_json TEXT,
+    created_at INTEGER NOT NULL,
+    FOREIGN KEY (job_id) REFERENCES scrape_jobs(job_id) ON DELETE CASCADE,
+    FOREIGN KEY (keyword_id) REFERENCES keywords(keyword_id) ON DELETE RESTRICT
+);
+
+-- Seed reference data
+INSERT OR IGNORE INTO roles (role_id, role_name) VALUES (1, 'admin');
+INSERT OR IGNORE INTO roles (role_id, role_name) VALUES (2, 'user');
+INSERT OR IGNORE INTO auth_providers (provider_id, provider_name) VALUES (1, 'password');
+"""
+
+
+# Per-test cleanup in one transaction, child tables first so foreign keys
+# are never violated
+_CLEANUP_SQL = """
+BEGIN;
+DELETE FROM scrape_results;
+DELETE FROM scrape_job_config;
+DELETE FROM scrape_jobs;
+DELETE FROM client_sources;
+DELETE FROM client_urls;
+DELETE FROM user_client_favorites;
+DELETE FROM client_keywords;
+DELETE FROM keywords;
+DELETE FROM client;
+DELETE FROM password_reset_tokens;
+DELETE FROM code_usage;
+DELETE FROM auth_codes;
+DELETE FROM auth_credentials;
+DELETE FROM users;
+COMMIT;
+"""
+
+# Tests never need crash durability, so skip journal files and fsyncs
+_TEST_PRAGMAS = """
+PRAGMA journal_mode=MEMORY;
+PRAGMA synchronous=OFF;
+PRAGMA temp_store=MEMORY;
+"""
+
+
+def _connect(db_file: str):
+    """Open a connection to the test database with durability turned off."""
+    conn = connect(f"file:{db_file}")
+    conn.executescript(_TEST_PRAGMAS)
+    return conn
+
+
+def _fast_db_client():
+    """Open a pooled app connection with durability turned off."""
+    conn = connect(settings.database.db_url, auth_token=settings.database.auth_token)
+    conn.executescript(_TEST_PRAGMAS)
+    return conn
+
 
 @pytest.fixture(scope="session")
 def test_db_file() -> Generator[str, None, None]:
-    """Create a temporary database file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".db", delete=False) as f:
+    """
+    Create a temporary database file for testing.
+
+    Each pytest-xdist worker gets its own file, so tests can run with
+    ``-n auto`` without sharing database state.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    with tempfile.NamedTemporaryFile(
+        mode="w", prefix=f"minutes_iq_{worker}_", suffix=".db", delete=False
+    ) as f:
         db_path = f.name
 
     yield db_path
@@ -34,247 +295,27 @@ def test_db_connection(test_db_file):
     Create a test database with schema.
     This is session-scoped to avoid recreating the schema for every test.
     """
-    conn = connect(f"file:{test_db_file}")
-
-    # Create schema
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS roles (
-            role_id INTEGER PRIMARY KEY,
-            role_name TEXT NOT NULL UNIQUE
-        );
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL UNIQUE,
-            email TEXT NOT NULL UNIQUE,
-            role_id INTEGER NOT NULL,
-            FOREIGN KEY (role_id) REFERENCES roles(role_id)
-        );
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS auth_providers (
-            provider_id INTEGER PRIMARY KEY,
-            provider_name TEXT NOT NULL UNIQUE
-        );
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS auth_credentials (
-            credential_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            provider_id INTEGER NOT NULL,
-            hashed_password TEXT NOT NULL,
-            is_active INTEGER NOT NULL DEFAULT 1,
-            FOREIGN KEY (user_id) REFERENCES users(user_id),
-            FOREIGN KEY (provider_id) REFERENCES auth_providers(provider_id)
-        );
-    """)
-
-    # Create auth_codes table (Phase 3)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS auth_codes (
-            code_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            code TEXT NOT NULL UNIQUE,
-            created_by INTEGER NOT NULL,
-            created_at INTEGER NOT NULL,
-            expires_at INTEGER,
-            max_uses INTEGER DEFAULT 1,
-            current_uses INTEGER DEFAULT 0,
-            is_active INTEGER DEFAULT 1,
-            notes TEXT,
-            FOREIGN KEY (created_by) REFERENCES users(user_id)
-        );
-    """)
-
-    # Create code_usage table (Phase 3)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS code_usage (
-            usage_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            code_id INTEGER NOT NULL,
-            user_id INTEGER NOT NULL,
-            used_at INTEGER NOT NULL,
-            FOREIGN KEY (code_id) REFERENCES auth_codes(code_id),
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        );
-    """)
-
-    # Create password_reset_tokens table (Phase 4)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS password_reset_tokens (
-            token_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            token_hash TEXT NOT NULL UNIQUE,
-            created_at INTEGER NOT NULL,
-            expires_at INTEGER NOT NULL,
-            used_at INTEGER,
-            is_valid INTEGER NOT NULL DEFAULT 1,
-            FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-        );
-    """)
-
-    # Create client table (Phase 5) - singular to match production code
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS client (
-            client_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            description TEXT,
-            is_active INTEGER NOT NULL DEFAULT 1,
-            created_at INTEGER NOT NULL,
-            created_by INTEGER NOT NULL,
-            updated_at INTEGER,
-            FOREIGN KEY (created_by) REFERENCES users(user_id)
-        );
-    """)
-
-    # Create client_urls table (Phase 5 - Multi-URL support)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS client_urls (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id INTEGER NOT NULL,
-            alias TEXT NOT NULL,
-            url TEXT NOT NULL,
-            is_active INTEGER NOT NULL DEFAULT 1,
-            last_scraped_at INTEGER,
-            created_at INTEGER NOT NULL,
-            updated_at INTEGER,
-            FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE
-        );
-    """)
-
-    # Create indexes for client_urls
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_client_urls_client_id
-        ON client_urls(client_id);
-    """)
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_client_urls_alias
-        ON client_urls(alias);
-    """)
-
-    # Create keywords table (Phase 5)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS keywords (
-            keyword_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            keyword TEXT NOT NULL UNIQUE,
-            category TEXT,
-            description TEXT,
-            is_active INTEGER NOT NULL DEFAULT 1,
-            created_at INTEGER NOT NULL,
-            created_by INTEGER NOT NULL,
-            FOREIGN KEY (created_by) REFERENCES users(user_id)
-        );
-    """)
-
-    # Create client_keywords table (Phase 5)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS client_keywords (
-            client_id INTEGER NOT NULL,
-            keyword_id INTEGER NOT NULL,
-            added_at INTEGER NOT NULL,
-            added_by INTEGER NOT NULL,
-            PRIMARY KEY (client_id, keyword_id),
-            FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE,
-            FOREIGN KEY (keyword_id) REFERENCES keywords(keyword_id) ON DELETE CASCADE,
-            FOREIGN KEY (added_by) REFERENCES users(user_id)
-        );
-    """)
-
-    # Create user_client_favorites table (Phase 5)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS user_client_favorites (
-            user_id INTEGER NOT NULL,
-            client_id INTEGER NOT NULL,
-            favorited_at INTEGER NOT NULL,
-            PRIMARY KEY (user_id, client_id),
-            FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
-            FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE
-        );
-    """)
-
-    # Create client_sources table (Phase 5)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS client_sources (
-            source_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id INTEGER NOT NULL,
-            source_name TEXT NOT NULL,
-            source_url TEXT NOT NULL,
-            source_type TEXT,
-            is_active INTEGER NOT NULL DEFAULT 1,
-            scrape_frequency TEXT,
-            last_scraped_at INTEGER,
-            created_at INTEGER NOT NULL,
-            created_by INTEGER NOT NULL,
-            FOREIGN KEY (client_id) REFERENCES client(client_id) ON DELETE CASCADE,
-            FOREIGN KEY (created_by) REFERENCES users(user_id)
-        );
-    """)
-
-    # Create scrape_jobs table (Phase 6)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS scrape_jobs (
-            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_url_id INTEGER NOT NULL,
-            status TEXT NOT NULL CHECK (status IN ('pending', 'running', 'completed', 'failed', 'cancelled')),
-            created_by INTEGER NOT NULL,
-            created_at INTEGER NOT NULL,
-            started_at INTEGER,
-            completed_at INTEGER,
-            error_message TEXT,
-            FOREIGN KEY (client_url_id) REFERENCES client_urls(id) ON DELETE RESTRICT,
-            FOREIGN KEY (created_by) REFERENCES users(user_id) ON DELETE RESTRICT
-        );
-    """)
-
-    # Create scrape_job_config table (Phase 6)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS scrape_job_config (
-            config_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id INTEGER NOT NULL UNIQUE,
-            date_range_start TEXT,
-            date_range_end TEXT,
-            max_scan_pages INTEGER,
-            include_minutes INTEGER NOT NULL DEFAULT 1,
-            include_packages INTEGER NOT NULL DEFAULT 1,
-            FOREIGN KEY (job_id) REFERENCES scrape_jobs(job_id) ON DELETE CASCADE
-        );
-    """)
-
-    # Create scrape_results table (Phase 6)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS scrape_results (
-            result_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id INTEGER NOT NULL,
-            pdf_filename TEXT NOT NULL,
-            page_number INTEGER NOT NULL,
-            keyword_id INTEGER NOT NULL,
-            snippet TEXT NOT NULL,
-            entities_json TEXT,
-            created_at INTEGER NOT NULL,
-            FOREIGN KEY (job_id) REFERENCES scrape_jobs(job_id) ON DELETE CASCADE,
-            FOREIGN KEY (keyword_id) REFERENCES keywords(keyword_id) ON DELETE RESTRICT
-        );
-    """)
-
-    # Seed reference data
-    conn.execute(
-        "INSERT OR IGNORE INTO roles (role_id, role_name) VALUES (1, 'admin');"
-    )
-    conn.execute("INSERT OR IGNORE INTO roles (role_id, role_name) VALUES (2, 'user');")
-    conn.execute(
-        "INSERT OR IGNORE INTO auth_providers (provider_id, provider_name) VALUES (1, 'password');"
-    )
-
+    conn = _connect(test_db_file)
+    conn.executescript(_SCHEMA_SQL)
     conn.commit()
     conn.close()
 
     return test_db_file
 
 
+@pytest.fixture(scope="session")
+def _shared_conn(test_db_connection):
+    """
+    Open one connection to the test database for the whole session.
+    Fixtures reuse it instead of reconnecting for every test.
+    """
+    conn = _connect(test_db_connection)
+    yield conn
+    conn.close()
+
+
 @pytest.fixture(autouse=True)
-def setup_test_db(test_db_connection, monkeypatch):
+def setup_test_db(test_db_connection, _shared_conn, monkeypatch):
     """
     Setup test database for all tests.
     Monkeypatches the db client to use the test database.
@@ -283,7 +324,7 @@ def setup_test_db(test_db_connection, monkeypatch):
 
     def mock_get_db_connection():
         """Return a connection to the test database."""
-        conn = connect(f"file:{test_db_connection}")
+        conn = _connect(test_db_connection)
         try:
             yield conn
         finally:
@@ -293,82 +334,75 @@ def setup_test_db(test_db_connection, monkeypatch):
     monkeypatch.setattr(
         "minutes_iq.db.client.get_db_connection", mock_get_db_connection
     )
+    # Connections the app's pool opens skip fsyncs too
+    monkeypatch.setattr("minutes_iq.db.client.get_db_client", _fast_db_client)
 
     # Also patch the database URL in settings
     monkeypatch.setattr(settings.database, "db_url", f"file:{test_db_connection}")
 
-    # Clean database before each test (order matters for foreign keys)
-    conn = connect(f"file:{test_db_connection}")
-    conn.execute("DELETE FROM scrape_results;")
-    conn.execute("DELETE FROM scrape_job_config;")
-    conn.execute("DELETE FROM scrape_jobs;")
-    conn.execute("DELETE FROM client_sources;")
-    conn.execute("DELETE FROM client_urls;")
-    conn.execute("DELETE FROM user_client_favorites;")
-    conn.execute("DELETE FROM client_keywords;")
-    conn.execute("DELETE FROM keywords;")
-    conn.execute("DELETE FROM client;")
-    conn.execute("DELETE FROM password_reset_tokens;")
-    conn.execute("DELETE FROM code_usage;")
-    conn.execute("DELETE FROM auth_codes;")
-    conn.execute("DELETE FROM auth_credentials;")
-    conn.execute("DELETE FROM users;")
-    conn.commit()
-    conn.close()
+    # Clean database before each test
+    _shared_conn.executescript(_CLEANUP_SQL)
 
 
 @pytest.fixture
-def db_connection(test_db_connection):
+def db_connection(_shared_conn):
     """Provide a database connection for tests that need direct DB access."""
-    conn = connect(f"file:{test_db_connection}")
-    yield conn
-    conn.close()
+    yield _shared_conn
+    # Don't carry a test's uncommitted work into the next one
+    if _shared_conn.in_transaction:
+        _shared_conn.rollback()
 
 
 @pytest.fixture
-def clean_db(test_db_connection):
+def clean_db(_shared_conn):
     """Clean the database before a test (explicit fixture for tests that need it)."""
-    conn = connect(f"file:{test_db_connection}")
-    conn.execute("DELETE FROM scrape_results;")
-    conn.execute("DELETE FROM scrape_job_config;")
-    conn.execute("DELETE FROM scrape_jobs;")
-    conn.execute("DELETE FROM client_sources;")
-    conn.execute("DELETE FROM user_client_favorites;")
-    conn.execute("DELETE FROM client_keywords;")
-    conn.execute("DELETE FROM keywords;")
-    conn.execute("DELETE FROM clients;")
-    conn.execute("DELETE FROM password_reset_tokens;")
-    conn.execute("DELETE FROM code_usage;")
-    conn.execute("DELETE FROM auth_codes;")
-    conn.execute("DELETE FROM auth_credentials;")
-    conn.execute("DELETE FROM users;")
-    conn.commit()
-    conn.close()
+    _shared_conn.executescript(_CLEANUP_SQL)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_password_context():
+    """
+    Hash passwords at the minimum bcrypt cost for the whole session, and
+    remember verify results. Fixture passwords are hashed once, so repeated
+    logins with the same password and stored hash only pay for bcrypt the
+    first time.
+    """
+    verify = _TEST_PWD_CONTEXT.verify
+    results: dict[tuple[str, str], bool] = {}
+
+    def cached_verify(secret, hash, **kwds):
+        key = (secret, hash)
+        if key not in results:
+            results[key] = verify(secret, hash, **kwds)
+        return results[key]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_TEST_PWD_CONTEXT, "verify", cached_verify)
+        mp.setattr(security, "pwd_context", _TEST_PWD_CONTEXT)
+        yield
+
+
+@pytest.fixture(scope="session")
+def cached_password_hash():
+    """Hash each distinct fixture password once per session."""
+    return functools.lru_cache(maxsize=None)(get_password_hash)
 
 
 @pytest.fixture
-def test_user(test_db_connection):
+def test_user(_shared_conn):
     """Create a test user in the database."""
-    conn = connect(f"file:{test_db_connection}")
+    conn = _shared_conn
 
-    # Create user
-    cursor = conn.execute(
+    # Create user and password credential
+    user_id = conn.execute(
         "INSERT INTO users (username, email, role_id) VALUES (?, ?, ?) RETURNING user_id;",
         ("testuser", "test@example.com", 2),
-    )
-    user_id = cursor.fetchone()[0]
-    cursor.close()  # Close cursor before next statement
-
-    # Create password credential
-    hashed_password = get_password_hash("secret")
-    cursor2 = conn.execute(
+    ).fetchone()[0]
+    conn.execute(
         "INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active) VALUES (?, ?, ?, ?);",
-        (user_id, 1, hashed_password, 1),
+        (user_id, 1, _SECRET_HASH, 1),
     )
-    cursor2.close()  # Close cursor before commit
-
     conn.commit()
-    conn.close()
 
     return {
         "user_id": user_id,
@@ -379,10 +413,28 @@ def test_user(test_db_connection):
     }
 
 
+@pytest.fixture(scope="session")
+def _session_client(test_db_connection):
+    """
+    Build the TestClient once; the client fixture resets it per test.
+
+    Entering the client keeps one event loop portal open for the session,
+    so requests do not each start a new loop thread. The app's startup
+    warm-up and shutdown run outside any test, so the test database is
+    patched in for them here.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings.database, "db_url", f"file:{test_db_connection}")
+        mp.setattr("minutes_iq.db.client.get_db_client", _fast_db_client)
+        with TestClient(app) as test_client:
+            yield test_client
+
+
 @pytest.fixture
-def client():
-    """Create a test client with the test database."""
-    return TestClient(app)
+def client(_session_client):
+    """Provide the test client with no cookies left over from earlier tests."""
+    _session_client.cookies.clear()
+    return _session_client
 
 
 @pytest.fixture
@@ -391,43 +443,40 @@ def test_user_credentials():
     return {"username": "testuser", "password": "secret"}
 
 
+@pytest.fixture(scope="session")
+def _admin_session_token():
+    """Mint the admin JWT once; admin_token re-creates the user it refers to."""
+    return create_access_token(
+        data={"sub": str(_ADMIN_USER_ID)}, expires_delta=timedelta(days=1)
+    )
+
+
 @pytest.fixture
-def admin_token(client: TestClient, test_db_connection):
+def admin_token(_shared_conn, _admin_session_token):
     """Create an admin user and return their auth token."""
-    from minutes_iq.auth.security import get_password_hash
+    conn = _shared_conn
 
-    conn = connect(f"file:{test_db_connection}")
-
-    # Create admin user (role_id=1 is admin)
-    hashed_password = get_password_hash("adminpass")
-    cursor = conn.execute(
-        "INSERT INTO users (username, email, role_id) VALUES (?, ?, ?);",
-        ("admin", "admin@example.com", 1),
+    # Create admin user (role_id=1 is admin) under the id the token names
+    conn.execute(
+        "INSERT INTO users (user_id, username, email, role_id) VALUES (?, ?, ?, ?);",
+        (_ADMIN_USER_ID, "admin", "admin@example.com", 1),
     )
-    admin_id = cursor.lastrowid
     conn.execute(
         "INSERT INTO auth_credentials (user_id, provider_id, hashed_password) VALUES (?, ?, ?);",
-        (admin_id, 1, hashed_password),
+        (_ADMIN_USER_ID, 1, _ADMIN_HASH),
     )
     conn.commit()
-    conn.close()
 
-    # Login to get token
-    response = client.post(
-        "/auth/login",
-        data={"username": "admin", "password": "adminpass"},
-    )
-    return response.json()["access_token"]
+    return _admin_session_token
 
 
 @pytest.fixture
-def user_token(client: TestClient, test_user, test_user_credentials):
+def admin_user_id(admin_token):
+    """Create the admin user and return their user id."""
+    return _ADMIN_USER_ID
+
+
+@pytest.fixture
+def user_token(test_user):
     """Return auth token for regular test user."""
-    response = client.post(
-        "/auth/login",
-        data={
-            "username": test_user_credentials["username"],
-            "password": test_user_credentials["password"],
-        },
-    )
-    return response.json()["access_token"]
+    return create_access_token(data={"sub": str(test_user["user_id"])})
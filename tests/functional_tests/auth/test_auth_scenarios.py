@@ -2,7 +2,7 @@
 
 from datetime import timedelta
 
-from minutes_iq.auth.security import create_access_token, get_password_hash
+from minutes_iq.auth.security import create_access_token
 
 
 class TestCompleteUserJourney:
@@ -132,23 +132,23 @@ class TestConcurrentAccess:
         )
         assert me_response2.status_code == 200
 
-    def test_multiple_users_different_sessions(self, client, db_connection, clean_db):
+    def test_multiple_users_different_sessions(
+        self, client, db_connection, clean_db, cached_password_hash
+    ):
         """Test that multiple users can have active sessions simultaneously."""
         # Create two users
+        credentials = []
         for i in [1, 2]:
-            hashed_password = get_password_hash(f"password{i}")
-            cursor = db_connection.execute(
+            user_id = db_connection.execute(
                 "INSERT INTO users (username, email, role_id) VALUES (?, ?, ?) RETURNING user_id;",
                 (f"user{i}", f"user{i}@example.com", 2),
-            )
-            user_id = cursor.fetchone()[0]
-            cursor.close()  # Close cursor before next statement
-
-            cursor2 = db_connection.execute(
-                "INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active) VALUES (?, ?, ?, ?);",
-                (user_id, 1, hashed_password, 1),
-            )
-            cursor2.close()  # Close cursor before commit
+            ).fetchone()[0]
+            credentials.append((user_id, 1, cached_password_hash(f"password{i}"), 1))
+
+        db_connection.executemany(
+            "INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active) VALUES (?, ?, ?, ?);",
+            credentials,
+        )
         db_connection.commit()
 
         # Login as both users
@@ -175,10 +175,12 @@ class TestConcurrentAccess:
 class TestInactiveCredentials:
     """Test behavior with inactive credentials."""
 
-    def test_inactive_credentials_cannot_login(self, client, db_connection, clean_db):
+    def test_inactive_credentials_cannot_login(
+        self, client, db_connection, clean_db, cached_password_hash
+    ):
         """Test that users with inactive credentials cannot login."""
         # Create user with inactive credentials
-        hashed_password = get_password_hash("testpass")
+        hashed_password = cached_password_hash("testpass")
         cursor = db_connection.execute(
             "INSERT INTO users (username, email, role_id) VALUES (?, ?, ?) RETURNING user_id;",
             ("inactive_user", "inactive@example.com", 2),
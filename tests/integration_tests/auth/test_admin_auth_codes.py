@@ -8,10 +8,12 @@ Tests the admin API endpoints for:
 - Viewing usage history
 """
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 
-from minutes_iq.auth.security import create_access_token, get_password_hash
+from minutes_iq.auth.security import create_access_token
 from minutes_iq.db.auth_code_repository import AuthCodeRepository
 from minutes_iq.db.auth_code_service import AuthCodeService
 from minutes_iq.db.client import get_db_connection
@@ -21,56 +23,38 @@ from minutes_iq.main import app
 client = TestClient(app)
 
 
-@pytest.fixture
-def admin_user():
-    """Create an admin user for testing."""
+def _make_user(username: str, email: str, role_id: int, password_hash: str) -> dict:
+    """Create a user with active password credentials."""
     with get_db_connection() as conn:
-        user_repo = UserRepository(conn)
-
-        # Create admin user
-        user = user_repo.create_user(
-            username="admin", email="admin@test.com", role_id=1
+        user = UserRepository(conn).create_user(
+            username=username, email=email, role_id=role_id
         )
-
-        # Create password credentials for admin
-        hashed_password = get_password_hash("adminpassword")
-        cursor = conn.execute(
+        conn.execute(
             """
             INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active)
             VALUES (?, 1, ?, 1);
             """,
-            (user["user_id"], hashed_password),
+            (user["user_id"], password_hash),
         )
-        cursor.close()
         conn.commit()
 
         return user
 
 
 @pytest.fixture
-def regular_user():
-    """Create a regular user for testing unauthorized access."""
-    with get_db_connection() as conn:
-        user_repo = UserRepository(conn)
-
-        # Create regular user
-        user = user_repo.create_user(
-            username="regular", email="regular@test.com", role_id=2
-        )
+def admin_user(cached_password_hash):
+    """Create an admin user for testing."""
+    return _make_user(
+        "admin", "admin@test.com", 1, cached_password_hash("adminpassword")
+    )
 
-        # Create password credentials for regular user
-        hashed_password = get_password_hash("regularpassword")
-        cursor = conn.execute(
-            """
-            INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active)
-            VALUES (?, 1, ?, 1);
-            """,
-            (user["user_id"], hashed_password),
-        )
-        cursor.close()
-        conn.commit()
 
-        return user
+@pytest.fixture
+def regular_user(cached_password_hash):
+    """Create a regular user for testing unauthorized access."""
+    return _make_user(
+        "regular", "regular@test.com", 2, cached_password_hash("regularpassword")
+    )
 
 
 @pytest.fixture
@@ -85,14 +69,57 @@ def regular_token(regular_user):
     return create_access_token(data={"sub": str(regular_user["user_id"])})
 
 
+@pytest.fixture
+def admin_client(admin_token):
+    """Provide the test client with the admin's bearer token preset."""
+    client.headers["Authorization"] = f"Bearer {admin_token}"
+    yield client
+    del client.headers["Authorization"]
+
+
+@pytest.fixture
+def regular_client(regular_token):
+    """Provide the test client with the regular user's bearer token preset."""
+    client.headers["Authorization"] = f"Bearer {regular_token}"
+    yield client
+    del client.headers["Authorization"]
+
+
+@pytest.fixture
+def seed_codes(admin_user):
+    """Return a helper that inserts single-use codes with one batched INSERT."""
+
+    def seed(notes: list[str]) -> None:
+        created_at = int(time.time())
+        rows = [
+            (
+                AuthCodeService.normalize_code(AuthCodeService.generate_code()),
+                admin_user["user_id"],
+                created_at,
+                note,
+            )
+            for note in notes
+        ]
+        with get_db_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO auth_codes (code, created_by, created_at, max_uses, notes)
+                VALUES (?, ?, ?, 1, ?)
+                """,
+                rows,
+            )
+            conn.commit()
+
+    return seed
+
+
 class TestCreateAuthCode:
     """Tests for creating authorization codes."""
 
-    def test_admin_can_create_code(self, admin_token):
+    def test_admin_can_create_code(self, admin_client):
         """Test that admin can successfully create an authorization code."""
-        response = client.post(
+        response = admin_client.post(
             "/admin/auth-codes",
-            headers={"Authorization": f"Bearer {admin_token}"},
             json={"expires_in_days": 7, "max_uses": 5, "notes": "Test code"},
         )
 
@@ -106,11 +133,10 @@ class TestCreateAuthCode:
         assert data["notes"] == "Test code"
         assert data["expires_at"] is not None
 
-    def test_admin_can_create_code_with_defaults(self, admin_token):
+    def test_admin_can_create_code_with_defaults(self, admin_client):
         """Test that admin can create a code with default values."""
-        response = client.post(
+        response = admin_client.post(
             "/admin/auth-codes",
-            headers={"Authorization": f"Bearer {admin_token}"},
             json={},
         )
 
@@ -120,11 +146,10 @@ class TestCreateAuthCode:
         assert data["current_uses"] == 0
         assert data["notes"] is None
 
-    def test_admin_can_create_code_without_expiration(self, admin_token):
+    def test_admin_can_create_code_without_expiration(self, admin_client):
         """Test that admin can create a code that never expires."""
-        response = client.post(
+        response = admin_client.post(
             "/admin/auth-codes",
-            headers={"Authorization": f"Bearer {admin_token}"},
             json={"expires_in_days": None, "max_uses": 1},
         )
 
@@ -132,11 +157,10 @@ class TestCreateAuthCode:
         data = response.json()
         assert data["expires_at"] is None
 
-    def test_regular_user_cannot_create_code(self, regular_token):
+    def test_regular_user_cannot_create_code(self, regular_client):
         """Test that regular users cannot create authorization codes."""
-        response = client.post(
+        response = regular_client.post(
             "/admin/auth-codes",
-            headers={"Authorization": f"Bearer {regular_token}"},
             json={"max_uses": 1},
         )
 
@@ -155,23 +179,13 @@ class TestCreateAuthCode:
 class TestListAuthCodes:
     """Tests for listing authorization codes."""
 
-    def test_admin_can_list_active_codes(self, admin_token, admin_user):
+    def test_admin_can_list_active_codes(self, admin_client, seed_codes):
         """Test that admin can list active authorization codes."""
         # Create some test codes
-        with get_db_connection() as conn:
-            repo = AuthCodeRepository(conn)
-            service = AuthCodeService(repo)
-
-            service.create_code(
-                created_by=admin_user["user_id"], max_uses=1, notes="Active code 1"
-            )
-            service.create_code(
-                created_by=admin_user["user_id"], max_uses=1, notes="Active code 2"
-            )
+        seed_codes(["Active code 1", "Active code 2"])
 
-        response = client.get(
+        response = admin_client.get(
             "/admin/auth-codes?status_filter=active",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 200
@@ -180,7 +194,7 @@ class TestListAuthCodes:
         assert "total" in data
         assert data["total"] >= 2
 
-    def test_admin_can_filter_by_status(self, admin_token, admin_user):
+    def test_admin_can_filter_by_status(self, admin_client, admin_user):
         """Test that admin can filter codes by status."""
         # Create and revoke a code
         with get_db_connection() as conn:
@@ -193,31 +207,22 @@ class TestListAuthCodes:
             service.revoke_code(code["code_id"])
 
         # List revoked codes
-        response = client.get(
+        response = admin_client.get(
             "/admin/auth-codes?status_filter=revoked",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] >= 1
 
-    def test_admin_can_paginate_results(self, admin_token, admin_user):
+    def test_admin_can_paginate_results(self, admin_client, seed_codes):
         """Test that admin can paginate through results."""
         # Create multiple codes
-        with get_db_connection() as conn:
-            repo = AuthCodeRepository(conn)
-            service = AuthCodeService(repo)
-
-            for i in range(5):
-                service.create_code(
-                    created_by=admin_user["user_id"], max_uses=1, notes=f"Code {i}"
-                )
+        seed_codes([f"Code {i}" for i in range(5)])
 
         # Get first page
-        response1 = client.get(
+        response1 = admin_client.get(
             "/admin/auth-codes?limit=2&offset=0",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response1.status_code == 200
@@ -225,20 +230,18 @@ class TestListAuthCodes:
         assert len(data1["codes"]) <= 2
 
         # Get second page
-        response2 = client.get(
+        response2 = admin_client.get(
             "/admin/auth-codes?limit=2&offset=2",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response2.status_code == 200
         data2 = response2.json()
         assert len(data2["codes"]) <= 2
 
-    def test_regular_user_cannot_list_codes(self, regular_token):
+    def test_regular_user_cannot_list_codes(self, regular_client):
         """Test that regular users cannot list authorization codes."""
-        response = client.get(
+        response = regular_client.get(
             "/admin/auth-codes",
-            headers={"Authorization": f"Bearer {regular_token}"},
         )
 
         assert response.status_code == 403
@@ -253,7 +256,7 @@ class TestListAuthCodes:
 class TestRevokeAuthCode:
     """Tests for revoking authorization codes."""
 
-    def test_admin_can_revoke_code(self, admin_token, admin_user):
+    def test_admin_can_revoke_code(self, admin_client, admin_user):
         """Test that admin can revoke an authorization code."""
         # Create a code to revoke
         with get_db_connection() as conn:
@@ -266,9 +269,8 @@ class TestRevokeAuthCode:
             code_id = code["code_id"]
 
         # Revoke the code
-        response = client.delete(
+        response = admin_client.delete(
             f"/admin/auth-codes/{code_id}",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 200
@@ -282,17 +284,16 @@ class TestRevokeAuthCode:
             code_data = repo.get_code_by_id(code_id)
             assert code_data["is_active"] == 0
 
-    def test_revoke_nonexistent_code_returns_404(self, admin_token):
+    def test_revoke_nonexistent_code_returns_404(self, admin_client):
         """Test that revoking a nonexistent code returns 404."""
-        response = client.delete(
+        response = admin_client.delete(
             "/admin/auth-codes/99999",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_regular_user_cannot_revoke_code(self, regular_token, admin_user):
+    def test_regular_user_cannot_revoke_code(self, regular_client, admin_user):
         """Test that regular users cannot revoke authorization codes."""
         # Create a code
         with get_db_connection() as conn:
@@ -305,9 +306,8 @@ class TestRevokeAuthCode:
             code_id = code["code_id"]
 
         # Try to revoke as regular user
-        response = client.delete(
+        response = regular_client.delete(
             f"/admin/auth-codes/{code_id}",
-            headers={"Authorization": f"Bearer {regular_token}"},
         )
 
         assert response.status_code == 403
@@ -322,7 +322,7 @@ class TestRevokeAuthCode:
 class TestGetCodeUsageHistory:
     """Tests for viewing authorization code usage history."""
 
-    def test_admin_can_view_usage_history(self, admin_token, admin_user):
+    def test_admin_can_view_usage_history(self, admin_client, admin_user):
         """Test that admin can view usage history for a code."""
         # Create a code and use it for registration
         with get_db_connection() as conn:
@@ -338,7 +338,7 @@ class TestGetCodeUsageHistory:
             code_formatted = code["code_formatted"]
 
         # Register a user with the code
-        client.post(
+        admin_client.post(
             "/auth/register",
             json={
                 "username": "usagetest1",
@@ -349,9 +349,8 @@ class TestGetCodeUsageHistory:
         )
 
         # Get usage history
-        response = client.get(
+        response = admin_client.get(
             f"/admin/auth-codes/{code_id}/usage",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 200
@@ -366,7 +365,7 @@ class TestGetCodeUsageHistory:
             assert "user_id" in usage
             assert "used_at" in usage
 
-    def test_usage_history_shows_multiple_uses(self, admin_token, admin_user):
+    def test_usage_history_shows_multiple_uses(self, admin_client, admin_user):
         """Test that usage history shows all uses of a multi-use code."""
         # Create a multi-use code
         with get_db_connection() as conn:
@@ -377,31 +376,26 @@ class TestGetCodeUsageHistory:
                 created_by=admin_user["user_id"], max_uses=3, notes="Multi-use code"
             )
             code_id = code["code_id"]
-            code_formatted = code["code_formatted"]
 
-        # Register multiple users with the code
-        for i in range(2):
-            client.post(
-                "/auth/register",
-                json={
-                    "username": f"multitest{i}",
-                    "email": f"multitest{i}@example.com",
-                    "password": "securePassword123",
-                    "auth_code": code_formatted,
-                },
+            # Record two uses directly; registering through the API is
+            # covered by test_admin_can_view_usage_history
+            used_at = int(time.time())
+            conn.executemany(
+                "INSERT INTO code_usage (code_id, user_id, used_at) VALUES (?, ?, ?)",
+                [(code_id, admin_user["user_id"], used_at)] * 2,
             )
+            conn.commit()
 
         # Get usage history
-        response = client.get(
+        response = admin_client.get(
             f"/admin/auth-codes/{code_id}/usage",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["total_uses"] >= 2
 
-    def test_unused_code_has_empty_history(self, admin_token, admin_user):
+    def test_unused_code_has_empty_history(self, admin_client, admin_user):
         """Test that an unused code has empty usage history."""
         # Create a code but don't use it
         with get_db_connection() as conn:
@@ -414,9 +408,8 @@ class TestGetCodeUsageHistory:
             code_id = code["code_id"]
 
         # Get usage history
-        response = client.get(
+        response = admin_client.get(
             f"/admin/auth-codes/{code_id}/usage",
-            headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 200
@@ -424,7 +417,7 @@ class TestGetCodeUsageHistory:
         assert data["total_uses"] == 0
         assert len(data["usage_history"]) == 0
 
-    def test_regular_user_cannot_view_usage_history(self, regular_token, admin_user):
+    def test_regular_user_cannot_view_usage_history(self, regular_client, admin_user):
         """Test that regular users cannot view usage history."""
         # Create a code
         with get_db_connection() as conn:
@@ -437,9 +430,8 @@ class TestGetCodeUsageHistory:
             code_id = code["code_id"]
 
         # Try to view usage history as regular user
-        response = client.get(
+        response = regular_client.get(
             f"/admin/auth-codes/{code_id}/usage",
-            headers={"Authorization": f"Bearer {regular_token}"},
         )
 
         assert response.status_code == 403
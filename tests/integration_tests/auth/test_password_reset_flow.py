@@ -14,7 +14,7 @@ import time
 import pytest
 from fastapi.testclient import TestClient
 
-from minutes_iq.auth.security import get_password_hash, verify_password
+from minutes_iq.auth.security import verify_password
 from minutes_iq.db.client import get_db_connection
 from minutes_iq.db.password_reset_repository import (
     PasswordResetRepository,
@@ -27,7 +27,7 @@ client = TestClient(app)
 
 
 @pytest.fixture
-def test_user():
+def test_user(cached_password_hash):
     """Create a test user for password reset testing."""
     with get_db_connection() as conn:
         user_repo = UserRepository(conn)
@@ -38,7 +38,7 @@ def test_user():
         )
 
         # Create password credentials
-        hashed_password = get_password_hash("originalpassword")
+        hashed_password = cached_password_hash("originalpassword")
         cursor = conn.execute(
             """
             INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active)
@@ -269,7 +269,7 @@ class TestPasswordResetTokenSecurity:
             assert stored_token_hash != token
             assert len(stored_token_hash) == 64  # SHA-256 hex length
 
-    def test_multiple_users_can_have_concurrent_resets(self):
+    def test_multiple_users_can_have_concurrent_resets(self, cached_password_hash):
         """Test that multiple users can request resets simultaneously."""
         # Create two users
         with get_db_connection() as conn:
@@ -284,7 +284,7 @@ class TestPasswordResetTokenSecurity:
 
             # Add password credentials for both
             for user in [user1, user2]:
-                hashed = get_password_hash("password123")
+                hashed = cached_password_hash("password123")
                 conn.execute(
                     """
                     INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active)
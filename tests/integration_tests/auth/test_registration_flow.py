@@ -10,7 +10,6 @@ Tests the complete registration flow including:
 import pytest
 from fastapi.testclient import TestClient
 
-from minutes_iq.auth.security import get_password_hash
 from minutes_iq.db.auth_code_repository import AuthCodeRepository
 from minutes_iq.db.auth_code_service import AuthCodeService
 from minutes_iq.db.client import get_db_connection
@@ -21,7 +20,7 @@ client = TestClient(app)
 
 
 @pytest.fixture
-def admin_user():
+def admin_user(cached_password_hash):
     """Create an admin user for testing (needed for creating auth codes)."""
     with get_db_connection() as conn:
         user_repo = UserRepository(conn)
@@ -32,7 +31,7 @@ def admin_user():
         )
 
         # Create password credentials for admin
-        hashed_password = get_password_hash("adminpassword")
+        hashed_password = cached_password_hash("adminpassword")
         cursor = conn.execute(
             """
             INSERT INTO auth_credentials (user_id, provider_id, hashed_password, is_active)
@@ -8,6 +8,8 @@ import time
 import pytest
 from fastapi.testclient import TestClient
 
+from minutes_iq.db.scraper_repository import ScraperRepository
+
 
 @pytest.fixture
 def sample_scraper_client(db_connection, admin_token):
@@ -51,15 +53,55 @@ def sample_scraper_client(db_connection, admin_token):
         (client_id, keyword_id, timestamp, admin_id),
     )
 
+    # Jobs are created against one of the client's URLs
+    cursor = db_connection.execute(
+        """
+        INSERT INTO client_urls (client_id, alias, url, is_active, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING id
+        """,
+        (client_id, "main", "https://example.com", 1, timestamp),
+    )
+    client_url_id = cursor.fetchone()[0]
+    cursor.close()
+
     db_connection.commit()
 
     return {
         "client_id": client_id,
+        "client_url_id": client_url_id,
         "keyword_id": keyword_id,
         "admin_id": admin_id,
     }
 
 
+@pytest.fixture
+def other_users_job(db_connection, admin_user_id, test_user):
+    """Create a pending job owned by test_user rather than the admin."""
+    timestamp = int(time.time())
+    client_id = db_connection.execute(
+        """
+        INSERT INTO client (name, is_active, created_at, created_by)
+        VALUES (?, ?, ?, ?)
+        RETURNING client_id
+        """,
+        ("Other User Client", 1, timestamp, admin_user_id),
+    ).fetchone()[0]
+    client_url_id = db_connection.execute(
+        """
+        INSERT INTO client_urls (client_id, alias, url, is_active, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING id
+        """,
+        (client_id, "main", "https://example.com", 1, timestamp),
+    ).fetchone()[0]
+    db_connection.commit()
+
+    return ScraperRepository(db_connection).create_job(
+        client_url_id=client_url_id, created_by=test_user["user_id"]
+    )
+
+
 class TestJobCreationEndpoint:
     """Test POST /scraper/jobs endpoint."""
 
@@ -71,7 +113,7 @@ class TestJobCreationEndpoint:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "date_range_start": "2024-01",
                 "date_range_end": "2024-12",
                 "max_scan_pages": 10,
@@ -93,7 +135,7 @@ class TestJobCreationEndpoint:
         response = client.post(
             "/scraper/jobs",
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com/meetings"],
             },
         )
@@ -108,7 +150,7 @@ class TestJobCreationEndpoint:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com/meetings"],
             },
         )
@@ -128,7 +170,7 @@ class TestJobListingEndpoint:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -190,7 +232,7 @@ class TestJobDetailsEndpoint:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -217,6 +259,20 @@ class TestJobDetailsEndpoint:
 
         assert response.status_code == 404
 
+    def test_other_users_job_is_not_found(
+        self, client: TestClient, admin_token, other_users_job
+    ):
+        """Test that another user's job is reported as missing, not forbidden."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        for method, path in [
+            ("GET", f"/scraper/jobs/{other_users_job}/status"),
+            ("GET", f"/scraper/jobs/{other_users_job}/results"),
+            ("DELETE", f"/scraper/jobs/{other_users_job}"),
+        ]:
+            response = client.request(method, path, headers=headers)
+            assert response.status_code == 404, path
+
     def test_get_job_details_unauthenticated(self, client: TestClient):
         """Test getting job details without authentication."""
         response = client.get("/scraper/jobs/1")
@@ -235,7 +291,7 @@ class TestJobCancellationEndpoint:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -276,7 +332,7 @@ class TestJobStatusEndpoint:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -306,7 +362,7 @@ class TestResultsEndpoints:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -350,7 +406,7 @@ class TestResultsEndpoints:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -396,7 +452,7 @@ class TestResultsEndpoints:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -423,7 +479,7 @@ class TestResultsEndpoints:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -466,7 +522,7 @@ class TestResultsEndpoints:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
@@ -493,7 +549,7 @@ class TestArtifactEndpoints:
             "/scraper/jobs",
             headers={"Authorization": f"Bearer {admin_token}"},
             json={
-                "client_id": sample_scraper_client["client_id"],
+                "client_url_id": sample_scraper_client["client_url_id"],
                 "source_urls": ["https://example.com"],
             },
         )
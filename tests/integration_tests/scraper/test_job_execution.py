@@ -10,6 +10,14 @@ import pytest
 from minutes_iq.db.results_service import ResultsService
 from minutes_iq.db.scraper_repository import ScraperRepository
 from minutes_iq.db.scraper_service import ScraperService
+from minutes_iq.scraper import async_runner
+from minutes_iq.scraper.async_runner import (
+    JobCancelledException,
+    cancel_job_async,
+    check_cancellation,
+    clear_cancellation_flag,
+    run_scrape_job_async,
+)
 
 
 @pytest.fixture
@@ -27,37 +35,40 @@ def results_service(db_connection):
 
 
 @pytest.fixture
-def sample_client(db_connection, admin_token):
-    """Create a test client."""
-    # Get admin user ID
-    cursor = db_connection.execute("SELECT user_id FROM users WHERE username = 'admin'")
-    admin_id = cursor.fetchone()[0]
-    cursor.close()
+def sample_client(db_connection, admin_user_id):
+    """Create a test client with one source URL and one keyword."""
+    admin_id = admin_user_id
 
     # Create client
     timestamp = int(time.time())
-    cursor = db_connection.execute(
+    client_id = db_connection.execute(
         """
-        INSERT INTO clients (name, description, is_active, created_at, created_by)
+        INSERT INTO client (name, description, is_active, created_at, created_by)
         VALUES (?, ?, ?, ?, ?)
         RETURNING client_id
         """,
         ("Test Client", "Test Description", 1, timestamp, admin_id),
-    )
-    client_id = cursor.fetchone()[0]
-    cursor.close()
+    ).fetchone()[0]
+
+    # Jobs are created against one of the client's URLs
+    client_url_id = db_connection.execute(
+        """
+        INSERT INTO client_urls (client_id, alias, url, is_active, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING id
+        """,
+        (client_id, "main", "https://example.com", 1, timestamp),
+    ).fetchone()[0]
 
     # Create keyword
-    cursor = db_connection.execute(
+    keyword_id = db_connection.execute(
         """
         INSERT INTO keywords (keyword, is_active, created_at, created_by)
         VALUES (?, ?, ?, ?)
         RETURNING keyword_id
         """,
         ("test", 1, timestamp, admin_id),
-    )
-    keyword_id = cursor.fetchone()[0]
-    cursor.close()
+    ).fetchone()[0]
 
     # Link keyword to client
     db_connection.execute(
@@ -70,7 +81,12 @@ def sample_client(db_connection, admin_token):
 
     db_connection.commit()
 
-    return {"client_id": client_id, "keyword_id": keyword_id, "admin_id": admin_id}
+    return {
+        "client_id": client_id,
+        "client_url_id": client_url_id,
+        "keyword_id": keyword_id,
+        "admin_id": admin_id,
+    }
 
 
 class TestJobCreation:
@@ -79,7 +95,7 @@ class TestJobCreation:
     def test_create_job_with_valid_config(self, scraper_service, sample_client):
         """Test creating a job with valid configuration."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
             date_range_start="2024-01",
             date_range_end="2024-12",
@@ -94,7 +110,7 @@ class TestJobCreation:
         job = scraper_service.repository.get_job(job_id)
         assert job is not None
         assert job["status"] == "pending"
-        assert job["client_id"] == sample_client["client_id"]
+        assert job["client_url_id"] == sample_client["client_url_id"]
 
         # Verify config was created
         config = scraper_service.repository.get_job_config(job_id)
@@ -104,10 +120,72 @@ class TestJobCreation:
         assert config["include_minutes"] is True
         assert config["include_packages"] is False
 
+    def test_get_job_with_config_and_client(self, scraper_service, sample_client):
+        """Test fetching a job with its config and client name together."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+            date_range_start="2024-01",
+            max_scan_pages=5,
+        )
+
+        job = scraper_service.repository.get_job_with_config_and_client(job_id)
+        assert job["status"] == "pending"
+        assert job["client_id"] == sample_client["client_id"]
+        assert job["client_name"] == "Test Client"
+        assert job["config"]["date_range_start"] == "2024-01"
+        assert job["config"]["max_scan_pages"] == 5
+
+        assert scraper_service.repository.get_job_with_config_and_client(99999) is None
+
+    def test_get_job_with_config_and_client_without_config(
+        self, scraper_service, sample_client
+    ):
+        """Test that a job with no configuration row is still returned."""
+        job_id = scraper_service.repository.create_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+
+        job = scraper_service.repository.get_job_with_config_and_client(job_id)
+        assert job["job_id"] == job_id
+        assert job["client_name"] == "Test Client"
+        assert job["config"] is None
+
+    def test_get_job_for_user_hides_other_users_jobs(
+        self, scraper_service, sample_client
+    ):
+        """Test that a job is only returned to the user who created it."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+        repo = scraper_service.repository
+
+        assert (
+            repo.get_job_for_user(job_id, sample_client["admin_id"])["job_id"] == job_id
+        )
+        assert repo.get_job_for_user(job_id, -1) is None
+
+    def test_get_job_details_hides_other_users_jobs(
+        self, scraper_service, sample_client
+    ):
+        """Test that job details are only returned to the job's creator."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+        repo = scraper_service.repository
+
+        job = repo.get_job_details(job_id, sample_client["admin_id"])
+        assert job["job_id"] == job_id
+        assert job["client_id"] == sample_client["client_id"]
+        assert repo.get_job_details(job_id, -1) is None
+
     def test_create_job_with_minimal_config(self, scraper_service, sample_client):
         """Test creating a job with minimal configuration."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -126,7 +204,7 @@ class TestJobLifecycle:
         """Test job status transitions: pending → running → completed."""
         # Create job
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -150,10 +228,26 @@ class TestJobLifecycle:
         assert job["started_at"] is not None
         assert job["completed_at"] is not None
 
+    def test_status_change_refreshes_cached_status(
+        self, scraper_service, sample_client
+    ):
+        """Test that any status write drops the job's cached status."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+        assert scraper_service.get_cached_status(job_id)["status"] == "pending"
+
+        scraper_service.repository.update_job_status(job_id, "failed", "Cancelled")
+        assert scraper_service.get_cached_status(job_id)["status"] == "failed"
+
+        scraper_service.repository.update_job_status(job_id, "completed")
+        assert scraper_service.get_cached_status(job_id)["status"] == "completed"
+
     def test_job_failure_with_error_message(self, scraper_service, sample_client):
         """Test job failure handling."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -172,7 +266,7 @@ class TestJobCancellation:
     def test_cancel_pending_job(self, scraper_service, sample_client):
         """Test cancelling a pending job."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -185,7 +279,7 @@ class TestJobCancellation:
     def test_cancel_running_job(self, scraper_service, sample_client):
         """Test cancelling a running job."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -199,7 +293,7 @@ class TestJobCancellation:
     def test_cannot_cancel_completed_job(self, scraper_service, sample_client):
         """Test that completed jobs cannot be cancelled."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -207,6 +301,95 @@ class TestJobCancellation:
         success = scraper_service.cancel_job(job_id)
         assert success is False
 
+    def test_try_cancel_pending_job(self, scraper_service, sample_client):
+        """Test that try_cancel marks a pending job cancelled right away."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+
+        new_status = scraper_service.repository.try_cancel(
+            job_id, user_id=sample_client["admin_id"]
+        )
+        assert new_status == "cancelled"
+
+        job = scraper_service.repository.get_job(job_id)
+        assert job["status"] == "cancelled"
+        assert job["completed_at"] is not None
+
+    def test_cancel_running_job_signals_worker(self, scraper_service, sample_client):
+        """Test that a running job keeps its status and gets its flag set."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+        scraper_service.repository.update_job_status(job_id, "running")
+
+        try:
+            assert cancel_job_async(job_id, scraper_service, sample_client["admin_id"])
+
+            job = scraper_service.repository.get_job(job_id)
+            assert job["status"] == "running"
+            with pytest.raises(JobCancelledException):
+                check_cancellation(job_id)
+        finally:
+            clear_cancellation_flag(job_id)
+
+    def test_cancelled_queued_job_never_runs(
+        self, scraper_service, sample_client, monkeypatch
+    ):
+        """Test that a job cancelled while queued is not started by its worker."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+        executed = []
+        monkeypatch.setattr(
+            async_runner,
+            "_execute_with_monitoring",
+            lambda **kwargs: executed.append(kwargs["job_id"]),
+        )
+
+        assert scraper_service.repository.try_cancel(job_id) == "cancelled"
+        run_scrape_job_async(job_id, scraper_service, ["https://example.com"])
+
+        assert executed == []
+        job = scraper_service.repository.get_job(job_id)
+        assert job["status"] == "cancelled"
+        assert job["started_at"] is None
+
+    def test_claim_job_only_once(self, scraper_service, sample_client):
+        """Test that a pending job can be claimed by exactly one worker."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+
+        assert scraper_service.repository.claim_job(job_id) is True
+        assert scraper_service.repository.claim_job(job_id) is False
+        assert scraper_service.repository.get_job(job_id)["status"] == "running"
+
+    def test_try_cancel_requires_owner(self, scraper_service, sample_client):
+        """Test that try_cancel leaves other users' jobs alone."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+
+        assert scraper_service.repository.try_cancel(job_id, user_id=-1) is None
+        assert scraper_service.repository.get_job(job_id)["status"] == "pending"
+
+    def test_try_cancel_finished_job(self, scraper_service, sample_client):
+        """Test that try_cancel does not touch jobs that already finished."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+        scraper_service.repository.update_job_status(job_id, "completed")
+
+        assert scraper_service.repository.try_cancel(job_id) is None
+        assert scraper_service.repository.get_job(job_id)["status"] == "completed"
+
 
 class TestResultStorage:
     """Test storing and retrieving results."""
@@ -214,7 +397,7 @@ class TestResultStorage:
     def test_store_and_retrieve_results(self, scraper_service, sample_client):
         """Test storing results and retrieving them."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -240,7 +423,7 @@ class TestResultStorage:
     def test_store_multiple_results(self, scraper_service, sample_client):
         """Test storing multiple results for same job."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -258,6 +441,32 @@ class TestResultStorage:
         results = scraper_service.repository.get_job_results(job_id)
         assert len(results) == 3
 
+    def test_store_results_batch(self, scraper_service, sample_client):
+        """Test storing a batch of results in one call."""
+        job_id = scraper_service.create_scrape_job(
+            client_url_id=sample_client["client_url_id"],
+            created_by=sample_client["admin_id"],
+        )
+
+        saved = scraper_service.repository.save_results(
+            job_id,
+            [
+                {
+                    "pdf_filename": "batch.pdf",
+                    "page_number": i + 1,
+                    "keyword_id": sample_client["keyword_id"],
+                    "snippet": f"Snippet {i}",
+                    "entities": {"PERSON": ["John"]} if i == 0 else None,
+                }
+                for i in range(3)
+            ],
+        )
+
+        assert saved == 3
+        results = scraper_service.repository.get_job_results(job_id)
+        assert len(results) == 3
+        assert sorted(r["page_number"] for r in results) == [1, 2, 3]
+
 
 class TestCsvExport:
     """Test CSV export generation."""
@@ -267,7 +476,7 @@ class TestCsvExport:
     ):
         """Test generating CSV export."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -291,7 +500,7 @@ class TestCsvExport:
     ):
         """Test generating CSV with no results."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -305,7 +514,7 @@ class TestJobStatistics:
     def test_get_results_summary(self, scraper_service, results_service, sample_client):
         """Test getting results summary."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -330,7 +539,7 @@ class TestJobStatistics:
     ):
         """Test keyword statistics aggregation."""
         job_id = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
@@ -383,7 +592,7 @@ class TestJobListing:
         # Create 3 jobs
         for _ in range(3):
             scraper_service.create_scrape_job(
-                client_id=sample_client["client_id"],
+                client_url_id=sample_client["client_url_id"],
                 created_by=sample_client["admin_id"],
             )
 
@@ -394,12 +603,12 @@ class TestJobListing:
         """Test listing jobs filtered by status."""
         # Create jobs with different statuses
         scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
 
         job2 = scraper_service.create_scrape_job(
-            client_id=sample_client["client_id"],
+            client_url_id=sample_client["client_url_id"],
             created_by=sample_client["admin_id"],
         )
         scraper_service.repository.update_job_status(job2, "completed")
@@ -417,7 +626,7 @@ class TestJobListing:
         # Create 5 jobs
         for _ in range(5):
             scraper_service.create_scrape_job(
-                client_id=sample_client["client_id"],
+                client_url_id=sample_client["client_url_id"],
                 created_by=sample_client["admin_id"],
             )
 
@@ -439,3 +648,44 @@ class TestJobListing:
 
         # Ensure different jobs
         assert jobs_page1[0]["job_id"] != jobs_page2[0]["job_id"]
+
+    def test_list_jobs_page_returns_total(self, scraper_service, sample_client):
+        """Test that a job page carries the total across all pages."""
+        for _ in range(3):
+            scraper_service.create_scrape_job(
+                client_url_id=sample_client["client_url_id"],
+                created_by=sample_client["admin_id"],
+            )
+
+        jobs, total = scraper_service.repository.list_jobs_page(
+            user_id=sample_client["admin_id"], limit=2, offset=0
+        )
+        assert len(jobs) == 2
+        assert total == 3
+
+    def test_list_jobs_page_past_end_returns_total(
+        self, scraper_service, sample_client
+    ):
+        """Test that a page past the end still reports the filtered total."""
+        job_ids = [
+            scraper_service.create_scrape_job(
+                client_url_id=sample_client["client_url_id"],
+                created_by=sample_client["admin_id"],
+            )
+            for _ in range(3)
+        ]
+        scraper_service.repository.update_job_status(job_ids[0], "failed", "Boom")
+
+        jobs, total = scraper_service.repository.list_jobs_page(
+            user_id=sample_client["admin_id"], status="pending", limit=2, offset=10
+        )
+        assert jobs == []
+        assert total == 2
+
+    def test_list_jobs_page_empty(self, scraper_service, sample_client):
+        """Test that a first page with no matching jobs has a zero total."""
+        jobs, total = scraper_service.repository.list_jobs_page(
+            user_id=sample_client["admin_id"], limit=2, offset=0
+        )
+        assert jobs == []
+        assert total == 0
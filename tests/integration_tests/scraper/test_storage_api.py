@@ -72,7 +72,7 @@ class TestStorageCleanupAPI:
         service = ScraperService(repo)
 
         job_id = service.create_scrape_job(
-            client_id=1,
+            client_url_id=1,
             created_by=1,
             date_range_start="2024-01",
             date_range_end="2024-12",
@@ -150,7 +150,7 @@ class TestStorageCleanupAPI:
         service = ScraperService(repo)
 
         job_id = service.create_scrape_job(
-            client_id=1, created_by=1, date_range_start="2024-01"
+            client_url_id=1, created_by=1, date_range_start="2024-01"
         )
 
         # Create test files including artifacts
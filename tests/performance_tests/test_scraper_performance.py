@@ -117,7 +117,7 @@ class TestConcurrentJobExecution:
         job_ids = []
         for client in clients:
             job_id = service.create_scrape_job(
-                client_id=client["client_id"],
+                client_url_id=client["client_id"],
                 created_by=1,
                 max_scan_pages=5,
             )
@@ -201,7 +201,7 @@ class TestMemoryUsage:
 
         # Create job
         job_id = service.create_scrape_job(
-            client_id=client_id,
+            client_url_id=client_id,
             created_by=1,
         )
 
@@ -279,7 +279,7 @@ class TestCsvExportPerformance:
         db_connection.commit()
 
         # Create job and add 500 results
-        job_id = service.create_scrape_job(client_id=client_id, created_by=1)
+        job_id = service.create_scrape_job(client_url_id=client_id, created_by=1)
 
         for i in range(500):
             repository.save_result(
@@ -1,15 +1,21 @@
 """Unit tests for JWT token operations."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from fastapi import HTTPException
 from jose import JWTError, jwt
+from starlette.requests import Request
 
+from minutes_iq.auth import dependencies
+from minutes_iq.auth.dependencies import get_token_user_id
 from minutes_iq.auth.security import (
     ALGORITHM,
     SECRET_KEY,
     create_access_token,
 )
+from minutes_iq.ttl_cache import TTLCache
 
 
 class TestCreateAccessToken:
@@ -111,3 +117,62 @@ class TestCreateAccessToken:
 
         with pytest.raises(JWTError):
             jwt.decode(expired_token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = [(b"cookie", f"access_token={cookie}".encode())] if cookie else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class TestGetTokenUserId:
+    """Test extracting the user id from a request's JWT."""
+
+    def test_bearer_token(self):
+        """Test that the user id comes from an Authorization header token."""
+        token = create_access_token({"sub": "42"})
+
+        assert asyncio.run(get_token_user_id(_request(), token)) == 42
+
+    def test_cookie_token(self):
+        """Test that the HttpOnly cookie is used when there is no header."""
+        token = create_access_token({"sub": "7"})
+
+        assert asyncio.run(get_token_user_id(_request(f'"Bearer {token}"'), None)) == 7
+
+    def test_missing_token_rejected(self):
+        """Test that a request without a token is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_token_user_id(_request(), None))
+
+        assert exc_info.value.status_code == 401
+
+    def test_invalid_token_rejected(self):
+        """Test that a token that fails verification is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_token_user_id(_request(), "not-a-jwt"))
+
+        assert exc_info.value.status_code == 401
+
+    def test_verified_token_reused(self, monkeypatch):
+        """Test that a repeat request with the same token skips decoding."""
+        token = create_access_token({"sub": "5"})
+        asyncio.run(get_token_user_id(_request(), token))
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("token decoded again")
+
+        monkeypatch.setattr(dependencies.jwt, "decode", fail_decode)
+
+        assert asyncio.run(get_token_user_id(_request(), token)) == 5
+
+    def test_expired_cached_token_rejected(self, monkeypatch):
+        """Test that a cached token is re-verified once it has expired."""
+        token = create_access_token({"sub": "6"}, expires_delta=timedelta(seconds=-10))
+        cache = TTLCache(dependencies.TOKEN_CACHE_SIZE)
+        cache.set(token, 6, ttl=0)
+        monkeypatch.setattr(dependencies, "_verified_tokens", cache)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_token_user_id(_request(), token))
+
+        assert exc_info.value.status_code == 401
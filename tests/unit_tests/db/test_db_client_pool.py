@@ -0,0 +1,62 @@
+"""
+Unit tests for database connection reuse in the db client.
+"""
+
+import pytest
+
+from minutes_iq.config.settings import settings
+from minutes_iq.db import client
+from minutes_iq.db.client import close_idle_connections, get_db_connection
+
+
+@pytest.fixture
+def pool_db(tmp_path, monkeypatch):
+    """Point the client at a scratch database with an empty pool."""
+    monkeypatch.setattr(settings.database, "db_url", f"file:{tmp_path / 'pool.db'}")
+    close_idle_connections()
+    yield
+    close_idle_connections()
+
+
+class TestGetDbConnection:
+    """Tests for get_db_connection pooling."""
+
+    def test_connection_is_reused(self, pool_db):
+        """Test that a released connection is handed out again."""
+        with get_db_connection() as first:
+            pass
+        with get_db_connection() as second:
+            pass
+
+        assert second is first
+
+    def test_uncommitted_work_is_rolled_back(self, pool_db):
+        """Test that a pooled connection never carries an open transaction."""
+        with get_db_connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        with get_db_connection() as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_connection_closed_after_error(self, pool_db):
+        """Test that a connection whose block raised is not reused."""
+        with pytest.raises(RuntimeError):
+            with get_db_connection() as failed:
+                raise RuntimeError("boom")
+
+        with get_db_connection() as conn:
+            assert conn is not failed
+
+    def test_stale_connection_is_replaced(self, pool_db, monkeypatch):
+        """Test that connections idle past the timeout are not reused."""
+        monkeypatch.setattr(client, "POOL_IDLE_TIMEOUT", 0)
+
+        with get_db_connection() as first:
+            pass
+        with get_db_connection() as second:
+            pass
+
+        assert second is not first
@@ -0,0 +1,80 @@
+"""
+Unit tests for ResultsService summary caching.
+"""
+
+from minutes_iq.db import results_service
+from minutes_iq.db.results_service import ResultsService, invalidate_summary_cache
+
+
+class FakeSummaryRepository:
+    """Repository stub that counts summary aggregate queries."""
+
+    def __init__(self, status):
+        self.status = status
+        self.match_count = 1
+        self.queries = 0
+
+    def get_job(self, job_id):
+        return {
+            "job_id": job_id,
+            "status": self.status,
+            "created_at": 1,
+            "started_at": 1,
+            "completed_at": 2 if self.status == "completed" else None,
+            "error_message": None,
+        }
+
+    def get_keyword_statistics(self, job_id):
+        self.queries += 1
+        return [{"keyword": "test", "match_count": self.match_count}]
+
+    def get_unique_pdf_count(self, job_id):
+        return 1
+
+
+class TestGetResultsSummaryCache:
+    """Tests for ResultsService.get_results_summary caching."""
+
+    def test_active_summary_reused_within_ttl(self):
+        """Test that repeat polls of a running job reuse the summary."""
+        repo = FakeSummaryRepository("running")
+        service = ResultsService(repo)
+
+        service.get_results_summary(9101)
+        service.get_results_summary(9101)
+
+        assert repo.queries == 1
+
+    def test_active_summary_expires(self, monkeypatch):
+        """Test that a running job's summary is refreshed after the TTL."""
+        monkeypatch.setattr(results_service, "SUMMARY_CACHE_TTL", 0)
+        repo = FakeSummaryRepository("running")
+        service = ResultsService(repo)
+
+        service.get_results_summary(9111)
+        repo.match_count = 5
+
+        assert service.get_results_summary(9111)["total_matches"] == 5
+
+    def test_terminal_summary_expires(self, monkeypatch):
+        """Test that a finished job's summary is refreshed after its TTL."""
+        monkeypatch.setattr(results_service, "TERMINAL_SUMMARY_CACHE_TTL", 0)
+        repo = FakeSummaryRepository("completed")
+        service = ResultsService(repo)
+
+        service.get_results_summary(9131)
+        repo.match_count = 7
+
+        assert service.get_results_summary(9131)["total_matches"] == 7
+
+    def test_invalidate_forces_refresh(self):
+        """Test that invalidation drops a cached summary."""
+        repo = FakeSummaryRepository("running")
+        service = ResultsService(repo)
+
+        service.get_results_summary(9121)
+        repo.status = "completed"
+        invalidate_summary_cache(9121)
+
+        assert service.get_results_summary(9121)["status"] == "completed"
+        assert repo.queries == 2
@@ -0,0 +1,144 @@
+"""
+Unit tests for ScraperService status polling cache.
+"""
+
+import threading
+import time
+
+from minutes_iq.db import scraper_service
+from minutes_iq.db.scraper_service import ScraperService, invalidate_status_cache
+
+
+class FakeStatusRepository:
+    """Repository stub that records batched status lookups."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    def get_job_statuses(self, job_ids):
+        self.calls.append(list(job_ids))
+        return {
+            job_id: {
+                "job_id": job_id,
+                "status": self.statuses[job_id],
+                "created_by": 1,
+                "error_message": None,
+                "matches_found": 0,
+            }
+            for job_id in job_ids
+            if job_id in self.statuses
+        }
+
+
+class BlockingStatusRepository(FakeStatusRepository):
+    """Repository stub whose first status query blocks until released."""
+
+    def __init__(self, statuses):
+        super().__init__(statuses)
+        self.first_call_started = threading.Event()
+        self.release = threading.Event()
+
+    def get_job_statuses(self, job_ids):
+        if not self.first_call_started.is_set():
+            self.first_call_started.set()
+            self.release.wait(timeout=5)
+        return super().get_job_statuses(job_ids)
+
+
+def _wait_for_pending_batch(job_ids, timeout=5.0):
+    """Wait until the given job ids have joined the open status batch."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        batch = scraper_service._pending_status_batch
+        if batch is not None and batch.job_ids >= job_ids:
+            return
+        time.sleep(0.001)
+    raise AssertionError(f"jobs {job_ids} never joined a batch")
+
+
+class TestGetCachedStatus:
+    """Tests for ScraperService.get_cached_status."""
+
+    def test_polls_during_a_query_share_the_next_one(self):
+        """Test that misses arriving while a query runs are batched together."""
+        repo = BlockingStatusRepository(
+            {9001: "running", 9002: "pending", 9003: "running"}
+        )
+        service = ScraperService(repo)
+
+        first = threading.Thread(target=service.get_cached_status, args=(9001,))
+        first.start()
+        assert repo.first_call_started.wait(timeout=5)
+
+        waiting = [
+            threading.Thread(target=service.get_cached_status, args=(job_id,))
+            for job_id in (9002, 9003)
+        ]
+        for thread in waiting:
+            thread.start()
+        _wait_for_pending_batch({9002, 9003})
+
+        repo.release.set()
+        for thread in [first, *waiting]:
+            thread.join(timeout=5)
+
+        assert repo.calls == [[9001], [9002, 9003]]
+
+    def test_single_miss_queries_immediately(self, monkeypatch):
+        """Test that a lone miss does not wait for other polls."""
+        monkeypatch.setattr(scraper_service, "STATUS_BATCH_TIMEOUT", 0)
+        repo = FakeStatusRepository({9041: "running"})
+        service = ScraperService(repo)
+
+        assert service.get_cached_status(9041)["status"] == "running"
+        assert repo.calls == [[9041]]
+
+    def test_stuck_batch_falls_back_to_direct_query(self, monkeypatch):
+        """Test that a waiter whose batch never finishes queries on its own."""
+        monkeypatch.setattr(scraper_service, "STATUS_BATCH_TIMEOUT", 0.01)
+        monkeypatch.setattr(
+            scraper_service, "_pending_status_batch", scraper_service._StatusBatch()
+        )
+        repo = FakeStatusRepository({9051: "pending"})
+        service = ScraperService(repo)
+
+        assert service.get_cached_status(9051)["status"] == "pending"
+        assert repo.calls == [[9051]]
+
+    def test_repeat_poll_served_from_cache(self):
+        """Test that a second poll within the TTL does not query again."""
+        repo = FakeStatusRepository({9011: "completed"})
+        service = ScraperService(repo)
+
+        first = service.get_cached_status(9011)
+        second = service.get_cached_status(9011)
+
+        assert first == second
+        assert len(repo.calls) == 1
+
+    def test_invalidate_forces_refresh(self):
+        """Test that invalidation drops the cached entry."""
+        repo = FakeStatusRepository({9021: "pending"})
+        service = ScraperService(repo)
+
+        service.get_cached_status(9021)
+        repo.statuses[9021] = "cancelled"
+        invalidate_status_cache(9021)
+
+        assert service.get_cached_status(9021)["status"] == "cancelled"
+
+    def test_other_users_job_returns_none(self):
+        """Test that a cached status is only returned to the job's creator."""
+        repo = FakeStatusRepository({9061: "running"})
+        service = ScraperService(repo)
+
+        assert service.get_cached_status(9061, user_id=1)["status"] == "running"
+        assert service.get_cached_status(9061, user_id=2) is None
+        assert len(repo.calls) == 1
+
+    def test_missing_job_returns_none(self):
+        """Test that unknown jobs return None."""
+        service = ScraperService(FakeStatusRepository({}))
+
+        assert service.get_cached_status(9031) is None
@@ -215,6 +215,40 @@ class TestStreamAndScanPdf:
         assert pdf_content is None
         assert pages_scanned == 0
 
+    @patch("minutes_iq.scraper.core.requests.get")
+    @patch("minutes_iq.scraper.core.pdfplumber.open")
+    def test_scan_pdf_matches_case_insensitively_per_page(
+        self, mock_pdf_open, mock_get
+    ):
+        """Test that only pages containing a keyword produce matches."""
+        mock_response = Mock()
+        mock_response.content = b"fake pdf content"
+        mock_get.return_value = mock_response
+
+        mock_pages = [Mock() for _ in range(3)]
+        mock_pages[0].extract_text.return_value = "Nothing relevant here."
+        mock_pages[1].extract_text.return_value = "Approved the SOLAR Farm contract."
+        mock_pages[2].extract_text.return_value = None
+
+        mock_pdf = Mock()
+        mock_pdf.pages = mock_pages
+        mock_pdf.__enter__ = Mock(return_value=mock_pdf)
+        mock_pdf.__exit__ = Mock(return_value=False)
+
+        mock_pdf_open.return_value = mock_pdf
+
+        matches, pdf_content, pages_scanned = stream_and_scan_pdf(
+            url="https://example.com/test.pdf",
+            keywords=["solar farm", "contract", "budget"],
+        )
+
+        assert [(m["page"], m["keyword"]) for m in matches] == [
+            (2, "solar farm"),
+            (2, "contract"),
+        ]
+        assert matches[0]["snippet"].startswith("SOLAR Farm")
+        assert pages_scanned == 3
+
 
 class TestExtractEntities:
     """Test NLP entity extraction."""
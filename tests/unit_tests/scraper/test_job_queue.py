@@ -0,0 +1,62 @@
+"""
+Unit tests for the scrape job worker pool.
+"""
+
+import threading
+
+import pytest
+
+from minutes_iq.scraper import job_queue
+
+
+@pytest.fixture
+def blocking_runner(monkeypatch):
+    """Replace job execution with a runner that blocks until released."""
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fake_run_scrape_job_async(job_id, service, source_urls, storage_manager):
+        calls.append(job_id)
+        started.set()
+        release.wait(timeout=5)
+
+    monkeypatch.setattr(job_queue, "run_scrape_job_async", fake_run_scrape_job_async)
+    yield started, release, calls
+    release.set()
+    job_queue.shutdown_job_queue()
+
+
+class TestEnqueueScrapeJob:
+    """Tests for enqueue_scrape_job."""
+
+    def test_job_runs_on_worker(self, blocking_runner):
+        """Test that a queued job is executed by the pool."""
+        started, release, calls = blocking_runner
+
+        assert job_queue.enqueue_scrape_job(1001, ["https://example.com"])
+        assert started.wait(timeout=5)
+        assert calls == [1001]
+
+    def test_duplicate_submit_is_ignored(self, blocking_runner):
+        """Test that a job already queued or running is not queued again."""
+        started, release, calls = blocking_runner
+
+        assert job_queue.enqueue_scrape_job(1002, ["https://example.com"])
+        assert started.wait(timeout=5)
+        assert not job_queue.enqueue_scrape_job(1002, ["https://example.com"])
+
+        release.set()
+        job_queue.shutdown_job_queue()
+        assert calls == [1002]
+
+    def test_job_can_be_requeued_after_completion(self, blocking_runner):
+        """Test that a finished job is removed from the queue."""
+        started, release, calls = blocking_runner
+        release.set()
+
+        assert job_queue.enqueue_scrape_job(1003, ["https://example.com"])
+        job_queue.shutdown_job_queue()
+        assert job_queue.enqueue_scrape_job(1003, ["https://example.com"])
+        job_queue.shutdown_job_queue()
+        assert calls == [1003, 1003]
@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+from minutes_iq.scraper import storage
 from minutes_iq.scraper.storage import StorageManager
 
 
@@ -267,3 +268,52 @@ class TestStorageManager:
         stats = manager.get_storage_stats()
         assert stats["raw_pdfs"]["job_count"] == 2
         assert stats["raw_pdfs"]["file_count"] == 2
+
+    def test_get_storage_stats_reused_until_cleanup(self, temp_storage):
+        """Test that stats are cached briefly and refreshed after cleanup."""
+        manager = StorageManager(base_dir=temp_storage)
+        manager.ensure_job_directories(301)
+        (manager.get_raw_pdf_dir(301) / "a.pdf").write_text("data")
+
+        assert manager.get_storage_stats()["raw_pdfs"]["file_count"] == 1
+
+        # New files are not seen until the cached scan expires
+        manager.ensure_job_directories(302)
+        (manager.get_raw_pdf_dir(302) / "b.pdf").write_text("datadata")
+        assert manager.get_storage_stats()["raw_pdfs"]["file_count"] == 1
+
+        # Cleanup invalidates the cached scan
+        manager.cleanup_job(301)
+        stats = manager.get_storage_stats()
+        assert stats["raw_pdfs"]["file_count"] == 1
+        assert stats["raw_pdfs"]["size_bytes"] == 8
+
+    def test_cleanup_job_large_directory_uses_native_rm(
+        self, temp_storage, monkeypatch
+    ):
+        """Test that large job directories are still fully removed."""
+        monkeypatch.setattr(storage, "NATIVE_RMTREE_MIN_FILES", 2)
+        manager = StorageManager(base_dir=temp_storage)
+        manager.ensure_job_directories(401)
+        raw_pdf_dir = manager.get_raw_pdf_dir(401)
+        (raw_pdf_dir / "a.pdf").write_text("a")
+        (raw_pdf_dir / "b.pdf").write_text("b")
+
+        result = manager.cleanup_job(401)
+
+        assert result["raw_pdfs"] == 2
+        assert not raw_pdf_dir.exists()
+
+    def test_cleanup_job_nested_directory(self, temp_storage):
+        """Test that job directories with subdirectories are fully removed."""
+        manager = StorageManager(base_dir=temp_storage)
+        manager.ensure_job_directories(402)
+        raw_pdf_dir = manager.get_raw_pdf_dir(402)
+        (raw_pdf_dir / "a.pdf").write_text("a")
+        (raw_pdf_dir / "extra").mkdir()
+        (raw_pdf_dir / "extra" / "b.pdf").write_text("b")
+
+        result = manager.cleanup_job(402)
+
+        assert result["raw_pdfs"] == 1
+        assert not raw_pdf_dir.exists()
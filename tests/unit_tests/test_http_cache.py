@@ -0,0 +1,91 @@
+"""
+Unit tests for HTTP caching helpers.
+"""
+
+from starlette.requests import Request
+
+from minutes_iq.http_cache import (
+    content_etag,
+    etag_matches,
+    job_cache_headers,
+    job_etag,
+    not_modified_response,
+)
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw_headers = [
+        (key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+COMPLETED_JOB = {"job_id": 7, "status": "completed", "completed_at": 1700000000}
+RUNNING_JOB = {"job_id": 8, "status": "running", "completed_at": None}
+
+
+class TestJobEtag:
+    """Tests for job_etag and job_cache_headers."""
+
+    def test_terminal_job_has_etag(self):
+        """Test that finished jobs get a stable weak ETag."""
+        assert job_etag(COMPLETED_JOB) == 'W/"job-7-completed-1700000000"'
+
+    def test_running_job_has_no_etag(self):
+        """Test that active jobs are not given an ETag."""
+        assert job_etag(RUNNING_JOB) is None
+        assert "ETag" not in job_cache_headers(RUNNING_JOB)
+
+    def test_terminal_job_cached_longer(self):
+        """Test Cache-Control differs for terminal and active jobs."""
+        assert "max-age=3600" in job_cache_headers(COMPLETED_JOB)["Cache-Control"]
+        assert "max-age=1" in job_cache_headers(RUNNING_JOB)["Cache-Control"]
+
+
+class TestNotModifiedResponse:
+    """Tests for not_modified_response."""
+
+    def test_matching_etag_returns_304(self):
+        """Test that a matching If-None-Match short-circuits with 304."""
+        request = _request({"If-None-Match": job_etag(COMPLETED_JOB)})
+
+        response = not_modified_response(request, COMPLETED_JOB)
+
+        assert response is not None
+        assert response.status_code == 304
+
+    def test_stale_etag_returns_none(self):
+        """Test that a different ETag does not short-circuit."""
+        request = _request({"If-None-Match": 'W/"job-7-running-None"'})
+
+        assert not_modified_response(request, COMPLETED_JOB) is None
+
+    def test_running_job_never_not_modified(self):
+        """Test that active jobs are always served in full."""
+        request = _request({"If-None-Match": "*"})
+
+        assert not_modified_response(request, RUNNING_JOB) is None
+
+
+class TestContentEtag:
+    """Tests for content_etag and etag_matches."""
+
+    def test_etag_follows_content(self):
+        """Test that equal inputs share an ETag and changed inputs do not."""
+        client = {"client_id": 1, "name": "JEA", "updated_at": 10}
+
+        assert content_etag("clients/detail.html", client) == content_etag(
+            "clients/detail.html", dict(client)
+        )
+        assert content_etag("clients/detail.html", client) != content_etag(
+            "clients/detail.html", {**client, "updated_at": 11}
+        )
+
+    def test_etag_matches_any_listed_tag(self):
+        """Test If-None-Match lists and wildcards."""
+        etag = content_etag("page")
+
+        assert etag_matches(_request({"If-None-Match": f'W/"other", {etag}'}), etag)
+        assert etag_matches(_request({"If-None-Match": "*"}), etag)
+        assert not etag_matches(_request({"If-None-Match": 'W/"other"'}), etag)
+        assert not etag_matches(_request(), etag)
@@ -0,0 +1,97 @@
+"""
+Unit tests for template response helpers.
+"""
+
+import pytest
+from starlette.requests import Request
+
+from minutes_iq import templates_config
+from minutes_iq.templates_config import shell_template_response
+from minutes_iq.ttl_cache import TTLCache
+
+
+def _request(path: str, headers: dict[str, str] | None = None) -> Request:
+    raw_headers = [
+        (key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+    ]
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "root_path": "",
+            "path": path,
+            "query_string": b"",
+            "headers": raw_headers,
+        }
+    )
+
+
+class CountingTemplate:
+    """Template stub that counts renders."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def render(self, context):
+        self.renders += 1
+        return f"<p>{context['request'].url.path}</p>"
+
+
+@pytest.fixture
+def counting_template(monkeypatch):
+    """Serve every template name from a render-counting stub."""
+    template = CountingTemplate()
+    monkeypatch.setattr(templates_config.templates, "get_template", lambda _: template)
+    monkeypatch.setattr(
+        templates_config,
+        "_shell_pages",
+        TTLCache(templates_config.SHELL_PAGE_CACHE_SIZE),
+    )
+    return template
+
+
+class TestShellTemplateResponse:
+    """Tests for shell_template_response."""
+
+    def test_rendered_once_per_url(self, counting_template):
+        """Test that repeat requests reuse the rendered body."""
+        first = shell_template_response(_request("/clients"), "clients/list.html")
+        second = shell_template_response(_request("/clients"), "clients/list.html")
+        other = shell_template_response(_request("/other"), "clients/list.html")
+
+        assert first.body == second.body == b"<p>/clients</p>"
+        assert other.body == b"<p>/other</p>"
+        assert counting_template.renders == 2
+
+    def test_matching_etag_returns_304(self, counting_template):
+        """Test that a current client copy is answered without a body."""
+        first = shell_template_response(_request("/clients"), "clients/list.html")
+
+        response = shell_template_response(
+            _request("/clients", {"If-None-Match": first.headers["etag"]}),
+            "clients/list.html",
+        )
+
+        assert response.status_code == 304
+        assert counting_template.renders == 1
+
+    def test_rendered_once_per_context(self, counting_template):
+        """Test that each distinct context gets its own cached body."""
+        alice = {"current_user": {"user_id": 1, "username": "alice"}}
+        bob = {"current_user": {"user_id": 2, "username": "bob"}}
+
+        first = shell_template_response(
+            _request("/profile"), "profile/profile.html", alice
+        )
+        again = shell_template_response(
+            _request("/profile"), "profile/profile.html", alice
+        )
+        other = shell_template_response(
+            _request("/profile"), "profile/profile.html", bob
+        )
+
+        assert first.headers["etag"] == again.headers["etag"]
+        assert other.headers["etag"] != first.headers["etag"]
+        assert counting_template.renders == 2
@@ -0,0 +1,53 @@
+"""
+Unit tests for the bounded TTL cache.
+"""
+
+from minutes_iq.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned until it expires."""
+        cache: TTLCache[str, int] = TTLCache(4)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") == 2
+        assert cache.get("missing") is None
+
+    def test_expired_entry_dropped(self):
+        """Test that an expired entry is not returned."""
+        cache: TTLCache[str, int] = TTLCache(4)
+        cache.set("a", 1, ttl=0)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_full_cache_evicts_least_recently_stored(self):
+        """Test that storing into a full cache drops the oldest entry."""
+        cache: TTLCache[str, int] = TTLCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 3
+        assert cache.get("c") == 4
+
+    def test_pop_and_clear(self):
+        """Test that entries can be dropped one at a time or all at once."""
+        cache: TTLCache[str, int] = TTLCache(4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0